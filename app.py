@@ -10,7 +10,7 @@ import pandas as pd
 import numpy as np
 from model import (
     default_uhs_data, default_valuation_multiples,
-    calculate_sotp, run_all_scenarios, sensitivity_analysis,
+    calculate_sotp, run_all_scenarios, sensitivity_analysis, sotp_sensitivity,
     CONFIDENTIALITY_NOTICE
 )
 
@@ -612,22 +612,39 @@ with tab5:
 
     st.markdown("**Key Drivers:** Behavioral Health and Acute Care multiples have the largest impact on valuation.")
 
-    # Simple sensitivity table
-    sensitivity_data = []
+    # Simple sensitivity table (sliders' multiples are left untouched)
     behavioral_mults = [9.0, 10.0, 10.5, 11.0, 12.0]
+    behavioral_cube = sotp_sensitivity(data, multiples, "base", behavioral_multiple=behavioral_mults)
 
-    for mult in behavioral_mults:
-        temp_multiples = multiples.copy()
-        temp_multiples["behavioral"]["base"] = mult
-        result = calculate_sotp(data, temp_multiples, "base")
+    sensitivity_data = pd.DataFrame({
+        "Behavioral Multiple": [f"{mult:.1f}x" for mult in behavioral_mults],
+        "Value per Share": [f"${v:.2f}" for v in behavioral_cube["value_per_share"]],
+        "Upside": [f"{u:.1%}" for u in behavioral_cube["implied_upside_pct"]],
+    })
 
-        sensitivity_data.append({
-            "Behavioral Multiple": f"{mult:.1f}x",
-            "Value per Share": f"${result['metrics']['SOTP Value per Share']:.2f}",
-            "Upside": f"{result['metrics']['Implied Upside (%)']:.1%}"
-        })
+    st.dataframe(sensitivity_data, use_container_width=True)
+
+    # Two-way grid: behavioral multiple vs a second driver, evaluated in one pass
+    st.subheader("Two-Way Sensitivity Grid")
+
+    grid_axes = {
+        "Acute Care Multiple": ("acute_multiple", np.arange(5.0, 10.01, 0.25), "{:.2f}x"),
+        "RE Cap Rate": ("cap_rate", np.arange(0.050, 0.0801, 0.0025), "{:.2%}"),
+        "RE $/SqFt": ("sqft_value", np.arange(200, 601, 25), "${:.0f}"),
+    }
+    grid_choice = st.radio("Columns", list(grid_axes), horizontal=True)
+    column_axis, column_values, column_format = grid_axes[grid_choice]
+
+    grid_cube = sotp_sensitivity(
+        data, multiples, "base",
+        behavioral_multiple=np.arange(8.0, 14.01, 0.25),
+        **{column_axis: column_values},
+    )
+    grid = grid_cube.pivot("value_per_share", "behavioral_multiple", column_axis)
+    grid.index = [f"{v:.2f}x" for v in grid.index]
+    grid.columns = [column_format.format(v) for v in grid.columns]
 
-    st.dataframe(pd.DataFrame(sensitivity_data), use_container_width=True)
+    st.dataframe(grid.style.format("${:.0f}"), use_container_width=True)
 
 # ----- TAB 6: DETAILED TABLES -----
 with tab6:
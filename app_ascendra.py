@@ -11,10 +11,23 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 from PIL import Image
-import os
 import yfinance as yf
 from datetime import datetime
 
+from dcf_valuation_model import (
+    load_financial_data, default_dcf_assumptions, cached_fcf, reprice_dcf
+)
+from sotp_valuation_model_v3_corrected import load_10k_data, normalize_ebitda_for_sotp
+from tornado_analysis import (
+    sotp_tornado, dcf_tornado, default_sotp_tornado_base, dcf_tornado_base, percentage_bounds
+)
+from components.tornado import create_tornado_chart
+from components.gauges import create_synergy_confidence_gauge
+from components.football_field import create_football_field_figure
+from football_field_chart import (
+    load_all_valuations, calculate_weighted_average, create_summary_table, render_football_field
+)
+
 # ==========================================
 # PAGE CONFIG
 # ==========================================
@@ -381,6 +394,13 @@ st.sidebar.markdown("**🔒 Classification:** Highly Confidential")
 # LOAD ALL DATA
 # ==========================================
 
+@st.cache_data
+def load_football_field():
+    """Valuation ranges and blended P10/P50/P90 from the live model runs"""
+    valuations_df = load_all_valuations()
+    weighted_avg = calculate_weighted_average(valuations_df)
+    return valuations_df, weighted_avg
+
 @st.cache_data
 def load_all_data():
     """Load all CSV data files"""
@@ -415,9 +435,6 @@ def load_all_data():
     data['debt_maturity'] = load_csv_safe('data/graphs/debt_maturity_schedule.csv')
     data['equity_structure'] = load_csv_safe('data/graphs/equity_capital_structure.csv')
 
-    # Football Field
-    data['football_field'] = load_csv_safe('data/graphs/football_field_summary.csv')
-
     # Acquisition Analysis
     data['acquisition_premiums'] = load_csv_safe('data/graphs/acquisition_premium_analysis.csv')
 
@@ -503,23 +520,17 @@ if page == "📊 Executive Summary":
     st.markdown("### 📊 All Valuation Methods")
     st.markdown("Weighted average across 5 independent methodologies")
 
-    if not data['football_field'].empty:
-        ff_display = data['football_field'].copy()
-        st.dataframe(
-            ff_display.style.format({
-                'Low ($)': '${:,.0f}',
-                'Base ($)': '${:,.0f}',
-                'High ($)': '${:,.0f}',
-                'Weight (%)': '{:.0f}%'
-            }),
-            use_container_width=True,
-            height=300
-        )
+    # Table and chart both come from the live model runs
+    ff_valuations, ff_weighted = load_football_field()
+    st.dataframe(
+        create_summary_table(ff_valuations, ff_weighted),
+        use_container_width=True,
+        height=300
+    )
 
-    # Display football field chart if exists
-    if os.path.exists('data/graphs/football_field_valuation.png'):
-        st.markdown("### 🎯 Football Field Valuation Chart")
-        st.image('data/graphs/football_field_valuation.png', use_column_width=True)
+    # Football field chart (interactive)
+    st.markdown("### 🎯 Football Field Valuation Chart")
+    st.plotly_chart(create_football_field_figure(ff_valuations, ff_weighted), use_container_width=True)
 
     st.markdown("---")
 
@@ -879,6 +890,30 @@ elif page == "📈 DCF Analysis":
         - Even conservative assumptions (10% WACC, 2% growth) = $361 (73% upside)
         """)
 
+    # Live repricing: the FCF stream is cached, sliders only re-discount it
+    st.markdown("#### 🎚️ Live Repricing")
+
+    dcf_financials = load_financial_data()
+    dcf_fcf = cached_fcf(dcf_financials, default_dcf_assumptions())
+
+    col1, col2 = st.columns(2)
+    with col1:
+        live_wacc = st.slider("WACC (%)", 7.0, 12.0, 8.5, 0.1) / 100
+    with col2:
+        live_growth = st.slider("Terminal Growth (%)", 1.0, 3.5, 2.5, 0.1) / 100
+
+    live = reprice_dcf(dcf_fcf, live_wacc, live_growth,
+                       dcf_financials['net_debt'], dcf_financials['shares_outstanding'])
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Value per Share", f"${float(live['value_per_share']):.0f}")
+    with col2:
+        st.metric("Enterprise Value", f"${float(live['enterprise_value'])/1000:.1f}B")
+    with col3:
+        st.metric("Terminal Value % of EV",
+                  f"{float(live['pv_terminal_value'] / live['enterprise_value']) * 100:.0f}%")
+
     st.markdown("---")
 
     # PV Analysis
@@ -1062,9 +1097,9 @@ elif page == "🚀 Synergies":
 
         with col2:
             st.metric(
-                "Synergy Value (10x)",
-                f"${clean_currency(syn_sum['synergy_value_at_10x'])/1000:.1f}B",
-                delta="PV of Savings"
+                "Synergy Value (Time-Phased)",
+                f"${clean_currency(syn_sum['synergy_value_time_phased'])/1000:.1f}B",
+                delta=f"Flat 10x: ${clean_currency(syn_sum['undiscounted_run_rate_value'])/1000:.1f}B"
             )
 
         with col3:
@@ -1083,6 +1118,22 @@ elif page == "🚀 Synergies":
                 delta="Margin Improvement"
             )
 
+        # Monte Carlo realization (hill_valley_synergies_model.synergy_monte_carlo)
+        if 'synergy_confidence_pct' in syn_sum:
+            col_gauge, col_range = st.columns([1, 1])
+
+            with col_gauge:
+                st.plotly_chart(create_synergy_confidence_gauge(float(syn_sum['synergy_confidence_pct'])),
+                                use_container_width=True)
+
+            with col_range:
+                st.markdown("#### 🎲 Synergy Value Per Share (Monte Carlo)")
+                st.metric("P10 (Downside)", f"${float(syn_sum['synergy_value_per_share_p10']):.0f}")
+                st.metric("P50 (Median)", f"${float(syn_sum['synergy_value_per_share_p50']):.0f}")
+                st.metric("P90 (Upside)", f"${float(syn_sum['synergy_value_per_share_p90']):.0f}")
+                st.caption("Confidence = probability that Year 3 run-rate savings reach 80% of plan, "
+                           "across simulated realization, timing slippage and cost overruns.")
+
     st.markdown("---")
 
     # Synergies Breakdown
@@ -1383,10 +1434,11 @@ elif page == "🎯 Sensitivity Analysis":
     st.markdown("---")
 
     # Tabs for different sensitivities
-    sens_tab1, sens_tab2, sens_tab3 = st.tabs([
+    sens_tab1, sens_tab2, sens_tab3, sens_tab4 = st.tabs([
         "📊 SOTP Sensitivity",
         "📈 DCF Sensitivity",
-        "💰 LBO Sensitivity"
+        "💰 LBO Sensitivity",
+        "🌪️ Tornado"
     ])
 
     with sens_tab1:
@@ -1481,6 +1533,50 @@ elif page == "🎯 Sensitivity Analysis":
         - Recommend offer $333-375 range for target returns
         """)
 
+    with sens_tab4:
+        st.markdown("### Tornado: Which Driver Moves Value Most?")
+        st.markdown("Each input is pushed to its low and high bound with all others at base; "
+                    "every case is evaluated in one batched model run.")
+
+        bound_mode = st.radio(
+            "Bounds",
+            ["Model default ranges", "Uniform ± % of base"],
+            horizontal=True,
+            key="tornado_bounds"
+        )
+        bound_pct = None
+        if bound_mode == "Uniform ± % of base":
+            bound_pct = st.slider("Perturbation (± %)", min_value=1, max_value=30, value=10, step=1,
+                                  key="tornado_pct") / 100
+
+        sotp_normalized = normalize_ebitda_for_sotp(load_10k_data())
+        sotp_base = default_sotp_tornado_base()
+        dcf_financials = load_financial_data()
+        dcf_base = dcf_tornado_base(dcf_financials)
+
+        sotp_result = sotp_tornado(
+            sotp_normalized, base=sotp_base,
+            bounds=percentage_bounds(sotp_base, bound_pct) if bound_pct else None
+        )
+        dcf_result = dcf_tornado(
+            dcf_financials,
+            bounds=percentage_bounds(dcf_base, bound_pct) if bound_pct else None
+        )
+
+        col_left, col_right = st.columns(2)
+
+        with col_left:
+            st.plotly_chart(create_tornado_chart(sotp_result, "SOTP (v3) Value per Share"),
+                            use_container_width=True)
+
+        with col_right:
+            st.plotly_chart(create_tornado_chart(dcf_result, "DCF Value per Share"),
+                            use_container_width=True)
+
+        with st.expander("Swing tables"):
+            st.dataframe(sotp_result['table'].round(4), use_container_width=True)
+            st.dataframe(dcf_result['table'].round(4), use_container_width=True)
+
     st.markdown("---")
 
     # Downside Protection
@@ -2196,27 +2292,32 @@ elif page == "📁 Data Explorer":
     elif data_category == "Football Field Summary":
         st.markdown("### 🎯 Football Field Valuation Summary")
 
-        if not data['football_field'].empty:
-            st.dataframe(data['football_field'], use_container_width=True)
-            csv = data['football_field'].to_csv(index=False)
-            st.download_button(
-                "📥 Download Football Field CSV",
-                csv,
-                "football_field_summary.csv",
-                "text/csv"
-            )
+        ff_valuations, ff_weighted = load_football_field()
+        ff_summary = create_summary_table(ff_valuations, ff_weighted)
+        st.dataframe(ff_summary, use_container_width=True)
+        st.download_button(
+            "📥 Download Football Field CSV",
+            ff_summary.to_csv(index=False),
+            "football_field_summary.csv",
+            "text/csv"
+        )
 
-        if os.path.exists('data/graphs/football_field_valuation.png'):
-            st.markdown("### 📊 Football Field Chart")
-            st.image('data/graphs/football_field_valuation.png', use_column_width=True)
+        st.markdown("### 📊 Football Field Chart")
+        ff_png = render_football_field(ff_valuations, ff_weighted)
+        st.image(ff_png, use_column_width=True)
 
-            with open('data/graphs/football_field_valuation.png', 'rb') as file:
-                st.download_button(
-                    "📥 Download Football Field Chart (PNG)",
-                    file,
-                    "football_field_valuation.png",
-                    "image/png"
-                )
+        st.download_button(
+            "📥 Download Football Field Chart (PNG)",
+            ff_png,
+            "football_field_valuation.png",
+            "image/png"
+        )
+        st.download_button(
+            "📥 Download Football Field Chart (SVG)",
+            render_football_field(ff_valuations, ff_weighted, fmt='svg'),
+            "football_field_valuation.svg",
+            "image/svg+xml"
+        )
 
 # ==========================================
 # FOOTER
@@ -18,6 +18,8 @@ import plotly.express as px
 from datetime import datetime
 import yfinance as yf
 
+from sotp_kernel import default_sotp_capital_structure, four_part_sotp
+
 # ==========================================
 # PAGE CONFIG
 # ==========================================
@@ -109,33 +111,23 @@ def calculate_sotp(
     acute_propco_noi, acute_cap_rate,
     net_debt, shares
 ):
-    """Calculate SOTP valuation with given assumptions"""
-
-    # OpCo Values
-    beh_opco_value = beh_opco_ebitda * beh_opco_multiple
-    acute_opco_value = acute_opco_ebitda * acute_opco_multiple
-
-    # PropCo Values
-    beh_propco_value = beh_propco_noi / (beh_cap_rate / 100)
-    acute_propco_value = acute_propco_noi / (acute_cap_rate / 100)
-
-    # Total EV
-    enterprise_value = beh_opco_value + beh_propco_value + acute_opco_value + acute_propco_value
+    """Calculate SOTP valuation with given assumptions (cap rates in %, inputs may be arrays)"""
 
-    # Equity Value
-    equity_value = enterprise_value - net_debt
-
-    # Per Share
-    value_per_share = equity_value / shares
+    sotp = four_part_sotp(
+        beh_opco_ebitda, beh_opco_multiple, beh_propco_noi,
+        acute_opco_ebitda, acute_opco_multiple, acute_propco_noi,
+        np.asarray(beh_cap_rate) / 100, net_debt, shares,
+        acute_cap_rate=np.asarray(acute_cap_rate) / 100,
+    )
 
     return {
-        'beh_opco_value': beh_opco_value,
-        'beh_propco_value': beh_propco_value,
-        'acute_opco_value': acute_opco_value,
-        'acute_propco_value': acute_propco_value,
-        'enterprise_value': enterprise_value,
-        'equity_value': equity_value,
-        'value_per_share': value_per_share
+        'beh_opco_value': sotp['opco_values']['behavioral'],
+        'beh_propco_value': sotp['propco_values']['behavioral'],
+        'acute_opco_value': sotp['opco_values']['acute'],
+        'acute_propco_value': sotp['propco_values']['acute'],
+        'enterprise_value': sotp['enterprise_value'],
+        'equity_value': sotp['equity_value'],
+        'value_per_share': sotp['value_per_share']
     }
 
 def create_waterfall_chart(sotp_result):
@@ -198,33 +190,30 @@ def create_sensitivity_heatmap(
     param_2_name, param_2_range,
     param_type='opco'  # 'opco' or 'propco'
 ):
-    """Create sensitivity heatmap for SOTP"""
-
-    results = []
-
-    for p1 in param_1_range:
-        row = []
-        for p2 in param_2_range:
-            if param_type == 'opco':
-                # OpCo multiple sensitivity
-                sotp = calculate_sotp(
-                    base_beh_ebitda, p1,  # Behavioral multiple
-                    base_beh_noi, 6.0,
-                    base_acute_ebitda, p2,  # Acute multiple
-                    base_acute_noi, 6.0,
-                    net_debt, shares
-                )
-            else:
-                # PropCo cap rate sensitivity
-                sotp = calculate_sotp(
-                    base_beh_ebitda, 10.0,
-                    base_beh_noi, p1,  # Behavioral cap rate
-                    base_acute_ebitda, 7.0,
-                    base_acute_noi, p2,  # Acute cap rate
-                    net_debt, shares
-                )
-            row.append(sotp['value_per_share'])
-        results.append(row)
+    """Create sensitivity heatmap for SOTP (whole grid in one broadcast call)"""
+
+    p1 = np.asarray(param_1_range, dtype=float)[:, None]
+    p2 = np.asarray(param_2_range, dtype=float)[None, :]
+
+    if param_type == 'opco':
+        # OpCo multiple sensitivity: behavioral (rows) x acute (columns)
+        sotp = calculate_sotp(
+            base_beh_ebitda, p1,
+            base_beh_noi, 6.0,
+            base_acute_ebitda, p2,
+            base_acute_noi, 6.0,
+            net_debt, shares
+        )
+    else:
+        # PropCo cap rate sensitivity: behavioral (rows) x acute (columns)
+        sotp = calculate_sotp(
+            base_beh_ebitda, 10.0,
+            base_beh_noi, p1,
+            base_acute_ebitda, 7.0,
+            base_acute_noi, p2,
+            net_debt, shares
+        )
+    results = sotp['value_per_share'].tolist()
 
     fig = go.Figure(data=go.Heatmap(
         z=results,
@@ -379,12 +368,14 @@ if page == "🎯 Interactive SOTP":
 
         # Expander for Capital Structure
         with st.expander("💰 **CAPITAL STRUCTURE**", expanded=False):
+            capital = default_sotp_capital_structure()
+
             net_debt = st.number_input(
                 "Net Debt ($M)",
-                min_value=3000,
-                max_value=6000,
-                value=4379,
-                step=100,
+                min_value=3000.0,
+                max_value=6000.0,
+                value=capital['net_debt'],
+                step=100.0,
                 key="net_debt"
             )
 
@@ -392,7 +383,7 @@ if page == "🎯 Interactive SOTP":
                 "Shares Outstanding (M)",
                 min_value=50.0,
                 max_value=80.0,
-                value=63.64,
+                value=capital['shares_outstanding'],
                 step=0.1,
                 key="shares"
             )
@@ -620,8 +611,9 @@ elif page == "⚡ Quick Scenario Comparison":
     beh_noi = 685
     acute_ebitda = 796
     acute_noi = 512
-    net_debt = 4379
-    shares = 63.64
+    capital = default_sotp_capital_structure()
+    net_debt = capital['net_debt']
+    shares = capital['shares_outstanding']
     current_price = 225.30
 
     # Calculate all scenarios
@@ -0,0 +1,65 @@
+"""
+Football Field Chart Components using Plotly
+Interactive variant of the valuation football field (see football_field_chart.py)
+"""
+
+import plotly.graph_objects as go
+
+from football_field_chart import FOOTBALL_FIELD_COLORS, RECOMMENDED_OFFER_RANGE, football_field_rows
+
+
+def create_football_field_figure(valuations_df, weighted_avg, current_price=225.30,
+                                 offer_range=RECOMMENDED_OFFER_RANGE):
+    """
+    Create horizontal low-high range bars per valuation method
+    Weighted average (P10-P90 band) at the bottom; diamonds mark base values
+    """
+    rows = football_field_rows(valuations_df, weighted_avg)
+    colors = [FOOTBALL_FIELD_COLORS.get(method, '#778da9') for method in rows['method']]
+    highlight = (rows['method'] == 'WEIGHTED AVERAGE').values
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        y=rows['method'],
+        x=rows['high'] - rows['low'],
+        base=rows['low'],
+        orientation='h',
+        name='Range',
+        marker=dict(color=colors, opacity=0.8, line=dict(color='white', width=[3 if h else 1.5 for h in highlight])),
+        width=[0.8 if h else 0.6 for h in highlight],
+        customdata=rows[['low', 'base', 'high']].values,
+        hovertemplate="%{y}<br>Low: $%{customdata[0]:,.0f}<br>Base: $%{customdata[1]:,.0f}"
+                      "<br>High: $%{customdata[2]:,.0f}<extra></extra>",
+    ))
+
+    fig.add_trace(go.Scatter(
+        y=rows['method'],
+        x=rows['base'],
+        mode='markers+text',
+        name='Base',
+        marker=dict(symbol='diamond', size=12, color='white', line=dict(color=colors, width=2)),
+        text=[f"${base:,.0f}" for base in rows['base']],
+        textposition='top center',
+        textfont=dict(color='white'),
+        hoverinfo='skip',
+    ))
+
+    fig.add_vrect(x0=offer_range[0], x1=offer_range[1], fillcolor='#06ffa5', opacity=0.15, line_width=0,
+                  annotation_text=f"Offer ${offer_range[0]:,.0f}-{offer_range[1]:,.0f}",
+                  annotation_position="top", annotation_font_color='#06ffa5')
+    fig.add_vline(x=current_price, line_dash="dash", line_color="#d62828", line_width=3,
+                  annotation_text=f"Current ${current_price:,.2f}", annotation_position="bottom")
+
+    fig.update_layout(
+        title="Valuation Football Field",
+        xaxis_title="Equity Value per Share ($)",
+        xaxis=dict(range=[150, 600], gridcolor='rgba(119,141,169,0.3)'),
+        height=max(400, 70 * len(rows) + 150),
+        showlegend=False,
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='white'),
+    )
+
+    return fig
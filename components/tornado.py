@@ -0,0 +1,60 @@
+"""
+Tornado Chart Components using Plotly
+For SOTP and DCF driver rankings (see tornado_analysis.py)
+"""
+
+import plotly.graph_objects as go
+
+
+def create_tornado_chart(tornado_result, title="Tornado Analysis", value_label="$/Share", max_drivers=None):
+    """
+    Create horizontal swing bars from a tornado_analysis() result
+    Largest swing on top; bars are drawn relative to the base value
+    """
+    table = tornado_result['table']
+    if max_drivers:
+        table = table.head(max_drivers)
+    table = table.iloc[::-1]  # Plotly draws the first category at the bottom
+
+    base_value = tornado_result['base_value']
+    labels = table['driver'].str.replace('_', ' ').str.title()
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        y=labels,
+        x=table['low_value'] - base_value,
+        base=base_value,
+        orientation='h',
+        name='Low Input',
+        marker_color='#f72585',
+        customdata=table[['low_input', 'low_value']].values,
+        hovertemplate="%{y}<br>Input: %{customdata[0]:,.4g}<br>Value: $%{customdata[1]:,.2f}<extra>Low</extra>",
+    ))
+
+    fig.add_trace(go.Bar(
+        y=labels,
+        x=table['high_value'] - base_value,
+        base=base_value,
+        orientation='h',
+        name='High Input',
+        marker_color='#06ffa5',
+        customdata=table[['high_input', 'high_value']].values,
+        hovertemplate="%{y}<br>Input: %{customdata[0]:,.4g}<br>Value: $%{customdata[1]:,.2f}<extra>High</extra>",
+    ))
+
+    fig.add_vline(x=base_value, line_dash="dash", line_color="#4cc9f0",
+                  annotation_text=f"Base ${base_value:,.0f}", annotation_position="top")
+
+    fig.update_layout(
+        title=title,
+        barmode='overlay',
+        xaxis_title=value_label,
+        height=max(350, 28 * len(table) + 150),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='white'),
+        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1),
+    )
+
+    return fig
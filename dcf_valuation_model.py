@@ -10,6 +10,10 @@ Date: October 29, 2025
 import pandas as pd
 import numpy as np
 import json
+from functools import lru_cache
+from scipy.special import ndtr
+
+from utils.streaming_stats import StreamingHistogram
 
 # ============================================================================
 # STEP 1: LOAD BASE FINANCIAL DATA
@@ -57,6 +61,31 @@ def load_financial_data():
 
     return financials
 
+# ============================================================================
+# STEP 1B: BASE CASE ASSUMPTIONS
+# ============================================================================
+
+def default_dcf_assumptions():
+    """Base case DCF assumptions (see DCF_ASSUMPTIONS_SOURCED.md)"""
+
+    return {
+        'revenue_growth': {
+            'years_1_3': 0.05,   # 5% growth (near-term)
+            'years_4_5': 0.04,   # 4% growth (mid-term)
+            'years_6_10': 0.03,  # 3% growth (long-term, GDP+)
+        },
+        'ebitda_margin_target': 0.19,  # Target 19% (from 17.5% today, modest expansion)
+        'tax_rate': 0.21,  # 21% federal corporate tax
+        'capex_pct': 0.04,  # 4% of revenue (maintenance CapEx)
+        'depreciation_pct': 0.037,  # 3.7% of revenue (historical)
+        'nwc_change_pct': 0.01,  # 1% of revenue growth (working capital increase)
+        'terminal_growth_rate': 0.025,  # 2.5% perpetual growth (GDP)
+        'wacc': 0.085,  # 8.5% WACC (base case, see DCF_ASSUMPTIONS_SOURCED.md)
+        # WACC Calculation: Rf 4.10% + Beta 1.30 × ERP 4.65% = 10.15% Cost of Equity
+        # Market weights: 76.6% equity, 23.4% debt (at $225.30/share)
+        # WACC = 76.6% × 10.15% + 23.4% × 3.26% = 8.53% ≈ 8.5%
+    }
+
 # ============================================================================
 # STEP 2: BUILD 10-YEAR DCF PROJECTION
 # ============================================================================
@@ -232,6 +261,588 @@ def calculate_equity_value(total_pv_fcf, pv_terminal_value, net_debt, shares_out
         'value_per_share': value_per_share,
     }
 
+# ============================================================================
+# STEP 5B: BATCHED DCF ENGINE
+# ============================================================================
+
+PROJECTION_YEARS = 10
+
+def broadcast_dcf_assumptions(assumptions):
+    """
+    Flatten an assumptions dict and broadcast every input to shape (N,)
+
+    Accepts the same structure as the scalar model (nested 'revenue_growth'
+    phases included). Any leaf may be a scalar or an array; all leaves are
+    broadcast together, so a (N,) WACC vector with scalar growth rates
+    yields N assumption sets.
+    """
+
+    growth = assumptions['revenue_growth']
+
+    flat = {
+        'growth_1_3': growth['years_1_3'],
+        'growth_4_5': growth['years_4_5'],
+        'growth_6_10': growth['years_6_10'],
+        'ebitda_margin_target': assumptions['ebitda_margin_target'],
+        'tax_rate': assumptions['tax_rate'],
+        'capex_pct': assumptions['capex_pct'],
+        'depreciation_pct': assumptions['depreciation_pct'],
+        'nwc_change_pct': assumptions['nwc_change_pct'],
+        'terminal_growth_rate': assumptions['terminal_growth_rate'],
+        'wacc': assumptions['wacc'],
+    }
+
+    arrays = np.broadcast_arrays(*[np.atleast_1d(np.asarray(v, dtype=float)) for v in flat.values()])
+
+    return {key: arr.ravel() for key, arr in zip(flat.keys(), arrays)}
+
+def project_dcf_arrays(base_revenue, base_ebitda, a):
+    """
+    Core projection kernel shared by the consolidated and segment DCFs
+
+    `a` is a flat assumptions dict (see broadcast_dcf_assumptions) whose
+    arrays may have any leading shape, e.g. (N,) or (segments, N).
+    base_revenue / base_ebitda must broadcast to that shape. Every line
+    item comes back with a trailing years axis of length 10.
+    """
+
+    years = np.arange(1, PROJECTION_YEARS + 1)
+    base_revenue = np.asarray(base_revenue, dtype=float)[..., None]
+    base_ebitda = np.asarray(base_ebitda, dtype=float)[..., None]
+
+    # Revenue growth by phase -> (..., 10) growth matrix
+    growth = np.where(
+        years <= 3, a['growth_1_3'][..., None],
+        np.where(years <= 5, a['growth_4_5'][..., None], a['growth_6_10'][..., None])
+    )
+    revenue = base_revenue * np.cumprod(1 + growth, axis=-1)
+    prev_revenue = np.concatenate(
+        [np.broadcast_to(base_revenue, revenue[..., :1].shape), revenue[..., :-1]], axis=-1
+    )
+
+    # EBITDA margin: linear ramp from base margin to target over 10 years
+    base_margin = base_ebitda / base_revenue
+    margin_improvement = (a['ebitda_margin_target'][..., None] - base_margin) / PROJECTION_YEARS
+    ebitda_margin = base_margin + margin_improvement * years
+    ebitda = revenue * ebitda_margin
+
+    depreciation = revenue * a['depreciation_pct'][..., None]
+    ebit = ebitda - depreciation
+    taxes = ebit * a['tax_rate'][..., None]
+    nopat = ebit - taxes
+    capex = revenue * a['capex_pct'][..., None]
+    nwc_change = (revenue - prev_revenue) * a['nwc_change_pct'][..., None]
+
+    fcf = nopat + depreciation - capex - nwc_change
+
+    return {
+        'year': years,
+        'revenue': revenue,
+        'ebitda': ebitda,
+        'ebitda_margin': ebitda_margin,
+        'depreciation': depreciation,
+        'ebit': ebit,
+        'taxes': taxes,
+        'nopat': nopat,
+        'capex': capex,
+        'nwc_change': nwc_change,
+        'fcf': fcf,
+    }
+
+def build_dcf_projections_batch(financials, assumptions):
+    """
+    Build 10-year DCF projections for N assumption sets in one array pass
+
+    Same arithmetic as build_dcf_projections, but every line item is
+    returned as an (N, 10) matrix (columns = years 1-10) instead of a
+    list of per-year dicts.
+    """
+
+    a = broadcast_dcf_assumptions(assumptions)
+
+    return project_dcf_arrays(financials['revenue'], financials['ebitda'], a)
+
+def dcf_valuation_batch(financials, assumptions):
+    """
+    Run the full DCF (projection, terminal value, discounting, equity bridge)
+    for N assumption sets at once
+
+    Returns (N, 10) projection matrices plus (N,) valuation vectors.
+    """
+
+    a = broadcast_dcf_assumptions(assumptions)
+    projections = build_dcf_projections_batch(financials, assumptions)
+
+    wacc = a['wacc'][:, None]
+    g = a['terminal_growth_rate']
+
+    discount_factors = (1 + wacc) ** projections['year']
+    pv_fcf = projections['fcf'] / discount_factors
+    total_pv_fcf = pv_fcf.sum(axis=1)
+
+    terminal_value = projections['fcf'][:, -1] * (1 + g) / (a['wacc'] - g)
+    pv_terminal_value = terminal_value / discount_factors[:, -1]
+
+    enterprise_value = total_pv_fcf + pv_terminal_value
+    equity_value = enterprise_value - financials['net_debt']
+    value_per_share = equity_value / financials['shares_outstanding']
+
+    return {
+        'projections': projections,
+        'discount_factors': discount_factors,
+        'pv_fcf': pv_fcf,
+        'total_pv_fcf': total_pv_fcf,
+        'terminal_value': terminal_value,
+        'pv_terminal_value': pv_terminal_value,
+        'enterprise_value': enterprise_value,
+        'equity_value': equity_value,
+        'value_per_share': value_per_share,
+    }
+
+# ============================================================================
+# STEP 5C: DISCOUNT-RATE REPRICING (CACHED FCF)
+# ============================================================================
+
+# WACC and terminal growth never touch the projected cash flows, so the
+# FCF stream is cached per operating assumption set and only re-discounted.
+# Only scalar assumption sets are cached, in a bounded LRU.
+FCF_DRIVERS = ['growth_1_3', 'growth_4_5', 'growth_6_10', 'ebitda_margin_target',
+               'tax_rate', 'capex_pct', 'depreciation_pct', 'nwc_change_pct']
+FCF_CACHE_SIZE = 256
+
+def _fcf_drivers(assumptions):
+    growth = assumptions['revenue_growth']
+    return [
+        growth['years_1_3'],
+        growth['years_4_5'],
+        growth['years_6_10'],
+        assumptions['ebitda_margin_target'],
+        assumptions['tax_rate'],
+        assumptions['capex_pct'],
+        assumptions['depreciation_pct'],
+        assumptions['nwc_change_pct'],
+    ]
+
+def _project_fcf(revenue, ebitda, drivers):
+    arrays = np.broadcast_arrays(*[np.atleast_1d(np.asarray(v, dtype=float)) for v in drivers])
+    a = {name: arr.ravel() for name, arr in zip(FCF_DRIVERS, arrays)}
+    return project_dcf_arrays(revenue, ebitda, a)['fcf']
+
+@lru_cache(maxsize=FCF_CACHE_SIZE)
+def _scalar_fcf(revenue, ebitda, *drivers):
+    fcf = _project_fcf(revenue, ebitda, drivers)[0]
+    fcf.setflags(write=False)
+    return fcf
+
+def cached_fcf(financials, assumptions):
+    """
+    Year 1-10 FCF vector for a scalar assumption set, memoized (LRU) on
+    the inputs that actually drive the projection
+
+    Array-valued revenue, EBITDA or operating assumptions bypass the
+    cache and return an (N, 10) matrix, one row per assumption set.
+    """
+
+    revenue = np.asarray(financials['revenue'], dtype=float)
+    ebitda = np.asarray(financials['ebitda'], dtype=float)
+    drivers = [np.asarray(value, dtype=float) for value in _fcf_drivers(assumptions)]
+
+    if revenue.ndim or ebitda.ndim or any(value.ndim for value in drivers):
+        return _project_fcf(revenue.ravel(), ebitda.ravel(), drivers)
+
+    return _scalar_fcf(float(revenue), float(ebitda), *(float(value) for value in drivers))
+
+def reprice_dcf(fcf, wacc, terminal_growth_rate, net_debt, shares_outstanding):
+    """
+    Value a fixed FCF stream at any WACC / terminal growth
+
+    PV(FCF) is a dot product with the discount-factor vector and the
+    terminal value is the Gordon term on year-10 FCF. Years are the last
+    axis of fcf, so a (N, 10) matrix from cached_fcf values N assumption
+    sets; its leading axes broadcast against wacc and
+    terminal_growth_rate (scalars or broadcastable arrays).
+    """
+
+    fcf = np.asarray(fcf, dtype=float)
+    wacc = np.asarray(wacc, dtype=float)
+    g = np.asarray(terminal_growth_rate, dtype=float)
+    years = np.arange(1, fcf.shape[-1] + 1)
+
+    discount_factors = (1 + wacc[..., None]) ** -years.astype(float)
+    total_pv_fcf = np.einsum('...t,...t->...', discount_factors, fcf)
+
+    terminal_value = fcf[..., -1] * (1 + g) / (wacc - g)
+    pv_terminal_value = terminal_value * discount_factors[..., -1]
+
+    enterprise_value = total_pv_fcf + pv_terminal_value
+    equity_value = enterprise_value - net_debt
+
+    return {
+        'total_pv_fcf': total_pv_fcf,
+        'terminal_value': terminal_value,
+        'pv_terminal_value': pv_terminal_value,
+        'enterprise_value': enterprise_value,
+        'equity_value': equity_value,
+        'value_per_share': equity_value / shares_outstanding,
+    }
+
+def reprice_dcf_grid(fcf, wacc_range, terminal_growth_range, net_debt, shares_outstanding):
+    """
+    Value per share over a WACC x terminal growth grid as one outer-product
+    evaluation (rows = WACC, columns = terminal growth)
+
+    A (N, 10) fcf matrix adds a leading scenario axis: (N, WACC, growth).
+    """
+
+    fcf = np.asarray(fcf, dtype=float)
+    if fcf.ndim > 1:
+        fcf = fcf[..., None, None, :]
+    wacc = np.asarray(wacc_range, dtype=float)[:, None]
+    g = np.asarray(terminal_growth_range, dtype=float)[None, :]
+
+    return reprice_dcf(fcf, wacc, g, net_debt, shares_outstanding)['value_per_share']
+
+# ============================================================================
+# STEP 5D: TERMINAL VALUE METHODS (BATCHED)
+# ============================================================================
+
+def default_terminal_value_params():
+    """Inputs for the alternative terminal value methods"""
+
+    return {
+        'exit_multiple': 9.0,       # EV/EBITDA at exit (in line with LBO exit case)
+        'h_model_half_life': 5,     # Years for growth to halve toward terminal g
+        'high_growth_rate': None,   # Starting growth for H-model / fade (None = years 6-10 growth)
+        'fade_years': 10,           # Years for growth and returns to fade to WACC
+    }
+
+def _starting_growth(assumptions, params, n):
+    rate = params['high_growth_rate']
+    if rate is None:
+        rate = broadcast_dcf_assumptions(assumptions)['growth_6_10']
+    return np.broadcast_to(np.asarray(rate, dtype=float), (n,))
+
+def tv_perpetuity_growth(projections, assumptions, params, wacc, g):
+    """Gordon growth: FCF(10) × (1 + g) / (WACC - g)"""
+    return projections['fcf'][:, -1] * (1 + g) / (wacc - g)
+
+def tv_exit_multiple(projections, assumptions, params, wacc, g):
+    """Exit multiple: EBITDA(10) × EV/EBITDA"""
+    return projections['ebitda'][:, -1] * params['exit_multiple']
+
+def tv_h_model(projections, assumptions, params, wacc, g):
+    """
+    H-model: growth declines linearly from the high rate to g over 2H years
+
+    TV = FCF(10) × [(1 + g) + H × (g_high - g)] / (WACC - g)
+    """
+    g_high = _starting_growth(assumptions, params, len(wacc))
+    half_life = params['h_model_half_life']
+    return projections['fcf'][:, -1] * ((1 + g) + half_life * (g_high - g)) / (wacc - g)
+
+def tv_linear_fade(projections, assumptions, params, wacc, g):
+    """
+    Linear fade to WACC: growth fades from the high rate to g over the fade
+    period, after which returns on new capital equal WACC, so the
+    continuing value is NOPAT / WACC (growth adds no value)
+    """
+    n_fade = params['fade_years']
+    g_high = _starting_growth(assumptions, params, len(wacc))
+
+    steps = np.arange(1, n_fade + 1) / n_fade
+    growth = g_high[:, None] + (g[:, None] - g_high[:, None]) * steps
+    index = np.cumprod(1 + growth, axis=1)
+    discount = (1 + wacc[:, None]) ** -np.arange(1, n_fade + 1).astype(float)
+
+    pv_fade_fcf = (projections['fcf'][:, -1:] * index * discount).sum(axis=1)
+    continuing_value = projections['nopat'][:, -1] * index[:, -1] * (1 + g) / wacc
+
+    return pv_fade_fcf + continuing_value * discount[:, -1]
+
+# Pluggable registry: name -> fn(projections, assumptions, params, wacc, g)
+TERMINAL_VALUE_METHODS = {
+    'perpetuity_growth': tv_perpetuity_growth,
+    'exit_multiple': tv_exit_multiple,
+    'h_model': tv_h_model,
+    'linear_fade': tv_linear_fade,
+}
+
+def compare_terminal_value_methods(financials, assumptions, params=None, methods=None, projections=None):
+    """
+    Evaluate every terminal value method side by side on one set of
+    projection arrays
+
+    The projection and PV of explicit FCF are computed once; each method
+    adds a single vector operation. Returns {method: {terminal_value,
+    pv_terminal_value, enterprise_value, value_per_share, tv_share_of_ev}}
+    with (N,) arrays.
+    """
+
+    params = {**default_terminal_value_params(), **(params or {})}
+    methods = methods or list(TERMINAL_VALUE_METHODS)
+
+    a = broadcast_dcf_assumptions(assumptions)
+    if projections is None:
+        projections = build_dcf_projections_batch(financials, assumptions)
+
+    wacc = a['wacc']
+    g = a['terminal_growth_rate']
+    discount_factors = (1 + wacc[:, None]) ** projections['year']
+    total_pv_fcf = (projections['fcf'] / discount_factors).sum(axis=1)
+
+    results = {}
+    for name in methods:
+        terminal_value = TERMINAL_VALUE_METHODS[name](projections, assumptions, params, wacc, g)
+        pv_terminal_value = terminal_value / discount_factors[:, -1]
+        enterprise_value = total_pv_fcf + pv_terminal_value
+        equity_value = enterprise_value - financials['net_debt']
+
+        results[name] = {
+            'terminal_value': terminal_value,
+            'pv_terminal_value': pv_terminal_value,
+            'enterprise_value': enterprise_value,
+            'value_per_share': equity_value / financials['shares_outstanding'],
+            'tv_share_of_ev': pv_terminal_value / enterprise_value,
+        }
+
+    return results
+
+# ============================================================================
+# STEP 5E: DATED DISCOUNTING (MID-YEAR & STUB PERIODS)
+# ============================================================================
+
+BASE_FISCAL_YEAR_END = '2024-12-31'  # FY2024 10-K = projection year 0
+
+def discount_timing(valuation_dates, fiscal_year_end=BASE_FISCAL_YEAR_END,
+                    n_years=PROJECTION_YEARS, mid_year=True):
+    """
+    Discount timing for projection years 1..n as of any number of valuation dates
+
+    Time is measured in fiscal years from each valuation date. Years already
+    elapsed get zero weight, the year containing the valuation date is a
+    stub (weight = remaining fraction of the year) and later years are full.
+    With mid_year=True each cash flow is assumed to arrive at the midpoint
+    of its remaining period; otherwise at fiscal year-end.
+
+    Returns (D, n) arrays 'timing' and 'weight', plus (D,) 'year_end_timing'
+    for the final year (used for the terminal value) and 'elapsed' (fiscal
+    years elapsed since the base year-end).
+    """
+
+    dates = pd.to_datetime(np.atleast_1d(valuation_dates)).values.astype('datetime64[D]')
+    base = pd.Timestamp(fiscal_year_end)
+    year_ends = np.array(
+        [(base + pd.DateOffset(years=k)).to_datetime64() for k in range(n_years + 1)]
+    ).astype('datetime64[D]')
+
+    if (dates < year_ends[0]).any() or (dates > year_ends[-1]).any():
+        raise ValueError(f"Valuation dates must fall between {year_ends[0]} and {year_ends[-1]}")
+
+    # Fractional fiscal years elapsed since the base year-end
+    i = np.clip(np.searchsorted(year_ends, dates, side='left'), 1, n_years)
+    year_length = (year_ends[i] - year_ends[i - 1]).astype(float)
+    elapsed = (i - 1) + (dates - year_ends[i - 1]).astype(float) / year_length
+
+    years = np.arange(1, n_years + 1)
+    year_end_timing = years - elapsed[:, None]
+    weight = np.clip(year_end_timing, 0.0, 1.0)
+
+    if mid_year:
+        timing = year_end_timing - weight / 2
+    else:
+        timing = year_end_timing
+
+    return {
+        'timing': timing,
+        'weight': weight,
+        'year_end_timing': year_end_timing[:, -1],
+        'elapsed': elapsed,
+    }
+
+def discount_factors_by_date(wacc, timing):
+    """Vectorized discount factors 1 / (1 + WACC)^t for any timing array"""
+    wacc = np.asarray(wacc, dtype=float)
+    if wacc.ndim:
+        wacc = wacc[:, None]
+    return (1 + wacc) ** -np.asarray(timing, dtype=float)
+
+def dcf_value_by_date(financials, assumptions, valuation_dates,
+                      fiscal_year_end=BASE_FISCAL_YEAR_END, mid_year=True):
+    """
+    Reprice the DCF for many valuation dates in one batched call
+
+    Uses the cached FCF stream; only the timing changes per date. WACC and
+    terminal growth may be scalars or (D,) arrays aligned with the dates.
+    Array operating assumptions are aligned the same way: their (D, 10)
+    FCF matrix is priced row by row against the dates. Terminal value is
+    discounted from the end of year 10.
+    """
+
+    fcf = np.atleast_2d(cached_fcf(financials, assumptions))
+    timing = discount_timing(valuation_dates, fiscal_year_end, fcf.shape[-1], mid_year)
+
+    n_dates = len(timing['elapsed'])
+    if len(fcf) not in (1, n_dates):
+        raise ValueError(f"Array operating assumptions must have one value per valuation date "
+                         f"({n_dates}), got {len(fcf)}")
+
+    wacc = np.broadcast_to(np.asarray(assumptions['wacc'], dtype=float), timing['elapsed'].shape)
+    g = np.broadcast_to(np.asarray(assumptions['terminal_growth_rate'], dtype=float), wacc.shape)
+
+    discount_weights = timing['weight'] * discount_factors_by_date(wacc, timing['timing'])
+    pv_fcf = np.einsum('dt,dt->d', discount_weights, np.broadcast_to(fcf, discount_weights.shape))
+    terminal_value = fcf[:, -1] * (1 + g) / (wacc - g)
+    pv_terminal_value = terminal_value * discount_factors_by_date(wacc, timing['year_end_timing'][:, None])[:, 0]
+
+    enterprise_value = pv_fcf + pv_terminal_value
+    equity_value = enterprise_value - financials['net_debt']
+
+    return pd.DataFrame({
+        'fiscal_years_elapsed': timing['elapsed'],
+        'pv_fcf': pv_fcf,
+        'pv_terminal_value': pv_terminal_value,
+        'enterprise_value': enterprise_value,
+        'equity_value': equity_value,
+        'value_per_share': equity_value / financials['shares_outstanding'],
+    }, index=pd.DatetimeIndex(pd.to_datetime(np.atleast_1d(valuation_dates)), name='valuation_date'))
+
+# ============================================================================
+# STEP 5F: SEGMENT DCF (BEHAVIORAL VS ACUTE)
+# ============================================================================
+
+def segment_base_financials(financials):
+    """
+    Base-year revenue / EBITDA by segment, with the gap to the consolidated
+    10-K figures carried as 'other' so the segments add up
+    """
+
+    return {
+        'behavioral': {
+            'revenue': financials['behavioral_revenue'],
+            'ebitda': financials['behavioral_ebitda'],
+        },
+        'acute': {
+            'revenue': financials['acute_revenue'],
+            'ebitda': financials['acute_ebitda'],
+        },
+        'other': {
+            'revenue': financials['revenue'] - financials['behavioral_revenue'] - financials['acute_revenue'],
+            'ebitda': financials['ebitda'] - financials['behavioral_ebitda'] - financials['acute_ebitda'],
+        },
+    }
+
+def consolidated_segment_assumptions(financials, assumptions):
+    """
+    Segment assumptions that mirror the consolidated case: same growth,
+    capex, D&A, NWC, tax and discount rate, and the same margin expansion
+    (in bps) on each segment's own base margin. Segment EVs built from
+    these sum exactly to the consolidated DCF.
+    """
+
+    consolidated_margin = financials['ebitda'] / financials['revenue']
+    expansion = np.asarray(assumptions['ebitda_margin_target']) - consolidated_margin
+
+    segments = {}
+    for name, base in segment_base_financials(financials).items():
+        margin = base['ebitda'] / base['revenue'] if base['revenue'] else consolidated_margin
+        segments[name] = {
+            **base,
+            'assumptions': {**assumptions, 'ebitda_margin_target': margin + expansion},
+        }
+
+    return segments
+
+def default_segment_assumptions(financials, assumptions):
+    """
+    Differentiated segment view: Behavioral grows faster at a higher margin,
+    Acute grows slower with modest margin recovery
+    """
+
+    segments = consolidated_segment_assumptions(financials, assumptions)
+
+    segments['behavioral']['assumptions'].update({
+        'revenue_growth': {'years_1_3': 0.06, 'years_4_5': 0.05, 'years_6_10': 0.035},
+        'ebitda_margin_target': 0.24,  # From 22.7% (pricing + occupancy)
+    })
+    segments['acute']['assumptions'].update({
+        'revenue_growth': {'years_1_3': 0.045, 'years_4_5': 0.035, 'years_6_10': 0.025},
+        'ebitda_margin_target': 0.145,  # From 13.5% (labor cost normalization)
+    })
+
+    return segments
+
+def segment_dcf_batch(financials, segments):
+    """
+    Value any number of segments / carve-outs through one stacked kernel
+
+    `segments` maps name -> {'revenue', 'ebitda', 'assumptions'} (base-year
+    figures plus an assumptions dict whose leaves may be (N,) scenario
+    arrays). All inputs are stacked to (segments, N) and projected as
+    (segments, N, 10) in a single pass.
+    """
+
+    names = list(segments)
+    flats = [broadcast_dcf_assumptions(segments[name]['assumptions']) for name in names]
+    n = max(len(flat['wacc']) for flat in flats)
+
+    a = {
+        key: np.stack([np.broadcast_to(flat[key], (n,)) for flat in flats])
+        for key in flats[0]
+    }
+    base_revenue = np.array([segments[name]['revenue'] for name in names], dtype=float)[:, None]
+    base_ebitda = np.array([segments[name]['ebitda'] for name in names], dtype=float)[:, None]
+
+    projections = project_dcf_arrays(base_revenue, base_ebitda, a)
+
+    wacc = a['wacc']
+    g = a['terminal_growth_rate']
+    discount_factors = (1 + wacc[..., None]) ** projections['year']
+
+    total_pv_fcf = (projections['fcf'] / discount_factors).sum(axis=-1)
+    terminal_value = projections['fcf'][..., -1] * (1 + g) / (wacc - g)
+    pv_terminal_value = terminal_value / discount_factors[..., -1]
+    enterprise_value = total_pv_fcf + pv_terminal_value
+
+    total_enterprise_value = enterprise_value.sum(axis=0)
+    equity_value = total_enterprise_value - financials['net_debt']
+
+    return {
+        'segments': names,
+        'projections': projections,
+        'total_pv_fcf': total_pv_fcf,
+        'pv_terminal_value': pv_terminal_value,
+        'enterprise_value': enterprise_value,
+        'total_enterprise_value': total_enterprise_value,
+        'equity_value': equity_value,
+        'value_per_share': equity_value / financials['shares_outstanding'],
+    }
+
+def segment_dcf_reconciliation(financials, assumptions, segments=None):
+    """
+    Segment EVs vs the consolidated DCF
+
+    With the default (consolidated-consistent) segment assumptions the
+    'Difference' row is zero; with a differentiated view it shows the
+    value attributed to the segment mix.
+    """
+
+    if segments is None:
+        segments = consolidated_segment_assumptions(financials, assumptions)
+
+    segment_result = segment_dcf_batch(financials, segments)
+    consolidated_ev = dcf_valuation_batch(financials, assumptions)['enterprise_value']
+
+    rows = [
+        {'Component': name, 'Enterprise Value': ev[0]}
+        for name, ev in zip(segment_result['segments'], segment_result['enterprise_value'])
+    ]
+    rows.append({'Component': 'Sum of Segments', 'Enterprise Value': segment_result['total_enterprise_value'][0]})
+    rows.append({'Component': 'Consolidated DCF', 'Enterprise Value': consolidated_ev[0]})
+    rows.append({'Component': 'Difference',
+                 'Enterprise Value': segment_result['total_enterprise_value'][0] - consolidated_ev[0]})
+
+    return pd.DataFrame(rows)
+
 # ============================================================================
 # STEP 6: SENSITIVITY ANALYSIS
 # ============================================================================
@@ -246,28 +857,159 @@ def dcf_sensitivity_analysis(financials, base_assumptions):
     wacc_range = np.arange(0.07, 0.12, 0.005)  # 7% to 12% in 0.5% steps
     terminal_growth_range = np.arange(0.015, 0.035, 0.0025)  # 1.5% to 3.5%
 
+    # Only the discounting changes across the grid: reuse one FCF stream
+    fcf = cached_fcf(financials, base_assumptions)
+    if fcf.ndim > 1:
+        raise ValueError("dcf_sensitivity_analysis needs scalar operating assumptions; "
+                         "use reprice_dcf_grid on the (N, 10) FCF matrix for batches")
+    values = reprice_dcf_grid(
+        fcf, wacc_range, terminal_growth_range,
+        financials['net_debt'], financials['shares_outstanding']
+    )
+
     sensitivity_results = pd.DataFrame(
+        values,
         index=[f"{w:.1%}" for w in wacc_range],
         columns=[f"{g:.1%}" for g in terminal_growth_range]
     )
 
-    for wacc in wacc_range:
-        for term_growth in terminal_growth_range:
-            # Update assumptions
-            assumptions = base_assumptions.copy()
-            assumptions['wacc'] = wacc
-            assumptions['terminal_growth_rate'] = term_growth
+    return sensitivity_results
 
-            # Run DCF
-            projections = build_dcf_projections(financials, assumptions)
-            terminal_value = calculate_terminal_value(projections, assumptions)
-            pv_fcf_list, pv_terminal, total_pv = discount_cash_flows(projections, terminal_value, wacc)
-            valuation = calculate_equity_value(total_pv, pv_terminal, financials['net_debt'], financials['shares_outstanding'])
+# ============================================================================
+# STEP 6B: MONTE CARLO SIMULATION
+# ============================================================================
 
-            # Store result
-            sensitivity_results.loc[f"{wacc:.1%}", f"{term_growth:.1%}"] = valuation['value_per_share']
+MONTE_CARLO_DRIVERS = ['revenue_growth_shift', 'ebitda_margin_target', 'wacc', 'terminal_growth_rate']
 
-    return sensitivity_results.astype(float)
+def default_monte_carlo_config():
+    """
+    Default distributions and correlations for the DCF Monte Carlo
+
+    Distributions (one per driver):
+    - normal:     {'mean', 'std'}
+    - lognormal:  {'mean', 'std'} of the underlying normal
+    - uniform:    {'low', 'high'}
+    - triangular: {'low', 'mode', 'high'}
+
+    'revenue_growth_shift' is added to every growth phase; the other
+    drivers replace the base case assumption of the same name.
+    Correlations are applied through a Gaussian copula (order follows
+    MONTE_CARLO_DRIVERS).
+    """
+
+    return {
+        'distributions': {
+            'revenue_growth_shift': {'dist': 'normal', 'mean': 0.0, 'std': 0.01},
+            'ebitda_margin_target': {'dist': 'triangular', 'low': 0.175, 'mode': 0.19, 'high': 0.20},
+            'wacc': {'dist': 'normal', 'mean': 0.085, 'std': 0.005},
+            'terminal_growth_rate': {'dist': 'triangular', 'low': 0.015, 'mode': 0.025, 'high': 0.030},
+        },
+        'correlation': [
+            # growth  margin  wacc   terminal g
+            [1.00,    0.30,   0.00,  0.20],
+            [0.30,    1.00,   0.00,  0.00],
+            [0.00,    0.00,   1.00,  0.40],  # Rates and long-run inflation move together
+            [0.20,    0.00,   0.40,  1.00],
+        ],
+        'min_wacc_spread': 0.01,  # Paths with WACC - g below this are discarded
+    }
+
+def _inverse_marginal(z, spec):
+    """Map correlated standard normals z to the driver's marginal distribution"""
+
+    dist = spec['dist']
+
+    if dist == 'normal':
+        return spec['mean'] + spec['std'] * z
+    if dist == 'lognormal':
+        return np.exp(spec['mean'] + spec['std'] * z)
+
+    u = ndtr(z)
+    if dist == 'uniform':
+        return spec['low'] + u * (spec['high'] - spec['low'])
+    if dist == 'triangular':
+        low, mode, high = spec['low'], spec['mode'], spec['high']
+        cut = (mode - low) / (high - low)
+        left = low + np.sqrt(u * (high - low) * (mode - low))
+        right = high - np.sqrt((1 - u) * (high - low) * (high - mode))
+        return np.where(u < cut, left, right)
+
+    raise ValueError(f"Unknown distribution: {dist}")
+
+def sample_dcf_assumptions(base_assumptions, config, n_paths, rng):
+    """
+    Draw n_paths correlated assumption sets as an assumptions dict of (N,) arrays
+    """
+
+    cholesky = np.linalg.cholesky(np.asarray(config['correlation'], dtype=float))
+    z = rng.standard_normal((n_paths, len(MONTE_CARLO_DRIVERS))) @ cholesky.T
+
+    draws = {
+        driver: _inverse_marginal(z[:, i], config['distributions'][driver])
+        for i, driver in enumerate(MONTE_CARLO_DRIVERS)
+    }
+
+    assumptions = base_assumptions.copy()
+    assumptions['revenue_growth'] = {
+        phase: rate + draws['revenue_growth_shift']
+        for phase, rate in base_assumptions['revenue_growth'].items()
+    }
+    assumptions['ebitda_margin_target'] = draws['ebitda_margin_target']
+    assumptions['wacc'] = draws['wacc']
+    assumptions['terminal_growth_rate'] = draws['terminal_growth_rate']
+
+    return assumptions
+
+def dcf_monte_carlo(financials, base_assumptions, config=None, n_paths=1_000_000,
+                    chunk_size=100_000, seed=42, percentiles=(0.05, 0.10, 0.25, 0.50, 0.75, 0.90, 0.95)):
+    """
+    Monte Carlo DCF: push correlated assumption draws through the batched
+    engine in chunks and aggregate value per share in a streaming sketch
+
+    Memory is bounded by chunk_size regardless of n_paths. The same seed
+    always reproduces the same distribution.
+    """
+
+    config = config or default_monte_carlo_config()
+    rng = np.random.default_rng(seed)
+    sketch = StreamingHistogram()
+    n_discarded = 0
+
+    for start in range(0, n_paths, chunk_size):
+        n = min(chunk_size, n_paths - start)
+        assumptions = sample_dcf_assumptions(base_assumptions, config, n, rng)
+
+        valid = assumptions['wacc'] - assumptions['terminal_growth_rate'] >= config['min_wacc_spread']
+        n_discarded += int((~valid).sum())
+
+        value_per_share = dcf_valuation_batch(financials, assumptions)['value_per_share']
+        sketch.update(value_per_share[valid])
+
+    counts, edges = sketch.histogram()
+
+    return {
+        'n_paths': n_paths,
+        'n_valid': sketch.count,
+        'n_discarded': n_discarded,
+        'seed': seed,
+        'mean': sketch.mean,
+        'std': sketch.std,
+        'percentiles': dict(zip(percentiles, sketch.quantile(percentiles))),
+        'prob_above_current_price': sketch.prob_above(financials['current_price']),
+        'histogram_counts': counts,
+        'histogram_edges': edges,
+    }
+
+def dcf_monte_carlo_range(monte_carlo_result, low_pct=0.10, base_pct=0.50, high_pct=0.90):
+    """Low / base / high value per share from Monte Carlo percentiles (football field input)"""
+
+    p = monte_carlo_result['percentiles']
+
+    return {
+        'low': p[low_pct],
+        'base': p[base_pct],
+        'high': p[high_pct],
+    }
 
 # ============================================================================
 # STEP 7: GENERATE DCF REPORT
@@ -289,23 +1031,7 @@ def generate_dcf_report():
     print("STEP 1: KEY ASSUMPTIONS")
     print("-" * 80)
 
-    assumptions = {
-        'revenue_growth': {
-            'years_1_3': 0.05,   # 5% growth (near-term)
-            'years_4_5': 0.04,   # 4% growth (mid-term)
-            'years_6_10': 0.03,  # 3% growth (long-term, GDP+)
-        },
-        'ebitda_margin_target': 0.19,  # Target 19% (from 17.5% today, modest expansion)
-        'tax_rate': 0.21,  # 21% federal corporate tax
-        'capex_pct': 0.04,  # 4% of revenue (maintenance CapEx)
-        'depreciation_pct': 0.037,  # 3.7% of revenue (historical)
-        'nwc_change_pct': 0.01,  # 1% of revenue growth (working capital increase)
-        'terminal_growth_rate': 0.025,  # 2.5% perpetual growth (GDP)
-        'wacc': 0.085,  # 8.5% WACC (base case, see DCF_ASSUMPTIONS_SOURCED.md)
-        # WACC Calculation: Rf 4.10% + Beta 1.30 × ERP 4.65% = 10.15% Cost of Equity
-        # Market weights: 76.6% equity, 23.4% debt (at $225.30/share)
-        # WACC = 76.6% × 10.15% + 23.4% × 3.26% = 8.53% ≈ 8.5%
-    }
+    assumptions = default_dcf_assumptions()
 
     print(f"Revenue Growth:")
     print(f"  Years 1-3:  {assumptions['revenue_growth']['years_1_3']:.1%}")
@@ -349,6 +1075,15 @@ def generate_dcf_report():
     print(f"Terminal Value:         ${terminal_value:,.0f}M")
     print()
 
+    tv_methods = compare_terminal_value_methods(financials, assumptions)
+
+    print("Terminal Value Cross-Check:\n")
+    for name, result in tv_methods.items():
+        print(f"  {name:<20} TV ${result['terminal_value'][0]:>9,.0f}M   "
+              f"${result['value_per_share'][0]:>7.2f}/share   "
+              f"{result['tv_share_of_ev'][0]:.1%} of EV")
+    print()
+
     # Discount cash flows
     print("STEP 4: PRESENT VALUE OF CASH FLOWS")
     print("-" * 80)
@@ -387,6 +1122,18 @@ def generate_dcf_report():
     print(f"Implied Upside:        {((valuation['value_per_share'] - financials['current_price']) / financials['current_price'] * 100):.1f}%")
     print()
 
+    # Segment view
+    print("STEP 5B: SEGMENT DCF (Behavioral vs Acute)")
+    print("-" * 80)
+
+    segment_view = segment_dcf_reconciliation(
+        financials, assumptions, default_segment_assumptions(financials, assumptions)
+    )
+
+    print("\nEnterprise Value by Segment ($ in millions):\n")
+    print(segment_view.round(0).to_string(index=False))
+    print()
+
     # Sensitivity analysis
     print("STEP 6: SENSITIVITY ANALYSIS (WACC vs Terminal Growth)")
     print("-" * 80)
@@ -397,6 +1144,19 @@ def generate_dcf_report():
     print(sensitivity.round(2).to_string())
     print()
 
+    # Monte Carlo
+    print("STEP 6B: MONTE CARLO SIMULATION (Correlated Growth, Margin, WACC, Terminal g)")
+    print("-" * 80)
+
+    monte_carlo = dcf_monte_carlo(financials, assumptions)
+
+    print(f"Paths Simulated:       {monte_carlo['n_paths']:,} (seed {monte_carlo['seed']})")
+    print(f"Mean Value per Share:  ${monte_carlo['mean']:.2f}  (std ${monte_carlo['std']:.2f})")
+    for pct, value in monte_carlo['percentiles'].items():
+        print(f"  P{pct * 100:<4.0f}              ${value:.2f}")
+    print(f"P(Value > Current):    {monte_carlo['prob_above_current_price']:.1%}")
+    print()
+
     # Save outputs
     print("STEP 7: SAVING OUTPUTS...")
     print("-" * 80)
@@ -443,6 +1203,7 @@ def generate_dcf_report():
         'pv_analysis': pv_fcf_list,
         'valuation': valuation,
         'sensitivity': sensitivity,
+        'monte_carlo': monte_carlo,
     }
 
 # ============================================================================
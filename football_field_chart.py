@@ -7,149 +7,205 @@ Author: Ascendra Capital Investment Team
 Date: October 29, 2025
 """
 
-import matplotlib.pyplot as plt
+import hashlib
+import io
+import json
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
 import matplotlib.patches as mpatches
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.transforms import Bbox
 import pandas as pd
 import numpy as np
+from scipy.special import ndtr
+
+from dcf_valuation_model import (
+    load_financial_data, default_dcf_assumptions, default_monte_carlo_config,
+    dcf_monte_carlo, dcf_monte_carlo_range
+)
+from sotp_kernel import default_sotp_capital_structure, four_part_sotp, sotp_valuation_kernel
+from sotp_valuation_model_v2 import calculate_proforma_ebitdas, load_10k_data as load_sotp_10k_data
+from utils.streaming_stats import StreamingHistogram
 
 # ============================================================================
 # STEP 1: GATHER VALUATION RESULTS FROM ALL MODELS
 # ============================================================================
 
-def load_all_valuations():
-    """
-    Load valuation results from all models:
-    1. SOTP (4-part sum-of-the-parts)
-    2. DCF (10-year discounted cash flow)
-    3. LBO (leveraged buyout analysis)
-    4. Comparable Companies (trading multiples)
-    5. Precedent Transactions (M&A multiples)
+# Method weights in the blended valuation
+FOOTBALL_FIELD_WEIGHTS = {
+    'SOTP (4-Part)': 0.40,  # Primary method (increased from 30%)
+    'DCF (10-Year)': 0.30,  # Increased from 25%
+    'Comparable Companies': 0.10,  # Less relevant, single multiple
+    'Precedent Transactions': 0.20,  # Increased from 15%
+}
+
+# LBO Analysis - REMOVED per user request (Nov 10, 2025)
+# LBO not relevant for UHS given:
+# - 90.5% real estate ownership (asset-heavy, not ideal for LBO)
+# - Family control (90.5% voting power)
+# - Already leveraged balance sheet
+
+def default_football_field_inputs():
     """
+    Model inputs for every football field method
 
-    valuations = []
+    - SOTP: v2 pro-forma segment EBITDA / imputed rent with
+      Conservative / Moderately Aggressive / Aggressive multiples
+    - DCF: Monte Carlo P10 / P50 / P90 of value per share
+    - Comps / Precedents: EV/EBITDA multiple ranges
 
-    # 1. SOTP Valuation (from sotp_valuation_scenarios.csv)
-    try:
-        sotp = pd.read_csv('data/graphs/sotp_valuation_scenarios.csv')
+    Every method bridges EV to equity per share on the SOTP kernel's
+    capital structure (net debt and share count), so the bars compare
+    like for like.
+    """
 
-        # Clean currency formatting (remove $ and ,)
-        def clean_currency(val):
-            if isinstance(val, str):
-                return float(val.replace('$', '').replace(',', '').replace('+', '').replace('%', ''))
-            return float(val)
+    proforma = calculate_proforma_ebitdas(load_sotp_10k_data())
+    capital = default_sotp_capital_structure()
 
-        bear = clean_currency(sotp[sotp['Scenario'] == 'BEAR']['Value Per Share'].values[0])
-        base = clean_currency(sotp[sotp['Scenario'] == 'BASE']['Value Per Share'].values[0])
-        bull = clean_currency(sotp[sotp['Scenario'] == 'BULL']['Value Per Share'].values[0])
+    # Market multiple inputs (EBITDA: UHS 10-K FY2024)
+    market = {'ebitda': 2775.6, 'net_debt': capital['net_debt'], 'shares': capital['shares_outstanding']}
 
-        valuations.append({
-            'method': 'SOTP (4-Part)',
-            'low': float(bear),
-            'base': float(base),
-            'high': float(bull),
-            'weight': 0.40,  # 40% weight (primary method, increased from 30%)
-        })
-    except Exception as e:
-        print(f"Warning: Could not load SOTP data: {e}")
-        # Using updated AGGRESSIVE SOTP values (Nov 10, 2025)
-        valuations.append({
-            'method': 'SOTP (4-Part)',
-            'low': 413,   # Conservative: 9.0x Beh, 6.5x Acute, 7.0% cap
-            'base': 478,  # Moderately Aggressive: 10.0x Beh, 7.0x Acute, 6.0% cap
-            'high': 520,  # Aggressive: 10.5x Beh, 7.5x Acute, 5.5% cap
-            'weight': 0.40,  # 40% weight (increased from 30%)
-        })
+    return {
+        'SOTP (4-Part)': {
+            'behavioral_opco_ebitda': proforma['behavioral']['proforma_opco_ebitda'],
+            'behavioral_propco_noi': proforma['behavioral']['imputed_rent'],
+            'acute_opco_ebitda': proforma['acute']['proforma_opco_ebitda'],
+            'acute_propco_noi': proforma['acute']['imputed_rent'],
+            'net_debt': capital['net_debt'],
+            'shares': capital['shares_outstanding'],
+            'scenarios': {
+                'low': {'behavioral_multiple': 9.0, 'acute_multiple': 6.5, 'cap_rate': 0.070},  # Conservative
+                'base': {'behavioral_multiple': 10.0, 'acute_multiple': 7.0, 'cap_rate': 0.060},  # Moderately Aggressive
+                'high': {'behavioral_multiple': 10.5, 'acute_multiple': 7.5, 'cap_rate': 0.055},  # Aggressive
+            },
+        },
+        'DCF (10-Year)': {
+            'financials': {
+                **load_financial_data(),
+                'net_debt': capital['net_debt'],
+                'shares_outstanding': capital['shares_outstanding'],
+            },
+            'assumptions': default_dcf_assumptions(),
+            'config': default_monte_carlo_config(),
+            'n_paths': 1_000_000,
+            'seed': 42,
+        },
+        # Industry comps (SOURCED): THC 6.0x, ACHC 6.6-7.3x, CYH 9.65x, HCA 9.1x, Median 7.84x
+        'Comparable Companies': {
+            **market,
+            'multiples': {'low': 6.0, 'base': 7.0, 'high': 8.0},
+        },
+        # SOURCED: First Page Sage (7-9x), Healthcare Capital (10x median), RL Hulett (8.0x strategic)
+        'Precedent Transactions': {
+            **market,
+            'multiples': {'low': 8.0, 'base': 10.0, 'high': 12.0},
+        },
+    }
 
-    # 2. DCF Valuation (from dcf_valuation_summary.csv) - UPDATED Nov 11, 2025
-    try:
-        dcf = pd.read_csv('data/graphs/dcf_valuation_summary.csv')
-        dcf_value = dcf['value_per_share'].values[0]
+def sotp_football_field_range(inputs):
+    """Low / base / high SOTP value per share, all three scenarios in one kernel call"""
+
+    scenarios = pd.DataFrame(inputs['scenarios']).T.loc[['low', 'base', 'high']]
+    sotp = four_part_sotp(
+        inputs['behavioral_opco_ebitda'], scenarios['behavioral_multiple'].values, inputs['behavioral_propco_noi'],
+        inputs['acute_opco_ebitda'], scenarios['acute_multiple'].values, inputs['acute_propco_noi'],
+        scenarios['cap_rate'].values, inputs['net_debt'], inputs['shares'],
+    )
+    return dict(zip(['low', 'base', 'high'], sotp['value_per_share']))
+
+def dcf_football_field_range(inputs):
+    """DCF range from Monte Carlo percentiles (P10 / P50 / P90)"""
+
+    dcf_mc = dcf_monte_carlo(inputs['financials'], inputs['assumptions'], config=inputs['config'],
+                             n_paths=inputs['n_paths'], seed=inputs['seed'])
+    return dcf_monte_carlo_range(dcf_mc)
+
+def multiple_football_field_range(inputs):
+    """EV = EBITDA x multiple -> equity -> per share for each case"""
+
+    cases = list(inputs['multiples'])
+    value = sotp_valuation_kernel(
+        opco={'consolidated': (inputs['ebitda'], np.array([inputs['multiples'][c] for c in cases]))},
+        net_debt=inputs['net_debt'],
+        shares=inputs['shares'],
+    )['value_per_share']
+    return dict(zip(cases, value))
+
+FOOTBALL_FIELD_METHODS = {
+    'SOTP (4-Part)': sotp_football_field_range,
+    'DCF (10-Year)': dcf_football_field_range,
+    'Comparable Companies': multiple_football_field_range,
+    'Precedent Transactions': multiple_football_field_range,
+}
+
+# Method results keyed by a content hash of their inputs: rebuilding the
+# football field after changing one method's assumptions reruns only that method.
+# Least recently used entries are evicted beyond _VALUATION_CACHE_SIZE.
+_VALUATION_CACHE = OrderedDict()
+_VALUATION_CACHE_SIZE = 64
+
+def _inputs_digest(inputs):
+    def to_json(value):
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+        if isinstance(value, np.generic):
+            return value.item()
+        raise TypeError(f"Cannot hash {type(value).__name__} valuation input")
+
+    payload = json.dumps(inputs, sort_keys=True, default=to_json)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+def run_valuation_method(method, inputs):
+    """Low / base / high value per share for one method, memoized on its inputs"""
+
+    key = (method, _inputs_digest(inputs))
+
+    if key in _VALUATION_CACHE:
+        _VALUATION_CACHE.move_to_end(key)
+    else:
+        result = FOOTBALL_FIELD_METHODS[method](inputs)
+        _VALUATION_CACHE[key] = {case: float(result[case]) for case in ['low', 'base', 'high']}
+        if len(_VALUATION_CACHE) > _VALUATION_CACHE_SIZE:
+            _VALUATION_CACHE.popitem(last=False)
+
+    return dict(_VALUATION_CACHE[key])
+
+def _merge_inputs(defaults, overrides):
+    """Nested dict merge: override values replace defaults key by key"""
+
+    merged = dict(defaults)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge_inputs(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
 
-        # Use sensitivity for range based on WACC 8.5-9.5%
-        valuations.append({
-            'method': 'DCF (10-Year)',
-            'low': 396,  # WACC 9.5% (conservative)
-            'base': 477,  # WACC 8.5% (current ERP, updated Nov 11)
-            'high': 558,  # WACC 8.0% (optimistic)
-            'weight': 0.30,  # 30% weight (increased from 25%)
-        })
-    except:
-        # Updated DCF values to match football_field_summary.csv (Nov 11, 2025)
-        valuations.append({
-            'method': 'DCF (10-Year)',
-            'low': 396,   # WACC 9.5%, terminal 2.5%
-            'base': 477,  # WACC 8.5%, terminal 2.5%
-            'high': 558,  # WACC 8.0%, terminal 2.5%
-            'weight': 0.30,  # 30% weight (increased from 25%)
-        })
+def load_all_valuations(inputs=None):
+    """
+    Run every valuation method and collect low / base / high:
+    1. SOTP (4-part sum-of-the-parts)
+    2. DCF (10-year discounted cash flow, Monte Carlo range)
+    3. Comparable Companies (trading multiples)
+    4. Precedent Transactions (M&A multiples)
 
-    # 3. LBO Analysis - REMOVED per user request (Nov 10, 2025)
-    # LBO not relevant for UHS given:
-    # - 90.5% real estate ownership (asset-heavy, not ideal for LBO)
-    # - Family control (90.5% voting power)
-    # - Already leveraged balance sheet
-    # COMMENTED OUT - keeping code for reference
-    # try:
-    #     valuations.append({
-    #         'method': 'LBO Analysis',
-    #         'low': 265,
-    #         'base': 320,
-    #         'high': 385,
-    #         'weight': 0.20,
-    #     })
-    # except:
-    #     pass
-
-    # 4. Comparable Companies (trading multiples) - UPDATED Oct 31, 2025
-    # Use current EV/EBITDA market multiples (SOURCED)
-    current_ebitda = 2775.6  # $M (UHS 10-K FY2024)
-    shares = 63.64  # M (StockAnalysis.com, Oct 2025)
-    net_debt = 4379  # $M (UHS 10-K FY2024)
-
-    # Industry comps (SOURCED): THC 6.0x, ACHC 6.6-7.3x, CYH 9.65x, HCA 9.1x, Median 7.84x
-    comp_multiples = {
-        'low': 6.0,   # THC level (conservative)
-        'base': 7.0,  # Below industry median (reflects undervaluation)
-        'high': 8.0,  # Closer to industry median
-    }
+    inputs holds partial overrides per method, merged into that method's
+    defaults (e.g. {'DCF (10-Year)': {'seed': 7}}); unchanged methods are
+    served from the result cache.
+    """
 
-    comp_values = {}
-    for case, multiple in comp_multiples.items():
-        ev = current_ebitda * multiple
-        equity_value = ev - net_debt
-        value_per_share = equity_value / shares
-        comp_values[case] = value_per_share
-
-    valuations.append({
-        'method': 'Comparable Companies',
-        'low': comp_values['low'],
-        'base': comp_values['base'],
-        'high': comp_values['high'],
-        'weight': 0.10,  # 10% weight (less relevant, single multiple)
-    })
-
-    # 5. Precedent Transactions (M&A multiples) - UPDATED Oct 31, 2025
-    # SOURCED: First Page Sage (7-9x), Healthcare Capital (10x median), RL Hulett (8.0x strategic)
-    precedent_multiples = {
-        'low': 8.0,   # Hospital-focused deal (7-9x range low end)
-        'base': 10.0, # Industry median (Healthcare Capital 2023)
-        'high': 12.0, # Premium deal / competitive auction (75th percentile 13.9x)
-    }
+    inputs = _merge_inputs(default_football_field_inputs(), inputs or {})
 
-    precedent_values = {}
-    for case, multiple in precedent_multiples.items():
-        ev = current_ebitda * multiple
-        equity_value = ev - net_debt
-        value_per_share = equity_value / shares
-        precedent_values[case] = value_per_share
-
-    valuations.append({
-        'method': 'Precedent Transactions',
-        'low': precedent_values['low'],
-        'base': precedent_values['base'],
-        'high': precedent_values['high'],
-        'weight': 0.20,  # 20% weight (increased from 15%)
-    })
+    valuations = []
+    for method in FOOTBALL_FIELD_METHODS:
+        valuations.append({
+            'method': method,
+            **run_valuation_method(method, inputs[method]),
+            'weight': FOOTBALL_FIELD_WEIGHTS[method],
+        })
 
     return pd.DataFrame(valuations)
 
@@ -157,28 +213,330 @@ def load_all_valuations():
 # STEP 2: CALCULATE WEIGHTED AVERAGE VALUATION
 # ============================================================================
 
-def calculate_weighted_average(valuations_df):
+# Fixed sketch range ($/share) so chunk sketches share bin edges and can be merged
+BLENDED_VALUE_RANGE = (0.0, 1_000.0)
+
+def _triangular_ppf(u, low, mode, high):
+    """Inverse CDF of the triangular(low, mode, high) distribution (broadcasts)"""
+
+    span = np.maximum(high - low, 1e-12)
+    split = (mode - low) / span
+    return np.where(
+        u < split,
+        low + np.sqrt(u * span * (mode - low)),
+        high - np.sqrt((1 - u) * span * (high - mode)),
+    )
+
+def simulate_blended_valuation(valuations_df, n_draws=2_000_000, chunk_size=500_000, seed=42,
+                               weight_concentration=50.0, method_correlation=0.5, current_price=225.30,
+                               percentiles=(0.05, 0.10, 0.25, 0.50, 0.75, 0.90, 0.95)):
+    """
+    Distribution of the blended (weighted) value per share
+
+    - Method values: triangular(low, base, high) per method, linked by a
+      Gaussian copula with one pairwise method_correlation in [0, 1]
+      (the methods share the same EBITDA base, so they are not
+      independent; a one-factor copula cannot represent negative
+      correlation)
+    - Weights: Dirichlet with mean equal to the method weights and
+      concentration weight_concentration (higher = tighter around the
+      fixed weights); None keeps the weights fixed
+
+    Draws are generated in vectorized chunks and aggregated in a
+    streaming sketch; the probability of exceeding current_price is an
+    exact count.
+    """
+
+    if not 0 <= method_correlation <= 1:
+        raise ValueError(f"method_correlation must be between 0 and 1, got {method_correlation}")
+
+    low, base, high = (valuations_df[c].to_numpy(dtype=float) for c in ['low', 'base', 'high'])
+    weights = valuations_df['weight'].to_numpy(dtype=float)
+    weights = weights / weights.sum()
+    n_methods = len(weights)
+
+    rng = np.random.default_rng(seed)
+    sketch = StreamingHistogram(value_range=BLENDED_VALUE_RANGE)
+    n_above = 0
+
+    for start in range(0, n_draws, chunk_size):
+        n = min(chunk_size, n_draws - start)
+
+        z = (np.sqrt(method_correlation) * rng.standard_normal((n, 1))
+             + np.sqrt(1 - method_correlation) * rng.standard_normal((n, n_methods)))
+        values = _triangular_ppf(ndtr(z), low, base, high)
+
+        if weight_concentration is None:
+            draw_weights = weights
+        else:
+            gamma = rng.standard_gamma(weight_concentration * weights, size=(n, n_methods))
+            draw_weights = gamma / gamma.sum(axis=1, keepdims=True)
+
+        blended = (values * draw_weights).sum(axis=1)
+        sketch.update(blended)
+        n_above += int((blended > current_price).sum())
+
+    counts, edges = sketch.histogram()
+
+    return {
+        'n_draws': n_draws,
+        'seed': seed,
+        'weight_concentration': weight_concentration,
+        'method_correlation': method_correlation,
+        'mean': sketch.mean,
+        'std': sketch.std,
+        'percentiles': dict(zip(percentiles, sketch.quantile(percentiles))),
+        'current_price': current_price,
+        'prob_above_price': n_above / n_draws,
+        'histogram_counts': counts,
+        'histogram_edges': edges,
+    }
+
+def calculate_weighted_average(valuations_df, n_draws=2_000_000, band=(0.10, 0.50, 0.90),
+                               current_price=225.30, **simulation_kwargs):
     """
-    Calculate weighted average valuation across all methods
+    Blended valuation across all methods
+
+    low / base / high are the band percentiles (default P10 / P50 / P90)
+    of simulate_blended_valuation(); n_draws=None falls back to weighting
+    low, base and high separately. point_estimate is always the
+    fixed-weight average of the base cases.
     """
 
-    weighted_low = (valuations_df['low'] * valuations_df['weight']).sum()
-    weighted_base = (valuations_df['base'] * valuations_df['weight']).sum()
-    weighted_high = (valuations_df['high'] * valuations_df['weight']).sum()
+    weights = valuations_df['weight']
+    point_estimate = (valuations_df['base'] * weights).sum()
+
+    if not n_draws:
+        return {
+            'method': 'WEIGHTED AVERAGE',
+            'low': (valuations_df['low'] * weights).sum(),
+            'base': point_estimate,
+            'high': (valuations_df['high'] * weights).sum(),
+            'weight': 1.0,
+        }
+
+    blended = simulate_blended_valuation(valuations_df, n_draws=n_draws, current_price=current_price,
+                                         percentiles=band, **simulation_kwargs)
+    low, base, high = (blended['percentiles'][q] for q in band)
 
     return {
         'method': 'WEIGHTED AVERAGE',
-        'low': weighted_low,
-        'base': weighted_base,
-        'high': weighted_high,
+        'low': low,
+        'base': base,
+        'high': high,
         'weight': 1.0,
+        'point_estimate': point_estimate,
+        'prob_above_price': blended['prob_above_price'],
     }
 
 # ============================================================================
 # STEP 3: CREATE FOOTBALL FIELD CHART
 # ============================================================================
 
-def create_football_field_chart(valuations_df, weighted_avg, current_price=225.30):
+# Ascendra color scheme by method
+FOOTBALL_FIELD_COLORS = {
+    'SOTP (4-Part)': '#4cc9f0',
+    'DCF (10-Year)': '#3a86ff',
+    'LBO Analysis': '#7209b7',
+    'Comparable Companies': '#f72585',
+    'Precedent Transactions': '#06ffa5',
+    'WEIGHTED AVERAGE': '#ffba08',
+}
+
+# Recommended offer range ($/share) - UPDATED Oct 31, 2025 with Behavioral Premium
+RECOMMENDED_OFFER_RANGE = (425, 475)
+
+def football_field_rows(valuations_df, weighted_avg):
+    """Methods plus the weighted average, ordered bottom-to-top for plotting"""
+
+    full_df = pd.concat([valuations_df, pd.DataFrame([weighted_avg])], ignore_index=True)
+    return full_df.iloc[::-1].reset_index(drop=True)[['method', 'low', 'base', 'high']]
+
+class FootballFieldTemplate:
+    """Pre-built football field figure whose bars and labels are updated in place
+
+    Figure, axes styling, offer range, footer and legend are created once
+    per row count; update() only moves bar extents, markers and label
+    text, so rendering many scenario variants skips matplotlib setup.
+    """
+
+    def __init__(self, n_rows):
+        self.n_rows = n_rows
+        self.layout_methods = None
+        self.static_box = None
+
+        # Standalone Figure (no pyplot state), width leaves room for labels
+        self.fig = Figure(figsize=(16, 10))
+        FigureCanvasAgg(self.fig)
+        self.fig.patch.set_facecolor('#0a1929')
+        ax = self.ax = self.fig.add_subplot()
+        ax.set_facecolor('#0d1b2a')
+
+        self.bars, self.markers, self.low_labels, self.high_labels, self.base_labels = [], [], [], [], []
+        for y in range(n_rows):
+            self.bars.append(ax.barh(y, 1, left=0, height=0.6, edgecolor='white')[0])
+            self.markers.append(ax.plot(0, y, marker='D', markersize=12, color='white',
+                                        markeredgewidth=2, zorder=15)[0])
+            self.low_labels.append(ax.text(0, y, '', ha='right', va='center', fontsize=9,
+                                           color='#e0e1dd', fontweight='bold'))
+            self.high_labels.append(ax.text(0, y, '', ha='left', va='center', fontsize=9,
+                                            color='#e0e1dd', fontweight='bold'))
+            self.base_labels.append(ax.text(0, y + 0.45, '', ha='center', va='bottom', fontsize=10,
+                                            color='white', fontweight='bold',
+                                            bbox=dict(boxstyle='round,pad=0.3', facecolor='#778da9',
+                                                      edgecolor='white', linewidth=1)))
+
+        # Current price line
+        self.price_line = ax.axvline(0, color='#d62828', linewidth=3, linestyle='--', zorder=5)
+
+        # Offer range
+        offer_low, offer_high = RECOMMENDED_OFFER_RANGE
+        ax.axvspan(offer_low, offer_high, alpha=0.15, color='#06ffa5', zorder=1)
+        ax.text((offer_low + offer_high) / 2, n_rows - 0.5,
+               f'Recommended\nOffer Range\n${offer_low}-{offer_high}',
+               ha='center', va='top', fontsize=11, color='#06ffa5',
+               fontweight='bold',
+               bbox=dict(boxstyle='round,pad=0.5', facecolor='#0d1b2a', edgecolor='#06ffa5', linewidth=2))
+
+        # Labels and styling
+        ax.set_yticks(np.arange(n_rows))
+        ax.set_xlabel('Equity Value per Share ($)', fontsize=14, color='#e0e1dd', fontweight='bold')
+        ax.set_title('UHS VALUATION FOOTBALL FIELD\nComprehensive Valuation Across All Methodologies',
+                    fontsize=18, color='#4cc9f0', fontweight='bold', pad=20)
+
+        ax.grid(axis='x', alpha=0.3, linestyle='--', color='#778da9')
+        ax.set_axisbelow(True)
+
+        # X-axis range (extend left to prevent overlap with y-axis labels)
+        ax.set_xlim(150, 600)
+        # Fixed y-limits matching the autoscaled bar extents (weighted average bar at the bottom)
+        margin = 0.05 * (n_rows - 0.3)
+        ax.set_ylim(-0.4 - margin, n_rows - 0.7 + margin)
+
+        for spine in ax.spines.values():
+            spine.set_edgecolor('#2d3e50')
+            spine.set_linewidth(2)
+
+        ax.tick_params(axis='x', colors='#e0e1dd', labelsize=11)
+        ax.tick_params(axis='y', colors='#e0e1dd', pad=10)
+
+        self.legend = ax.legend(handles=[
+            mpatches.Patch(color='#d62828', label='Current Price'),
+            mpatches.Patch(color='#06ffa5', alpha=0.3, label=f'Recommended Offer Range: ${offer_low}-{offer_high}'),
+            mpatches.Patch(color='#ffba08', label='Weighted Average'),
+        ], loc='lower right', fontsize=11,
+            facecolor='#1b263b', edgecolor='#2d3e50', labelcolor='#e0e1dd', framealpha=0.95)
+
+        self.fig.text(0.5, 0.02, '🔒 CONFIDENTIAL & PROPRIETARY | ASCENDRA CAPITAL | October 2025',
+                      ha='center', fontsize=10, color='#778da9', style='italic')
+
+    def update(self, rows, weighted_avg, current_price):
+        """Move bars, markers and labels to the given rows (bottom-to-top order)"""
+
+        for y, row in rows.iterrows():
+            method, low, base, high = row['method'], row['low'], row['base'], row['high']
+            color = FOOTBALL_FIELD_COLORS.get(method, '#778da9')
+            highlight = method == 'WEIGHTED AVERAGE'
+            height = 0.8 if highlight else 0.6
+
+            bar = self.bars[y]
+            bar.set_bounds(low, y - height / 2, high - low, height)
+            bar.set_facecolor(color)
+            bar.set_alpha(0.9 if highlight else 0.7)
+            bar.set_linewidth(3 if highlight else 1.5)
+            bar.set_zorder(10 if highlight else 1)
+
+            self.markers[y].set_data([base], [y])
+            self.markers[y].set_markeredgecolor(color)
+
+            self.low_labels[y].set_position((low - 10, y))
+            self.low_labels[y].set_text(f'${low:.0f}')
+            self.high_labels[y].set_position((high + 10, y))
+            self.high_labels[y].set_text(f'${high:.0f}')
+            self.base_labels[y].set_position((base, y + 0.45))
+            self.base_labels[y].set_text(f'${base:.0f}')
+            self.base_labels[y].get_bbox_patch().set_facecolor(color)
+
+        self.ax.set_yticklabels(rows['method'], fontsize=12, color='#e0e1dd', fontweight='bold')
+        self.price_line.set_xdata([current_price, current_price])
+
+        legend_text = self.legend.get_texts()
+        legend_text[0].set_text(f'Current Price: ${current_price:.2f}')
+        legend_text[2].set_text(f'Weighted Average: ${weighted_avg["base"]:.0f} '
+                                f'(P10-P90 ${weighted_avg["low"]:.0f}-${weighted_avg["high"]:.0f})')
+
+        # Layout depends only on the static artists and method labels, so it
+        # is computed once per set of methods with the value labels hidden;
+        # the same rows then render identically whatever was drawn before
+        methods = tuple(rows['method'])
+        if methods != self.layout_methods:
+            for text in self.value_labels:
+                text.set_visible(False)
+            self.fig.tight_layout(rect=[0.05, 0.03, 1, 0.97])
+            self.static_box = self.fig.get_tightbbox()
+            for text in self.value_labels:
+                text.set_visible(True)
+            self.layout_methods = methods
+
+    @property
+    def value_labels(self):
+        return self.low_labels + self.high_labels + self.base_labels
+
+    def crop_box(self):
+        """
+        Tight crop (inches): fixed extent of the static artists plus the
+        current value labels, which can fall outside the axes for wide ranges
+        """
+
+        renderer = self.fig.canvas.get_renderer()
+        labels = Bbox.union([text.get_window_extent(renderer) for text in self.value_labels])
+        labels = labels.transformed(self.fig.dpi_scale_trans.inverted())
+        return Bbox.union([self.static_box, labels]).padded(0.1)
+
+    def render(self, fmt='png', dpi=300):
+        buffer = io.BytesIO()
+        self.fig.savefig(buffer, format=fmt, dpi=dpi, facecolor='#0a1929', edgecolor='none',
+                         bbox_inches=self.crop_box())
+        return buffer.getvalue()
+
+# Templates are mutable and shared by every caller (e.g. Streamlit session
+# threads), so update + render runs under one lock
+_FIGURE_TEMPLATES = {}
+_TEMPLATE_LOCK = threading.Lock()
+
+@lru_cache(maxsize=32)
+def _render_rows(rows, weighted_avg, current_price, fmt, dpi):
+    """Rendered bytes for hashable (method, low, base, high) rows, LRU-cached"""
+
+    rows = pd.DataFrame(list(rows), columns=['method', 'low', 'base', 'high'])
+    weighted_avg = dict(zip(['low', 'base', 'high'], weighted_avg))
+
+    with _TEMPLATE_LOCK:
+        if len(rows) not in _FIGURE_TEMPLATES:
+            _FIGURE_TEMPLATES[len(rows)] = FootballFieldTemplate(len(rows))
+        template = _FIGURE_TEMPLATES[len(rows)]
+        template.update(rows, weighted_avg, current_price)
+        return template.render(fmt, dpi)
+
+def render_football_field(valuations_df, weighted_avg, current_price=225.30, fmt='png', dpi=300):
+    """
+    Football field chart as PNG / SVG bytes
+
+    Bytes for the most recent 32 (values, price, format, dpi) combinations
+    are kept in an LRU cache, so unchanged scenarios are never re-rendered;
+    new ones reuse the figure template for their row count.
+    """
+
+    rows = football_field_rows(valuations_df, weighted_avg)
+    return _render_rows(
+        tuple((method, float(low), float(base), float(high)) for method, low, base, high in rows.itertuples(index=False)),
+        tuple(float(weighted_avg[case]) for case in ['low', 'base', 'high']),
+        float(current_price), fmt, dpi,
+    )
+
+def create_football_field_chart(valuations_df, weighted_avg, current_price=225.30,
+                                output_paths=('data/graphs/football_field_valuation.png',
+                                              'football_field_valuation.png')):
     """
     Create professional football field valuation chart
 
@@ -188,135 +546,19 @@ def create_football_field_chart(valuations_df, weighted_avg, current_price=225.3
     - Base case marker
     - Current price line
     - Weighted average highlighted
-    """
-
-    # Set up figure with Ascendra color scheme (increased width for labels)
-    fig, ax = plt.subplots(figsize=(16, 10))
-    fig.patch.set_facecolor('#0a1929')
-    ax.set_facecolor('#0d1b2a')
-
-    # Color scheme
-    colors = {
-        'SOTP (4-Part)': '#4cc9f0',
-        'DCF (10-Year)': '#3a86ff',
-        'LBO Analysis': '#7209b7',
-        'Comparable Companies': '#f72585',
-        'Precedent Transactions': '#06ffa5',
-        'WEIGHTED AVERAGE': '#ffba08',
-    }
 
-    # Add weighted average to dataframe
-    weighted_row = pd.DataFrame([weighted_avg])
-    full_df = pd.concat([valuations_df, weighted_row], ignore_index=True)
-
-    # Reverse order for plotting (top to bottom)
-    full_df = full_df.iloc[::-1].reset_index(drop=True)
-
-    y_positions = np.arange(len(full_df))
-
-    # Plot horizontal bars
-    for idx, row in full_df.iterrows():
-        method = row['method']
-        low = row['low']
-        base = row['base']
-        high = row['high']
+    Renders through render_football_field() and writes the PNG to each
+    output path. Returns the PNG bytes.
+    """
 
-        # Bar width
-        bar_width = 0.6 if method != 'WEIGHTED AVERAGE' else 0.8
+    png = render_football_field(valuations_df, weighted_avg, current_price, fmt='png')
 
-        # Color
-        color = colors.get(method, '#778da9')
+    for path in output_paths:
+        with open(path, 'wb') as f:
+            f.write(png)
+        print(f"✓ Saved: {path}")
 
-        # Bar from low to high
-        bar_length = high - low
-
-        # Draw bar
-        if method == 'WEIGHTED AVERAGE':
-            # Highlight weighted average
-            ax.barh(y_positions[idx], bar_length, left=low, height=bar_width,
-                   color=color, alpha=0.9, edgecolor='white', linewidth=3, zorder=10)
-        else:
-            ax.barh(y_positions[idx], bar_length, left=low, height=bar_width,
-                   color=color, alpha=0.7, edgecolor='white', linewidth=1.5)
-
-        # Mark base case
-        ax.plot(base, y_positions[idx], marker='D', markersize=12, color='white',
-               markeredgecolor=color, markeredgewidth=2, zorder=15)
-
-        # Add value labels
-        # Low
-        ax.text(low - 10, y_positions[idx], f'${low:.0f}',
-               ha='right', va='center', fontsize=9, color='#e0e1dd', fontweight='bold')
-        # High
-        ax.text(high + 10, y_positions[idx], f'${high:.0f}',
-               ha='left', va='center', fontsize=9, color='#e0e1dd', fontweight='bold')
-        # Base (above bar)
-        ax.text(base, y_positions[idx] + 0.45, f'${base:.0f}',
-               ha='center', va='bottom', fontsize=10, color='white', fontweight='bold',
-               bbox=dict(boxstyle='round,pad=0.3', facecolor=color, edgecolor='white', linewidth=1))
-
-    # Current price line
-    ax.axvline(current_price, color='#d62828', linewidth=3, linestyle='--',
-              label=f'Current Price: ${current_price:.2f}', zorder=5)
-
-    # Offer range (recommended $425-475) - UPDATED Oct 31, 2025 with Behavioral Premium
-    offer_low = 425
-    offer_high = 475
-    ax.axvspan(offer_low, offer_high, alpha=0.15, color='#06ffa5', zorder=1)
-    ax.text((offer_low + offer_high) / 2, len(full_df) - 0.5,
-           'Recommended\nOffer Range\n$425-475',
-           ha='center', va='top', fontsize=11, color='#06ffa5',
-           fontweight='bold',
-           bbox=dict(boxstyle='round,pad=0.5', facecolor='#0d1b2a', edgecolor='#06ffa5', linewidth=2))
-
-    # Labels and styling
-    ax.set_yticks(y_positions)
-    ax.set_yticklabels(full_df['method'], fontsize=12, color='#e0e1dd', fontweight='bold')
-
-    ax.set_xlabel('Equity Value per Share ($)', fontsize=14, color='#e0e1dd', fontweight='bold')
-    ax.set_title('UHS VALUATION FOOTBALL FIELD\nComprehensive Valuation Across All Methodologies',
-                fontsize=18, color='#4cc9f0', fontweight='bold', pad=20)
-
-    # Grid
-    ax.grid(axis='x', alpha=0.3, linestyle='--', color='#778da9')
-    ax.set_axisbelow(True)
-
-    # X-axis range (extend left to prevent overlap with y-axis labels)
-    ax.set_xlim(150, 600)
-
-    # Spine colors
-    for spine in ax.spines.values():
-        spine.set_edgecolor('#2d3e50')
-        spine.set_linewidth(2)
-
-    # Tick colors with more padding
-    ax.tick_params(axis='x', colors='#e0e1dd', labelsize=11)
-    ax.tick_params(axis='y', colors='#e0e1dd', pad=10)  # Added padding for y-axis labels
-
-    # Legend
-    legend_elements = [
-        mpatches.Patch(color='#d62828', label=f'Current Price: ${current_price:.2f}'),
-        mpatches.Patch(color='#06ffa5', alpha=0.3, label='Recommended Offer Range: $425-475'),
-        mpatches.Patch(color='#ffba08', label=f'Weighted Average: ${weighted_avg["base"]:.0f}'),
-    ]
-    ax.legend(handles=legend_elements, loc='lower right', fontsize=11,
-             facecolor='#1b263b', edgecolor='#2d3e50', labelcolor='#e0e1dd', framealpha=0.95)
-
-    # Add footer
-    fig.text(0.5, 0.02, '🔒 CONFIDENTIAL & PROPRIETARY | ASCENDRA CAPITAL | October 2025',
-            ha='center', fontsize=10, color='#778da9', style='italic')
-
-    # Adjust layout to prevent y-axis label overlap
-    plt.tight_layout(rect=[0.05, 0.03, 1, 0.97])  # Add left margin for y-axis labels
-
-    # Save
-    plt.savefig('data/graphs/football_field_valuation.png', dpi=300, facecolor='#0a1929', edgecolor='none', bbox_inches='tight')
-    print("✓ Saved: data/graphs/football_field_valuation.png")
-
-    plt.savefig('football_field_valuation.png', dpi=300, facecolor='#0a1929', edgecolor='none', bbox_inches='tight')
-    print("✓ Saved: football_field_valuation.png (root folder)")
-
-    plt.show()
+    return png
 
 # ============================================================================
 # STEP 4: GENERATE SUMMARY TABLE
@@ -367,12 +609,15 @@ def generate_football_field_report():
     print("STEP 2: CALCULATING WEIGHTED AVERAGE")
     print("-" * 80)
 
-    weighted_avg = calculate_weighted_average(valuations_df)
-
-    print(f"Weighted Average Valuation:")
-    print(f"  Low:  ${weighted_avg['low']:.2f}")
-    print(f"  Base: ${weighted_avg['base']:.2f}")
-    print(f"  High: ${weighted_avg['high']:.2f}")
+    current_price = 225.30  # Updated Oct 29, 2025
+    weighted_avg = calculate_weighted_average(valuations_df, current_price=current_price)
+
+    print(f"Blended Valuation (simulated ranges and Dirichlet weights):")
+    print(f"  Low (P10):  ${weighted_avg['low']:.2f}")
+    print(f"  Base (P50): ${weighted_avg['base']:.2f}")
+    print(f"  High (P90): ${weighted_avg['high']:.2f}")
+    print(f"  Fixed-weight base case:           ${weighted_avg['point_estimate']:.2f}")
+    print(f"  Probability above ${current_price:.2f}:    {weighted_avg['prob_above_price']:.1%}")
     print()
 
     # Summary table
@@ -387,7 +632,6 @@ def generate_football_field_report():
     print("STEP 4: KEY INSIGHTS")
     print("-" * 80)
 
-    current_price = 225.30  # Updated Oct 29, 2025
     median_base = valuations_df['base'].median()
 
     print(f"Current Market Price:        ${current_price:.2f}")
@@ -434,6 +678,7 @@ def generate_football_field_report():
         'recommended_offer_low': 425,
         'recommended_offer_high': 475,
         'upside_to_weighted_avg': ((weighted_avg['base'] - current_price) / current_price * 100),
+        'prob_above_current_price': weighted_avg['prob_above_price'],
     }
 
     master_df = pd.DataFrame([master_summary])
@@ -16,10 +16,19 @@ Author: Hill Valley Investment Team
 Date: October 29, 2025
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 import numpy as np
 import json
 from datetime import datetime
+from scipy.special import ndtr
+
+from dcf_valuation_model import default_dcf_assumptions
+from sotp_kernel import default_sotp_capital_structure
+from utils.labeled_cube import LabeledCube
+from utils.streaming_stats import StreamingHistogram
 
 # ============================================================================
 # STEP 1: LOAD UHS BASELINE DATA
@@ -277,6 +286,268 @@ def calculate_cost_synergies(baseline):
 
     return synergies
 
+# ============================================================================
+# STEP 2B: STOCHASTIC COST SYNERGIES (Monte Carlo realization)
+# ============================================================================
+
+SYNERGY_CATEGORIES = ['corporate_overhead', 'procurement', 'it_systems',
+                      'facility_rationalization', 'other_efficiencies']
+
+def synergy_ramp_schedule(cost_synergies, n_years=5, cost_phasing=(1.0,)):
+    """
+    Planned savings, ramp and implementation cost as arrays
+
+    Returns annual_savings (C,), implementation_cost (C,), the ramp
+    knots: ramp_years (n_years + 1,) = 0..n_years and ramp (C, n_years + 1)
+    with the year_N_run_rate fractions (0 at close, 1.0 once a category
+    has no later year listed), and cost_phasing (n_years,): the share of
+    implementation cost spent in each year (default all in year 1).
+    """
+
+    phasing = np.zeros(n_years)
+    phasing[:len(cost_phasing)] = cost_phasing
+
+    ramp = np.ones((len(SYNERGY_CATEGORIES), n_years + 1))
+    ramp[:, 0] = 0.0
+    for c, category in enumerate(SYNERGY_CATEGORIES):
+        synergy = cost_synergies[category]
+        for year in range(1, n_years + 1):
+            ramp[c, year] = synergy.get(f'year_{year}_run_rate', ramp[c, year - 1] if year > 1 else 1.0)
+
+    return {
+        'categories': list(SYNERGY_CATEGORIES),
+        'annual_savings': np.array([cost_synergies[c]['annual_savings'] for c in SYNERGY_CATEGORIES]),
+        'implementation_cost': np.array([cost_synergies[c]['implementation_cost'] for c in SYNERGY_CATEGORIES]),
+        'ramp_years': np.arange(n_years + 1, dtype=float),
+        'ramp': ramp,
+        'cost_phasing': phasing,
+    }
+
+def default_synergy_monte_carlo_config():
+    """
+    Execution risk by synergy category
+
+    - realization_mean / realization_std: share of planned run-rate
+      savings actually achieved (normal, floored at 0, capped at
+      max_realization)
+    - slippage_months: mean delay of the whole ramp (exponential)
+    - overrun_median / overrun_sigma: lognormal multiplier on
+      implementation cost
+
+    A common execution factor (loading sqrt(execution_correlation)) ties
+    categories together: weak execution lowers realization and raises
+    slippage and overruns everywhere at once. Headcount and procurement
+    savings are the most bankable; IT consolidation and "other"
+    efficiencies carry the widest ranges, per typical healthcare M&A
+    experience.
+    """
+
+    return {
+        'categories': {
+            'corporate_overhead': {'realization_mean': 0.95, 'realization_std': 0.10,
+                                   'slippage_months': 3, 'overrun_median': 1.05, 'overrun_sigma': 0.15},
+            'procurement': {'realization_mean': 0.85, 'realization_std': 0.20,
+                            'slippage_months': 4, 'overrun_median': 1.05, 'overrun_sigma': 0.20},
+            'it_systems': {'realization_mean': 0.75, 'realization_std': 0.25,
+                           'slippage_months': 9, 'overrun_median': 1.20, 'overrun_sigma': 0.35},
+            'facility_rationalization': {'realization_mean': 0.80, 'realization_std': 0.30,
+                                         'slippage_months': 6, 'overrun_median': 1.10, 'overrun_sigma': 0.30},
+            'other_efficiencies': {'realization_mean': 0.70, 'realization_std': 0.25,
+                                   'slippage_months': 6, 'overrun_median': 1.10, 'overrun_sigma': 0.25},
+        },
+        'execution_correlation': 0.4,
+        'max_realization': 1.25,
+    }
+
+def sample_synergy_execution(n_paths, config, rng):
+    """Draw realization (n, C), slippage in years (n, C) and cost overrun (n, C)"""
+
+    params = pd.DataFrame(config['categories']).T.loc[SYNERGY_CATEGORIES]
+    rho = config['execution_correlation']
+    n_categories = len(SYNERGY_CATEGORIES)
+
+    execution = rng.standard_normal((n_paths, 1, 1))
+    z = np.sqrt(rho) * execution + np.sqrt(1 - rho) * rng.standard_normal((n_paths, 3, n_categories))
+
+    realization = np.clip(params['realization_mean'].values + params['realization_std'].values * z[:, 0],
+                          0.0, config['max_realization'])
+
+    # Weak execution (low factor) -> later ramp and larger overruns
+    slippage = -params['slippage_months'].values / 12 * np.log(ndtr(z[:, 1]))
+    overrun = params['overrun_median'].values * np.exp(-params['overrun_sigma'].values * z[:, 2])
+
+    return realization, slippage, overrun
+
+def synergy_cash_flow_paths(schedule, realization, slippage, overrun):
+    """
+    Savings and implementation costs (paths, categories, years) for a batch of paths
+
+    Each category's planned ramp is shifted right by its slippage (years,
+    interpolated between year knots) and scaled by its realization;
+    implementation cost x overrun is spent on the schedule's cost phasing.
+    Realization 1, slippage 0 and overrun 1 reproduce the plan.
+    """
+
+    years = schedule['ramp_years'][1:]
+    n_paths, n_categories = realization.shape
+
+    ramp = np.empty((n_paths, n_categories, len(years)))
+    for c in range(n_categories):
+        ramp[:, c, :] = np.interp(years - slippage[:, c, None], schedule['ramp_years'], schedule['ramp'][c])
+
+    savings = (schedule['annual_savings'] * realization)[:, :, None] * ramp
+    costs = (schedule['implementation_cost'] * overrun)[:, :, None] * schedule['cost_phasing']
+
+    return savings, costs
+
+def synergy_present_value(net_cash_flows, terminal_run_rate, discount_rate, multiple):
+    """
+    PV of yearly net synergy cash flows plus the capitalized terminal run-rate
+
+    net_cash_flows (..., years) is discounted at discount_rate; the final
+    year run-rate is capitalized at multiple (EBITDA basis) and discounted
+    from the final year. discount_rate and multiple broadcast against the
+    leading dimensions, so one call values any grid.
+
+    Returns (pv_cash_flows, pv_terminal)
+    """
+
+    discount_rate = np.asarray(discount_rate, dtype=float)
+    years = np.arange(1, np.shape(net_cash_flows)[-1] + 1)
+    discount = (1 + discount_rate[..., None]) ** -years
+
+    pv_cash_flows = (net_cash_flows * discount).sum(axis=-1)
+    pv_terminal = np.multiply(multiple, terminal_run_rate) * discount[..., -1]
+    return pv_cash_flows, pv_terminal
+
+def synergy_path_values(schedule, realization, slippage, overrun, discount_rate, multiple, shares,
+                        run_rate_year=3):
+    """Savings, costs, run-rates and NPV for a batch of execution paths"""
+
+    savings, costs = synergy_cash_flow_paths(schedule, realization, slippage, overrun)
+
+    run_rate = savings[:, :, -1].sum(axis=1)
+    pv_cash_flows, pv_terminal = synergy_present_value((savings - costs).sum(axis=1), run_rate,
+                                                       discount_rate, multiple)
+    npv = pv_cash_flows + pv_terminal
+
+    return {
+        'savings': savings,
+        'costs': costs,
+        'run_rate_savings': savings[:, :, run_rate_year - 1].sum(axis=1),
+        'terminal_run_rate': run_rate,
+        'npv': npv,
+        'value_per_share': npv / shares,
+    }
+
+# Fixed sketch ranges ($M, $/share) so chunk results from different workers can be merged
+SYNERGY_MC_RUN_RATE_RANGE = (0.0, 1_000.0)
+SYNERGY_MC_NPV_RANGE = (-1_000.0, 10_000.0)
+SYNERGY_MC_PER_SHARE_RANGE = (-20.0, 160.0)
+
+def _synergy_monte_carlo_chunk(task):
+    """Simulate one chunk of execution paths and return mergeable aggregates"""
+
+    seed_seq, n, schedule, config, discount_rate, multiple, shares, run_rate_year, threshold = task
+    rng = np.random.default_rng(seed_seq)
+    realization, slippage, overrun = sample_synergy_execution(n, config, rng)
+
+    paths = synergy_path_values(schedule, realization, slippage, overrun,
+                                discount_rate, multiple, shares, run_rate_year)
+
+    sketches = {}
+    for name, value_range in [('run_rate_savings', SYNERGY_MC_RUN_RATE_RANGE),
+                              ('npv', SYNERGY_MC_NPV_RANGE),
+                              ('value_per_share', SYNERGY_MC_PER_SHARE_RANGE)]:
+        sketches[name] = StreamingHistogram(value_range=value_range)
+        sketches[name].update(paths[name])
+
+    return {
+        **sketches,
+        'category_run_rate': paths['savings'][:, :, run_rate_year - 1].sum(axis=0),
+        'implementation_cost': paths['costs'].sum(axis=(0, 2)),
+        'meets_threshold': int((paths['run_rate_savings'] >= threshold).sum()),
+        'npv_negative': int((paths['npv'] < 0).sum()),
+    }
+
+def synergy_monte_carlo(cost_synergies, n_paths=1_000_000, chunk_size=100_000, seed=42, n_workers=None,
+                        config=None, discount_rate=None, multiple=10.0, n_years=5, cost_phasing=(1.0,),
+                        run_rate_year=3, confidence_threshold=0.80,
+                        percentiles=(0.05, 0.10, 0.25, 0.50, 0.75, 0.90, 0.95)):
+    """
+    Monte Carlo of cost synergy realization, timing slippage and cost overruns
+
+    Paths run in vectorized chunks over a process pool (n_workers=None
+    uses all cores, 1 runs in-process) with one child seed per chunk, so
+    results do not depend on the worker count. Discount rate defaults to
+    the DCF base WACC.
+
+    'confidence' is the probability that year-run_rate_year run-rate
+    savings reach confidence_threshold x plan, the input for the
+    Synergy Implementation Confidence gauge.
+    """
+
+    config = config or default_synergy_monte_carlo_config()
+    discount_rate = default_dcf_assumptions()['wacc'] if discount_rate is None else discount_rate
+    shares = default_sotp_capital_structure()['shares_outstanding']
+    schedule = synergy_ramp_schedule(cost_synergies, n_years, cost_phasing)
+
+    # Plan: full realization, no slippage, no overruns
+    n_categories = len(SYNERGY_CATEGORIES)
+    plan = synergy_path_values(schedule, np.ones((1, n_categories)), np.zeros((1, n_categories)),
+                               np.ones((1, n_categories)), discount_rate, multiple, shares, run_rate_year)
+    planned_run_rate = float(plan['run_rate_savings'][0])
+    threshold = confidence_threshold * planned_run_rate
+
+    sizes = [min(chunk_size, n_paths - start) for start in range(0, n_paths, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(s, n, schedule, config, discount_rate, multiple, shares, run_rate_year, threshold)
+             for s, n in zip(seeds, sizes)]
+
+    n_workers = n_workers or os.cpu_count() or 1
+    if n_workers == 1 or len(tasks) == 1:
+        chunks = [_synergy_monte_carlo_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(n_workers, len(tasks))) as pool:
+            chunks = list(pool.map(_synergy_monte_carlo_chunk, tasks))
+
+    results = {
+        'n_paths': n_paths,
+        'seed': seed,
+        'discount_rate': discount_rate,
+        'multiple': multiple,
+        'planned_run_rate_savings': planned_run_rate,
+        'planned_npv': float(plan['npv'][0]),
+        'planned_value_per_share': float(plan['value_per_share'][0]),
+    }
+
+    for name, value_range in [('run_rate_savings', SYNERGY_MC_RUN_RATE_RANGE),
+                              ('npv', SYNERGY_MC_NPV_RANGE),
+                              ('value_per_share', SYNERGY_MC_PER_SHARE_RANGE)]:
+        sketch = StreamingHistogram(value_range=value_range)
+        for chunk in chunks:
+            sketch.merge(chunk[name])
+        results[f'{name}_mean'] = sketch.mean
+        results[f'{name}_percentiles'] = dict(zip(percentiles, sketch.quantile(percentiles)))
+        if name == 'value_per_share':
+            results['value_per_share_histogram'] = sketch.histogram()
+
+    results['category_summary'] = pd.DataFrame({
+        'planned_run_rate': plan['savings'][0, :, run_rate_year - 1],
+        'expected_run_rate': sum(c['category_run_rate'] for c in chunks) / n_paths,
+        'planned_implementation_cost': schedule['implementation_cost'],
+        'expected_implementation_cost': sum(c['implementation_cost'] for c in chunks) / n_paths,
+    }, index=pd.Index(SYNERGY_CATEGORIES, name='category'))
+    results['category_summary']['expected_realization'] = (
+        results['category_summary']['expected_run_rate'] / results['category_summary']['planned_run_rate']
+    )
+
+    results['confidence_threshold'] = confidence_threshold
+    results['confidence'] = sum(c['meets_threshold'] for c in chunks) / n_paths
+    results['prob_npv_negative'] = sum(c['npv_negative'] for c in chunks) / n_paths
+
+    return results
+
 # ============================================================================
 # STEP 3: MODEL REVENUE SYNERGIES (UPSIDE)
 # ============================================================================
@@ -326,43 +597,32 @@ def calculate_revenue_synergies(baseline):
 # STEP 4: PRO-FORMA FINANCIALS WITH SYNERGIES
 # ============================================================================
 
-def build_proforma_financials(baseline, cost_synergies, revenue_synergies_total):
-    """Build 3-year pro-forma P&L with synergies"""
+def build_proforma_financials(baseline, cost_synergies, revenue_synergies_total, n_years=3):
+    """Build pro-forma P&L with synergies (cost synergies from synergy_plan_cash_flows)"""
 
-    years = ['Year 0 (Current)', 'Year 1', 'Year 2', 'Year 3']
+    years = ['Year 0 (Current)'] + [f'Year {t}' for t in range(1, n_years + 1)]
 
-    # Revenue (assume 3% organic growth)
+    # Revenue and baseline EBITDA (assume 3% organic growth)
     revenue_growth = 0.03
-    revenue = [baseline['revenue']]
-    for i in range(3):
-        revenue.append(revenue[-1] * (1 + revenue_growth))
-
-    # EBITDA (baseline + synergies)
-    baseline_ebitda = [baseline['total_ebitda']]
-    for i in range(3):
-        baseline_ebitda.append(baseline_ebitda[-1] * (1 + revenue_growth))
-
-    # Cost synergies by year
-    cost_synergy_impact = [
-        0,
-        cost_synergies['total']['year_1_savings'],
-        cost_synergies['total']['year_2_savings'],
-        cost_synergies['total']['year_3_savings'],
-    ]
-
-    # Pro-forma EBITDA
-    proforma_ebitda = [baseline_ebitda[i] + cost_synergy_impact[i] for i in range(4)]
-
-    # EBITDA margins
-    ebitda_margin = [proforma_ebitda[i] / revenue[i] for i in range(4)]
-
-    # Build DataFrame
+    growth = (1 + revenue_growth) ** np.arange(n_years + 1)
+    revenue = baseline['revenue'] * growth
+    baseline_ebitda = baseline['total_ebitda'] * growth
+
+    # Cost synergies and implementation costs by year (none in Year 0)
+    plan = synergy_plan_cash_flows(cost_synergies, n_years=n_years)
+    cost_synergy_impact = np.concatenate([[0.0], plan['savings'].sum(axis=0)])
+    implementation_costs = np.concatenate([[0.0], plan['costs'].sum(axis=0)])
+
+    # Pro-forma EBITDA (implementation costs treated as one-time, below EBITDA)
+    proforma_ebitda = baseline_ebitda + cost_synergy_impact
+
     proforma = pd.DataFrame({
         'Revenue': revenue,
         'Baseline EBITDA': baseline_ebitda,
         'Cost Synergies': cost_synergy_impact,
         'Pro-Forma EBITDA': proforma_ebitda,
-        'EBITDA Margin %': [m * 100 for m in ebitda_margin],
+        'EBITDA Margin %': proforma_ebitda / revenue * 100,
+        'Implementation Costs': implementation_costs,
     }, index=years)
 
     return proforma
@@ -371,25 +631,85 @@ def build_proforma_financials(baseline, cost_synergies, revenue_synergies_total)
 # STEP 5: SYNERGY VALUE CREATION
 # ============================================================================
 
-def calculate_synergy_value(cost_synergies, multiple=10.0):
+def synergy_plan_cash_flows(cost_synergies, n_years=5, cost_phasing=(1.0,)):
+    """
+    Planned (full realization, on-time, on-budget) synergy cash flows
+
+    Returns the schedule plus savings and costs by category x year,
+    net cash flow by year and the final-year run-rate ($M).
+    """
+
+    schedule = synergy_ramp_schedule(cost_synergies, n_years, cost_phasing)
+    n_categories = len(schedule['categories'])
+    savings, costs = synergy_cash_flow_paths(schedule, np.ones((1, n_categories)),
+                                             np.zeros((1, n_categories)), np.ones((1, n_categories)))
+
+    return {
+        'schedule': schedule,
+        'savings': savings[0],
+        'costs': costs[0],
+        'net_cash_flows': (savings[0] - costs[0]).sum(axis=0),
+        'terminal_run_rate': savings[0, :, -1].sum(),
+    }
+
+def synergy_valuation_grid(cost_synergies, discount_rates, multiples, n_years=5, cost_phasing=(1.0,)):
+    """
+    Time-phased synergy value over every discount rate x capitalization multiple
+
+    Value = PV of the year-by-year ramp net of implementation costs
+    + final-year run-rate x multiple, discounted. One broadcast call
+    covers the full grid; per-share values use the SOTP share count.
+    """
+
+    plan = synergy_plan_cash_flows(cost_synergies, n_years, cost_phasing)
+    shares = default_sotp_capital_structure()['shares_outstanding']
+
+    coords = {
+        'discount_rate': np.atleast_1d(np.asarray(discount_rates, dtype=float)),
+        'multiple': np.atleast_1d(np.asarray(multiples, dtype=float)),
+    }
+    pv_cash_flows, pv_terminal = synergy_present_value(
+        plan['net_cash_flows'], plan['terminal_run_rate'],
+        coords['discount_rate'][:, None], coords['multiple'][None, :],
+    )
+    pv_savings, _ = synergy_present_value(plan['savings'].sum(axis=0), 0.0, coords['discount_rate'][:, None], 0.0)
+    total_value = pv_cash_flows + pv_terminal
+
+    return LabeledCube(['discount_rate', 'multiple'], coords, {
+        'pv_savings': pv_savings,
+        'pv_implementation_costs': pv_savings - pv_cash_flows,
+        'pv_terminal_value': pv_terminal,
+        'total_synergy_value': total_value,
+        'synergy_value_per_share': total_value / shares,
+    })
+
+def calculate_synergy_value(cost_synergies, multiple=10.0, discount_rate=None, n_years=5):
     """
     Value created from synergies
 
-    Synergy Value = Annual Run-Rate Savings × EBITDA Multiple
+    Synergy Value = PV of ramping savings net of implementation costs
+                    + Terminal Run-Rate × EBITDA Multiple (discounted from year n_years)
 
     Multiple: 10x (conservative for healthcare services)
+    Discount rate: DCF base WACC unless given
     """
 
+    discount_rate = default_dcf_assumptions()['wacc'] if discount_rate is None else discount_rate
     annual_run_rate = cost_synergies['total']['total_annual_savings']
 
-    synergy_value = annual_run_rate * multiple
-    synergy_value_per_share = synergy_value / 64.98  # 65M shares
+    value = synergy_valuation_grid(cost_synergies, discount_rate, multiple, n_years).sel(
+        discount_rate=discount_rate, multiple=multiple)
 
     return {
         'annual_run_rate_savings': annual_run_rate,
         'multiple': multiple,
-        'total_synergy_value': synergy_value,
-        'synergy_value_per_share': synergy_value_per_share,
+        'discount_rate': discount_rate,
+        'pv_savings': float(value['pv_savings']),
+        'pv_implementation_costs': float(value['pv_implementation_costs']),
+        'pv_terminal_value': float(value['pv_terminal_value']),
+        'total_synergy_value': float(value['total_synergy_value']),
+        'synergy_value_per_share': float(value['synergy_value_per_share']),
+        'undiscounted_run_rate_value': annual_run_rate * multiple,
     }
 
 # ============================================================================
@@ -467,11 +787,40 @@ def generate_synergies_report():
     print("-" * 80)
     synergy_value = calculate_synergy_value(cost_synergies, multiple=10.0)
     print(f"Annual Run-Rate Savings:       ${synergy_value['annual_run_rate_savings']:.0f}M")
-    print(f"Applied Multiple:              {synergy_value['multiple']:.1f}x")
-    print(f"Total Synergy Value:           ${synergy_value['total_synergy_value']:,.0f}M")
+    print(f"Applied Multiple:              {synergy_value['multiple']:.1f}x (terminal run-rate)")
+    print(f"Discount Rate:                 {synergy_value['discount_rate']:.1%}")
+    print(f"PV of Ramp Savings:            ${synergy_value['pv_savings']:,.0f}M")
+    print(f"PV of Implementation Costs:    (${synergy_value['pv_implementation_costs']:,.0f}M)")
+    print(f"PV of Terminal Run-Rate:       ${synergy_value['pv_terminal_value']:,.0f}M")
+    print(f"Total Synergy Value:           ${synergy_value['total_synergy_value']:,.0f}M "
+          f"(flat {synergy_value['multiple']:.0f}x: ${synergy_value['undiscounted_run_rate_value']:,.0f}M)")
     print(f"Synergy Value Per Share:       ${synergy_value['synergy_value_per_share']:.2f}")
     print()
 
+    value_grid = synergy_valuation_grid(cost_synergies, [0.075, 0.080, 0.085, 0.090, 0.095], [8.0, 9.0, 10.0, 11.0, 12.0])
+    print("Synergy Value Per Share (discount rate x multiple):")
+    print(value_grid.pivot('synergy_value_per_share', 'discount_rate', 'multiple').round(2).to_string())
+    print()
+
+    # Stochastic realization
+    print("STEP 4B: SYNERGY REALIZATION MONTE CARLO")
+    print("-" * 80)
+    monte_carlo = synergy_monte_carlo(cost_synergies)
+    print(f"Paths: {monte_carlo['n_paths']:,} (discount rate {monte_carlo['discount_rate']:.1%}, "
+          f"{monte_carlo['multiple']:.1f}x terminal run-rate)")
+    print(f"Planned Year 3 Run-Rate:       ${monte_carlo['planned_run_rate_savings']:.0f}M")
+    print(f"Expected Year 3 Run-Rate:      ${monte_carlo['run_rate_savings_mean']:.0f}M")
+    for label, name, fmt in [('Run-Rate Savings ($M)', 'run_rate_savings', '${:,.0f}M'),
+                             ('Synergy NPV ($M)', 'npv', '${:,.0f}M'),
+                             ('Value Per Share', 'value_per_share', '${:,.2f}')]:
+        p = monte_carlo[f'{name}_percentiles']
+        print(f"{label:<30} P10 {fmt.format(p[0.10]):>9}   P50 {fmt.format(p[0.50]):>9}   P90 {fmt.format(p[0.90]):>9}")
+    print(f"Synergy Confidence:            {monte_carlo['confidence']:.1%} "
+          f"(P[run-rate >= {monte_carlo['confidence_threshold']:.0%} of plan])")
+    print()
+    print(monte_carlo['category_summary'].round(2).to_string())
+    print()
+
     # Combined valuation
     print("STEP 5: COMBINED VALUATION (BASE + SYNERGIES)")
     print("-" * 80)
@@ -503,11 +852,16 @@ def generate_synergies_report():
         'revenue_synergies_annual': revenue_total,
         'total_synergies_annual': total['total_annual_savings'] + revenue_total,
         'implementation_cost': total['total_implementation_cost'],
-        'synergy_value_at_10x': synergy_value['total_synergy_value'],
+        'synergy_value_time_phased': synergy_value['total_synergy_value'],
+        'undiscounted_run_rate_value': synergy_value['undiscounted_run_rate_value'],
         'synergy_value_per_share': synergy_value['synergy_value_per_share'],
         'base_fair_value': base_fair_value,
         'combined_fair_value': combined_value,
         'upside_pct': ((combined_value - 208.39) / 208.39 * 100),
+        'synergy_confidence_pct': monte_carlo['confidence'] * 100,
+        'synergy_value_per_share_p10': monte_carlo['value_per_share_percentiles'][0.10],
+        'synergy_value_per_share_p50': monte_carlo['value_per_share_percentiles'][0.50],
+        'synergy_value_per_share_p90': monte_carlo['value_per_share_percentiles'][0.90],
     }
 
     summary_df = pd.DataFrame([summary])
@@ -524,6 +878,7 @@ def generate_synergies_report():
         'revenue_synergies': revenue_synergies,
         'proforma': proforma,
         'synergy_value': synergy_value,
+        'monte_carlo': monte_carlo,
         'combined_value': combined_value,
     }
 
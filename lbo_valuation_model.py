@@ -7,9 +7,50 @@ Author: Ascendra Capital Investment Team
 Date: October 29, 2025
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 import numpy as np
-from numpy_financial import irr
+
+from utils.labeled_cube import LabeledCube, orthogonal_grid
+from utils.streaming_stats import StreamingHistogram
+
+# ============================================================================
+# BASE CASE LBO ASSUMPTIONS
+# ============================================================================
+
+LBO_BASE_FISCAL_YEAR = 2024  # FY2024 actuals = projection year 0
+
+def default_lbo_assumptions():
+    """Base case LBO inputs shared by the scalar model and the array engine"""
+
+    return {
+        # Target (2024 actuals, $M)
+        'shares_outstanding': 64.98,  # Million
+        'current_ebitda': 2_775.6,
+        'existing_net_debt': 4_378.5,
+        'revenue': 15_827.9,
+        'ebit': 1_681.8,
+        'depreciation': 584.8,
+        'capex': 640.0,
+        'fcf_before_debt': 1_427.0,
+
+        # Financing
+        'transaction_fee_pct': 0.02,  # 2% fees
+        'debt_pct_of_uses': 0.60,  # Target: 60% debt, 40% equity
+        'max_leverage': 5.0,  # 5.0x Net Debt/EBITDA cap
+        'interest_rate': 0.075,  # 7.5% blended rate on new debt
+        'mandatory_debt_paydown_pct': 0.05,  # 5% of starting debt per year
+
+        # Operations
+        'revenue_growth': 0.04,  # 4% annually (organic + inflation)
+        'ebitda_margin_target': 0.19,  # 19% (from 17.5%, synergy improvement)
+        'margin_ramp_years': 3,
+        'capex_pct': 0.04,  # 4% of revenue
+        'depreciation_pct': 0.037,  # 3.7% of revenue
+        'tax_rate': 0.21,  # 21%
+    }
 
 # ============================================================================
 # STEP 1: DEFINE LBO TRANSACTION STRUCTURE
@@ -27,9 +68,10 @@ def build_lbo_transaction(entry_price_per_share, entry_multiple):
     """
 
     # Basic metrics
-    shares_outstanding = 64.98  # Million
-    current_ebitda = 2_775.6  # $M (2024)
-    existing_net_debt = 4_378.5  # $M
+    a = default_lbo_assumptions()
+    shares_outstanding = a['shares_outstanding']  # Million
+    current_ebitda = a['current_ebitda']  # $M (2024)
+    existing_net_debt = a['existing_net_debt']  # $M
 
     # Purchase price
     equity_purchase_price = entry_price_per_share * shares_outstanding
@@ -65,20 +107,22 @@ def sources_and_uses(transaction):
     - Ascendra equity (35-40% of EV)
     """
 
+    a = default_lbo_assumptions()
+
     # Uses
     equity_purchase = transaction['equity_purchase_price']
     existing_debt_refi = transaction['existing_net_debt']
-    transaction_fees = (equity_purchase + existing_debt_refi) * 0.02  # 2% fees
+    transaction_fees = (equity_purchase + existing_debt_refi) * a['transaction_fee_pct']  # 2% fees
 
     total_uses = equity_purchase + existing_debt_refi + transaction_fees
 
     # Sources
     # Target: 60% debt, 40% equity
     # But constrain to reasonable leverage (e.g., 5.0x Net Debt/EBITDA max)
-    max_debt = transaction['current_ebitda'] * 5.0  # 5.0x leverage cap
+    max_debt = transaction['current_ebitda'] * a['max_leverage']  # 5.0x leverage cap
 
     # New debt: Lesser of 60% of uses or 5.0x EBITDA
-    new_debt = min(total_uses * 0.60, max_debt)
+    new_debt = min(total_uses * a['debt_pct_of_uses'], max_debt)
 
     # Ascendra equity: Remainder
     ascendra_equity = total_uses - new_debt
@@ -110,9 +154,9 @@ def sources_and_uses(transaction):
 # STEP 2: 5-YEAR CASH FLOW PROJECTIONS
 # ============================================================================
 
-def build_lbo_projections(transaction, sources_uses):
+def build_lbo_projections(transaction, sources_uses, n_years=5):
     """
-    Build 5-year LBO projection model
+    Build 5-year LBO projection model (n_years extends the horizon)
 
     Key assumptions:
     - Revenue growth
@@ -122,40 +166,42 @@ def build_lbo_projections(transaction, sources_uses):
     - Debt paydown from FCF
     """
 
+    a = default_lbo_assumptions()
+
     # Starting point (Year 0)
     base_year = {
         'year': 0,
-        'revenue': 15_827.9,  # $M
-        'ebitda': 2_775.6,  # $M
-        'ebitda_margin': 2_775.6 / 15_827.9,
-        'ebit': 1_681.8,  # $M
-        'depreciation': 584.8,  # $M
-        'capex': 640.0,  # $M
-        'fcf_before_debt': 1_427.0,  # $M
+        'revenue': a['revenue'],  # $M
+        'ebitda': a['current_ebitda'],  # $M
+        'ebitda_margin': a['current_ebitda'] / a['revenue'],
+        'ebit': a['ebit'],  # $M
+        'depreciation': a['depreciation'],  # $M
+        'capex': a['capex'],  # $M
+        'fcf_before_debt': a['fcf_before_debt'],  # $M
         'debt_balance': sources_uses['sources']['new_debt'],
-        'interest_rate': 0.075,  # 7.5% (blended rate on new debt)
+        'interest_rate': a['interest_rate'],  # 7.5% (blended rate on new debt)
     }
 
     # Assumptions
-    revenue_growth = 0.04  # 4% annually (organic + inflation)
-    ebitda_margin_target = 0.19  # 19% (from 17.5%, synergy improvement)
-    margin_improvement_annual = (ebitda_margin_target - base_year['ebitda_margin']) / 3  # 3-year improvement
-    capex_pct = 0.04  # 4% of revenue
-    depreciation_pct = 0.037  # 3.7% of revenue
-    tax_rate = 0.21  # 21%
-    mandatory_debt_paydown_pct = 0.05  # 5% of starting debt per year (amortization)
+    revenue_growth = a['revenue_growth']  # 4% annually (organic + inflation)
+    ebitda_margin_target = a['ebitda_margin_target']  # 19% (from 17.5%, synergy improvement)
+    margin_improvement_annual = (ebitda_margin_target - base_year['ebitda_margin']) / a['margin_ramp_years']  # 3-year improvement
+    capex_pct = a['capex_pct']  # 4% of revenue
+    depreciation_pct = a['depreciation_pct']  # 3.7% of revenue
+    tax_rate = a['tax_rate']  # 21%
+    mandatory_debt_paydown_pct = a['mandatory_debt_paydown_pct']  # 5% of starting debt per year (amortization)
 
     # Build projections
     projections = [base_year]
 
-    for year in range(1, 6):
+    for year in range(1, n_years + 1):
         prev = projections[year - 1]
 
         # Revenue growth
         revenue = prev['revenue'] * (1 + revenue_growth)
 
         # EBITDA margin expansion (gradual)
-        if year <= 3:
+        if year <= a['margin_ramp_years']:
             ebitda_margin = prev['ebitda_margin'] + margin_improvement_annual
         else:
             ebitda_margin = ebitda_margin_target
@@ -216,26 +262,20 @@ def build_lbo_projections(transaction, sources_uses):
 # STEP 3: EXIT VALUATION & RETURNS
 # ============================================================================
 
-def calculate_lbo_returns(projections, sources_uses, exit_multiple):
+def lbo_exit_cash_flows(projections, sources_uses, exit_multiple, exit_year=5):
     """
-    Calculate exit value and returns to equity
-
-    Exit Assumptions:
-    - Exit in Year 5
-    - Exit EBITDA multiple (typically same as entry or slightly lower)
-    - Exit enterprise value = Year 5 EBITDA × Exit Multiple
-    - Exit equity value = Exit EV - Exit Debt
-    - Returns: IRR, MOIC (Multiple of Invested Capital)
+    Exit values and the equity cash-flow vector (year 0 first) used for
+    IRR: -equity, FCF to equity in years 1..exit_year, plus exit equity
     """
 
-    year_5 = projections[5]
+    exit_projection = projections[exit_year]
 
     # Exit enterprise value
-    exit_ebitda = year_5['ebitda']
+    exit_ebitda = exit_projection['ebitda']
     exit_enterprise_value = exit_ebitda * exit_multiple
 
     # Exit debt balance
-    exit_debt = year_5['debt_balance']
+    exit_debt = exit_projection['debt_balance']
 
     # Exit equity value
     exit_equity_value = exit_enterprise_value - exit_debt
@@ -243,19 +283,46 @@ def calculate_lbo_returns(projections, sources_uses, exit_multiple):
     # Initial equity invested
     initial_equity = sources_uses['sources']['ascendra_equity']
 
-    # Returns
-    moic = exit_equity_value / initial_equity
-
-    # IRR calculation
     cash_flows = [-initial_equity]  # Year 0: invest equity
-    for year in range(1, 6):
+    for year in range(1, exit_year + 1):
         cash_flows.append(projections[year]['fcf_to_equity'])
-    cash_flows[5] += exit_equity_value  # Year 5: exit + FCF
+    cash_flows[exit_year] += exit_equity_value  # Exit year: exit + FCF
+
+    return {
+        'exit_ebitda': exit_ebitda,
+        'exit_enterprise_value': exit_enterprise_value,
+        'exit_debt': exit_debt,
+        'exit_equity_value': exit_equity_value,
+        'initial_equity': initial_equity,
+        'cash_flows': np.array(cash_flows),
+    }
+
+def calculate_lbo_returns(projections, sources_uses, exit_multiple, exit_year=5):
+    """
+    Calculate exit value and returns to equity
+
+    Exit Assumptions:
+    - Exit in year exit_year (default 5; projections must extend that far)
+    - Exit EBITDA multiple (typically same as entry or slightly lower)
+    - Exit enterprise value = exit_year EBITDA × Exit Multiple
+    - Exit equity value = Exit EV - Exit Debt
+    - Returns: IRR, MOIC (Multiple of Invested Capital)
+    """
+
+    exit_result = lbo_exit_cash_flows(projections, sources_uses, exit_multiple, exit_year)
 
-    irr_value = irr(cash_flows)
+    exit_ebitda = exit_result['exit_ebitda']
+    exit_enterprise_value = exit_result['exit_enterprise_value']
+    exit_debt = exit_result['exit_debt']
+    exit_equity_value = exit_result['exit_equity_value']
+    initial_equity = exit_result['initial_equity']
+
+    # Returns
+    moic = exit_equity_value / initial_equity
+    irr_value = irr_batch(exit_result['cash_flows'])['irr'][0]
 
     returns = {
-        'exit_year': 5,
+        'exit_year': exit_year,
         'exit_ebitda': exit_ebitda,
         'exit_multiple': exit_multiple,
         'exit_enterprise_value': exit_enterprise_value,
@@ -264,11 +331,739 @@ def calculate_lbo_returns(projections, sources_uses, exit_multiple):
         'initial_equity_invested': initial_equity,
         'moic': moic,
         'irr': irr_value,
-        'annualized_return_pct': (moic ** (1/5) - 1) * 100,
+        'annualized_return_pct': (moic ** (1 / exit_year) - 1) * 100,
     }
 
     return returns
 
+# ============================================================================
+# STEP 3B: BATCHED IRR SOLVER
+# ============================================================================
+
+def _npv_and_derivative(cash_flows, x):
+    """
+    NPV polynomial in x = 1 / (1 + r) and its derivative, by Horner's rule
+    over the last axis
+    """
+    npv = np.zeros_like(x)
+    d_npv = np.zeros_like(x)
+    for c in cash_flows[..., ::-1].T:
+        d_npv = d_npv * x + npv
+        npv = npv * x + c
+    return npv, d_npv
+
+def irr_batch(cash_flows, guess=0.10, tol=1e-14, max_iter=50):
+    """
+    Solve IRR for many cash-flow vectors at once
+
+    cash_flows: (N, T+1) array (year 0 first). Uses vectorized Newton on
+    x = 1 / (1 + r) with a bisection fallback on rows that fail to
+    converge. Rows with no sign change have no IRR (nan, flagged
+    'no_root'); rows with more than one sign change may have several
+    roots (flagged 'multiple_roots') and are resolved like
+    numpy_financial.irr, i.e. the real root closest to zero.
+
+    Returns {'irr', 'no_root', 'multiple_roots'} arrays of shape (N,).
+    """
+
+    cash_flows = np.atleast_2d(np.asarray(cash_flows, dtype=float))
+    n = cash_flows.shape[0]
+
+    signs = np.sign(cash_flows)
+    signs_nz = np.where(signs == 0, np.nan, signs)
+    sign_changes = np.zeros(n, dtype=int)
+    last = np.full(n, np.nan)
+    for s in signs_nz.T:
+        changed = ~np.isnan(s) & ~np.isnan(last) & (s != last)
+        sign_changes += changed
+        last = np.where(np.isnan(s), last, s)
+
+    no_root = sign_changes == 0
+    multiple_roots = sign_changes > 1
+    single = ~no_root & ~multiple_roots
+
+    irr_values = np.full(n, np.nan)
+
+    if single.any():
+        cf = cash_flows[single]
+
+        # Newton on x = 1 / (1 + r)
+        x = np.full(cf.shape[0], 1 / (1 + guess))
+        converged = np.zeros(cf.shape[0], dtype=bool)
+        for _ in range(max_iter):
+            npv, d_npv = _npv_and_derivative(cf, x)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                step = npv / d_npv
+            x = np.where(converged, x, x - step)
+            converged |= np.abs(step) < tol * np.maximum(np.abs(x), 1.0)
+            if converged.all():
+                break
+
+        failed = ~converged | ~np.isfinite(x) | (x <= 0)
+
+        # Bisection fallback: bracket the root in x on (0, hi]
+        if failed.any():
+            cf_f = cf[failed]
+            lo = np.zeros(cf_f.shape[0])
+            hi = np.ones(cf_f.shape[0])
+            f_lo = cf_f[:, 0]
+            for _ in range(60):
+                f_hi, _ = _npv_and_derivative(cf_f, hi)
+                open_bracket = np.sign(f_hi) == np.sign(f_lo)
+                if not open_bracket.any():
+                    break
+                hi = np.where(open_bracket, hi * 2, hi)
+            for _ in range(200):
+                mid = 0.5 * (lo + hi)
+                f_mid, _ = _npv_and_derivative(cf_f, mid)
+                same = np.sign(f_mid) == np.sign(f_lo)
+                lo = np.where(same, mid, lo)
+                f_lo = np.where(same, f_mid, f_lo)
+                hi = np.where(same, hi, mid)
+            x[failed] = 0.5 * (lo + hi)
+
+        irr_values[single] = 1 / x - 1
+
+    # Several sign changes: enumerate polynomial roots (as numpy_financial)
+    # via batched companion-matrix eigenvalues
+    if multiple_roots.any():
+        rows = np.flatnonzero(multiple_roots)
+        poly = cash_flows[rows, ::-1]
+        regular = (poly[:, 0] != 0) & (poly[:, -1] != 0)
+
+        roots = np.full((rows.size, poly.shape[1] - 1), np.nan, dtype=complex)
+        if regular.any():
+            degree = poly.shape[1] - 1
+            companion = np.zeros((regular.sum(), degree, degree))
+            companion[:, 0, :] = -poly[regular, 1:] / poly[regular, :1]
+            companion[:, np.arange(1, degree), np.arange(degree - 1)] = 1
+            roots[regular] = np.linalg.eigvals(companion)
+        for k in np.flatnonzero(~regular):
+            r = np.roots(poly[k])
+            roots[k, :r.size] = r
+
+        valid = (roots.imag == 0) & (roots.real > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rates = np.where(valid, 1 / roots.real - 1, np.inf)
+        best = np.argmin(np.abs(rates), axis=1)
+        found = valid.any(axis=1)
+
+        irr_values[rows[found]] = rates[found, best[found]]
+        no_root[rows[~found]] = True
+
+    return {
+        'irr': irr_values,
+        'no_root': no_root,
+        'multiple_roots': multiple_roots,
+    }
+
+# ============================================================================
+# STEP 3C: ARRAY LBO ENGINE
+# ============================================================================
+
+def _operating_year(p, prev_revenue, year, growth_shock=0.0, margin_shock=0.0):
+    """Revenue, EBITDA, D&A and capex for one projection year (array inputs)
+
+    growth_shock / margin_shock are additive deviations from the planned
+    growth rate and margin ramp (per-path arrays in the Monte Carlo).
+    """
+    base_margin = p['current_ebitda'] / p['revenue']
+    ramp = (p['ebitda_margin_target'] - base_margin) / p['margin_ramp_years']
+
+    revenue = prev_revenue * (1 + p['revenue_growth'] + growth_shock)
+    ebitda_margin = np.where(year <= p['margin_ramp_years'], base_margin + ramp * year,
+                             p['ebitda_margin_target']) + margin_shock
+
+    return revenue, revenue * ebitda_margin, revenue * p['depreciation_pct'], revenue * p['capex_pct']
+
+def lbo_projections_batch(entry_prices, assumptions=None, n_years=5, shocks=None):
+    """
+    Transaction, sources & uses and 5-year projections for an array of
+    entry prices in one pass (same arithmetic as the scalar functions)
+
+    Any assumption may also be an array broadcastable with entry_prices
+    (e.g. leverage, interest rate, growth or margin axes of a scenario
+    cube). Optional paydown and the zero debt floor are applied as masked
+    array operations. Returns arrays of the broadcast shape, with a
+    trailing years axis (years 1..n_years) for the per-year line items.
+
+    shocks optionally maps 'revenue_growth', 'ebitda_margin' and
+    'interest_rate' to additive deviations of shape (..., n_years), e.g.
+    simulated paths from lbo_monte_carlo.
+    """
+
+    a = {**default_lbo_assumptions(), **(assumptions or {})}
+    p = {key: np.asarray(value, dtype=float) for key, value in a.items()}
+    entry_prices = np.asarray(entry_prices, dtype=float)
+
+    # Transaction and sources & uses
+    equity_purchase = entry_prices * p['shares_outstanding']
+    enterprise_value = equity_purchase + p['existing_net_debt']
+    total_uses = enterprise_value * (1 + p['transaction_fee_pct'])
+    new_debt = np.minimum(total_uses * p['debt_pct_of_uses'], p['current_ebitda'] * p['max_leverage'])
+    initial_equity = total_uses - new_debt
+
+    mandatory = new_debt * p['mandatory_debt_paydown_pct']
+
+    revenue = p['revenue']
+    debt = new_debt
+    columns = {key: [] for key in ['revenue', 'ebitda', 'interest_expense', 'fcf_after_capex',
+                                   'debt_paydown', 'debt_balance', 'fcf_to_equity']}
+
+    shocks = shocks or {}
+
+    def shock(key, year):
+        return shocks[key][..., year - 1] if key in shocks else 0.0
+
+    for year in range(1, n_years + 1):
+        revenue, ebitda, depreciation, capex = _operating_year(
+            p, revenue, year, shock('revenue_growth', year), shock('ebitda_margin', year))
+
+        # Interest on beginning balance; no tax shield below zero EBT
+        interest = debt * (p['interest_rate'] + shock('interest_rate', year))
+        ebt = ebitda - depreciation - interest
+        taxes = np.where(ebt > 0, ebt * p['tax_rate'], 0.0)
+        fcf_after_capex = ebt - taxes + depreciation - capex
+
+        # Cash sweep: mandatory amortization plus any excess FCF, debt floored at zero
+        paydown = mandatory + np.maximum(fcf_after_capex - mandatory, 0)
+        debt = np.maximum(debt - paydown, 0)
+
+        for key, value in [('revenue', revenue), ('ebitda', ebitda), ('interest_expense', interest),
+                           ('fcf_after_capex', fcf_after_capex), ('debt_paydown', paydown),
+                           ('debt_balance', debt), ('fcf_to_equity', fcf_after_capex - paydown)]:
+            columns[key].append(value)
+
+    shape = np.broadcast_shapes(initial_equity.shape, *[np.shape(v) for vals in columns.values() for v in vals])
+
+    result = {
+        'entry_price': entry_prices,
+        'enterprise_value': enterprise_value,
+        'implied_entry_multiple': enterprise_value / p['current_ebitda'],
+        'new_debt': new_debt,
+        'initial_equity': np.broadcast_to(initial_equity, shape),
+    }
+    for key, values in columns.items():
+        result[key] = np.stack([np.broadcast_to(v, shape) for v in values], axis=-1)
+
+    return result
+
+def lbo_returns_batch(entry_prices, exit_multiples, assumptions=None, projections=None):
+    """
+    IRR and MOIC for broadcastable arrays of entry prices and exit multiples
+
+    Projections depend only on the entry price, so they are built once
+    for the entry-price array and the exit multiples are broadcast on top.
+    Pass projections (lbo_projections_batch output for the same entry
+    prices and assumptions) to reuse an existing run.
+    """
+
+    proj = lbo_projections_batch(entry_prices, assumptions) if projections is None else projections
+    exit_multiples = np.asarray(exit_multiples, dtype=float)
+
+    exit_equity_value = proj['ebitda'][..., -1] * exit_multiples - proj['debt_balance'][..., -1]
+    shape = np.broadcast_shapes(proj['initial_equity'].shape, exit_equity_value.shape)
+
+    initial_equity = np.broadcast_to(proj['initial_equity'], shape)
+    exit_equity_value = np.broadcast_to(exit_equity_value, shape)
+
+    # Entry outflow + one period per projected year; exit proceeds land in the last year
+    n_periods = proj['fcf_to_equity'].shape[-1] + 1
+
+    cash_flows = np.zeros(shape + (n_periods,))
+    cash_flows[..., 0] = -initial_equity
+    cash_flows[..., 1:] = np.broadcast_to(proj['fcf_to_equity'], shape + (n_periods - 1,))
+    cash_flows[..., -1] += exit_equity_value
+
+    irr_result = irr_batch(cash_flows.reshape(-1, n_periods))
+
+    return {
+        'initial_equity': initial_equity,
+        'exit_equity_value': exit_equity_value,
+        'moic': exit_equity_value / initial_equity,
+        'irr': irr_result['irr'].reshape(shape),
+    }
+
+# Scenario cube axes -> assumption keys they override
+LBO_CUBE_AXES = {
+    'leverage': 'max_leverage',
+    'interest_rate': 'interest_rate',
+    'revenue_growth': 'revenue_growth',
+    'ebitda_margin_target': 'ebitda_margin_target',
+}
+
+def lbo_scenario_cube(entry_prices, exit_multiples, leverage=None, interest_rate=None,
+                      revenue_growth=None, ebitda_margin_target=None):
+    """
+    IRR / MOIC cube over entry price x [leverage x rate x growth x margin] x exit multiple
+
+    Each supplied axis becomes its own dimension. Projections are computed
+    once per entry configuration and broadcast across the exit-multiple
+    axis (last dimension). Returns a LabeledCube with irr, moic,
+    initial_equity, exit_equity_value and implied_entry_multiple.
+    """
+
+    axes = {'entry_price': entry_prices}
+    supplied = {
+        'leverage': leverage,
+        'interest_rate': interest_rate,
+        'revenue_growth': revenue_growth,
+        'ebitda_margin_target': ebitda_margin_target,
+    }
+    for name, values in supplied.items():
+        if values is not None:
+            axes[name] = values
+    axes['exit_multiple'] = exit_multiples
+
+    dims, coords, grid = orthogonal_grid(axes)
+    overrides = {LBO_CUBE_AXES[name]: grid[name] for name in dims if name in LBO_CUBE_AXES}
+
+    proj = lbo_projections_batch(grid['entry_price'], overrides)
+    returns = lbo_returns_batch(grid['entry_price'], grid['exit_multiple'], overrides, projections=proj)
+
+    return LabeledCube(dims, coords, {
+        'irr': returns['irr'],
+        'moic': returns['moic'],
+        'initial_equity': returns['initial_equity'],
+        'exit_equity_value': returns['exit_equity_value'],
+        'implied_entry_multiple': proj['implied_entry_multiple'],
+    })
+
+# ============================================================================
+# STEP 3D: MULTI-TRANCHE DEBT ENGINE
+# ============================================================================
+
+def default_debt_tranches():
+    """
+    Tranche-level financing package (sizes in x 2024 EBITDA)
+
+    rate: fixed coupon, or spread over the base rate (floored) when
+    'floating' is True. PIK interest accrues to principal instead of being
+    paid in cash. sweep_priority orders excess-cash prepayment (lower
+    first); None means the tranche is not prepayable before exit.
+    """
+
+    return [
+        {'name': 'revolver', 'size_x_ebitda': 0.0, 'commitment_x_ebitda': 0.5, 'floating': True,
+         'rate': 0.0275, 'floor': 0.005, 'amortization_pct': 0.0, 'sweep_priority': 1, 'pik': False},
+        {'name': 'term_loan_b', 'size_x_ebitda': 3.0, 'floating': True,
+         'rate': 0.0325, 'floor': 0.005, 'amortization_pct': 0.01, 'sweep_priority': 2, 'pik': False},
+        {'name': 'senior_notes', 'size_x_ebitda': 1.5, 'floating': False,
+         'rate': 0.0700, 'floor': 0.0, 'amortization_pct': 0.0, 'sweep_priority': None, 'pik': False},
+        {'name': 'pik_notes', 'size_x_ebitda': 0.5, 'floating': False,
+         'rate': 0.1100, 'floor': 0.0, 'amortization_pct': 0.0, 'sweep_priority': None, 'pik': True},
+    ]
+
+def default_debt_market():
+    """Base rate curve (SOFR, years 1-5), sweep share and maintenance covenants"""
+
+    return {
+        'base_rate': [0.043, 0.039, 0.036, 0.035, 0.035],
+        'sweep_pct': 1.0,  # Share of excess cash applied to prepayment
+        'max_total_leverage': [6.0, 5.75, 5.5, 5.25, 5.0],  # Total debt / EBITDA
+        'min_interest_coverage': [2.0, 2.0, 2.25, 2.25, 2.5],  # EBITDA / cash interest
+    }
+
+def tranche_waterfall_batch(entry_prices, exit_multiples, tranches=None, market=None, assumptions=None):
+    """
+    Multi-tranche LBO with priority-ordered cash sweep, vectorized across
+    scenarios
+
+    entry_prices, exit_multiples and any tranche 'size_x_ebitda' may be
+    arrays broadcastable to a common scenario shape S, so thousands of
+    capital structures run in one pass. Each year:
+    1. Interest per tranche on opening balances (PIK accrues)
+    2. Taxes on EBIT less all interest, FCF after cash interest and capex
+    3. Scheduled amortization; shortfalls drawn on the revolver
+    4. Excess cash swept into prepayable tranches in priority order
+    5. Covenant tests on closing balances
+
+    Returns per-tranche balances (S..., K, 5), covenant pass flags and
+    headroom (S..., 5), and exit IRR / MOIC (S...).
+    """
+
+    tranches = tranches or default_debt_tranches()
+    market = {**default_debt_market(), **(market or {})}
+    a = {**default_lbo_assumptions(), **(assumptions or {})}
+    p = {key: np.asarray(value, dtype=float) for key, value in a.items()}
+    ebitda_0 = p['current_ebitda']
+
+    entry_prices = np.asarray(entry_prices, dtype=float)
+    exit_multiples = np.asarray(exit_multiples, dtype=float)
+    sizes = [np.asarray(t['size_x_ebitda'], dtype=float) for t in tranches]
+    shape = np.broadcast_shapes(entry_prices.shape, exit_multiples.shape, *[s.shape for s in sizes])
+    K = len(tranches)
+
+    # Sources & uses
+    total_uses = (entry_prices * p['shares_outstanding'] + p['existing_net_debt']) * (1 + p['transaction_fee_pct'])
+    opening = np.stack([np.broadcast_to(s * ebitda_0, shape) for s in sizes], axis=-1)
+    initial_equity = np.broadcast_to(total_uses, shape) - opening.sum(axis=-1)
+
+    floating = np.array([t['floating'] for t in tranches])
+    spread = np.array([t['rate'] for t in tranches], dtype=float)
+    floor = np.array([t['floor'] for t in tranches], dtype=float)
+    amortization = np.array([t['amortization_pct'] for t in tranches], dtype=float) * opening
+    pik = np.array([t['pik'] for t in tranches])
+    is_revolver = np.array([t['name'] == 'revolver' for t in tranches])
+    revolver_limit = sum(t.get('commitment_x_ebitda', 0.0) for t in tranches if t['name'] == 'revolver') * ebitda_0
+    sweep_order = sorted(
+        (t['sweep_priority'], k) for k, t in enumerate(tranches) if t['sweep_priority'] is not None
+    )
+
+    balance = opening.copy()
+    revenue = p['revenue']
+    balances, interest_paid, fcf_to_equity = [], [], []
+    leverage, coverage, leverage_ok, coverage_ok, shortfall = [], [], [], [], []
+
+    for t in range(5):
+        year = t + 1
+        revenue, ebitda, depreciation, capex = _operating_year(p, revenue, year)
+
+        base_rate = market['base_rate'][t]
+        rate = np.where(floating, np.maximum(base_rate, floor) + spread, spread)
+        interest = balance * rate
+        cash_interest = np.where(pik, 0.0, interest).sum(axis=-1)
+        balance = balance + np.where(pik, interest, 0.0)
+
+        ebt = ebitda - depreciation - interest.sum(axis=-1)
+        taxes = np.where(ebt > 0, ebt * p['tax_rate'], 0.0)
+        fcf = ebitda - cash_interest - taxes - capex
+
+        # Scheduled amortization
+        scheduled = np.minimum(amortization, balance)
+        balance = balance - scheduled
+        cash = fcf - scheduled.sum(axis=-1)
+
+        # Shortfall -> revolver draw (up to commitment)
+        revolver_balance = (balance * is_revolver).sum(axis=-1)
+        draw = np.minimum(np.maximum(-cash, 0), np.maximum(revolver_limit - revolver_balance, 0))
+        balance = balance + draw[..., None] * is_revolver / max(is_revolver.sum(), 1)
+        shortfall.append(np.maximum(-cash - draw, 0))
+        cash = np.maximum(cash + draw, 0)
+
+        # Excess cash sweep in priority order
+        available = cash * market['sweep_pct']
+        for _, k in sweep_order:
+            repay = np.minimum(available, balance[..., k])
+            balance[..., k] -= repay
+            available = available - repay
+        fcf_to_equity.append(cash * (1 - market['sweep_pct']) + available)
+
+        # Covenant tests on closing balances
+        total_debt = balance.sum(axis=-1)
+        lev = total_debt / ebitda
+        cov = np.where(cash_interest > 0, ebitda / np.where(cash_interest > 0, cash_interest, 1.0), np.inf)
+        leverage.append(lev)
+        coverage.append(cov)
+        leverage_ok.append(lev <= market['max_total_leverage'][t])
+        coverage_ok.append(cov >= market['min_interest_coverage'][t])
+
+        balances.append(balance.copy())
+        interest_paid.append(interest)
+
+    exit_ebitda = ebitda
+    exit_equity_value = exit_ebitda * exit_multiples - balance.sum(axis=-1)
+
+    cash_flows = np.zeros(shape + (6,))
+    cash_flows[..., 0] = -initial_equity
+    cash_flows[..., 1:] = np.stack([np.broadcast_to(f, shape) for f in fcf_to_equity], axis=-1)
+    cash_flows[..., 5] += exit_equity_value
+
+    leverage_ok = np.stack([np.broadcast_to(x, shape) for x in leverage_ok], axis=-1)
+    coverage_ok = np.stack([np.broadcast_to(x, shape) for x in coverage_ok], axis=-1)
+    shortfall = np.stack([np.broadcast_to(x, shape) for x in shortfall], axis=-1)
+
+    return {
+        'tranches': [t['name'] for t in tranches],
+        'initial_equity': initial_equity,
+        'opening_balances': opening,
+        'balances': np.stack(balances, axis=-1),
+        'interest': np.stack(interest_paid, axis=-1),
+        'leverage': np.stack([np.broadcast_to(x, shape) for x in leverage], axis=-1),
+        'interest_coverage': np.stack([np.broadcast_to(x, shape) for x in coverage], axis=-1),
+        'leverage_covenant_ok': leverage_ok,
+        'coverage_covenant_ok': coverage_ok,
+        'liquidity_shortfall': shortfall,
+        'compliant': leverage_ok.all(axis=-1) & coverage_ok.all(axis=-1)
+                     & (shortfall == 0).all(axis=-1) & (initial_equity > 0),
+        'exit_equity_value': exit_equity_value,
+        'moic': exit_equity_value / initial_equity,
+        'irr': irr_batch(cash_flows.reshape(-1, 6))['irr'].reshape(shape),
+    }
+
+def optimize_capital_structure(entry_price, exit_multiple, tlb_sizes, note_sizes, pik_sizes,
+                               tranches=None, market=None):
+    """
+    Grid-search tranche sizes (x EBITDA) for the highest covenant-compliant IRR
+
+    Every TLB x notes x PIK combination is evaluated in one waterfall
+    batch. Returns a DataFrame of all structures sorted by IRR (compliant
+    first) so the frontier can be inspected, not just the winner.
+    """
+
+    tranches = [dict(t) for t in (tranches or default_debt_tranches())]
+    grids = np.meshgrid(np.asarray(tlb_sizes, dtype=float), np.asarray(note_sizes, dtype=float),
+                        np.asarray(pik_sizes, dtype=float), indexing='ij')
+    sized = dict(zip(['term_loan_b', 'senior_notes', 'pik_notes'], [g.ravel() for g in grids]))
+    for tranche in tranches:
+        if tranche['name'] in sized:
+            tranche['size_x_ebitda'] = sized[tranche['name']]
+
+    result = tranche_waterfall_batch(entry_price, exit_multiple, tranches, market)
+
+    structures = pd.DataFrame({
+        'tlb_x_ebitda': sized['term_loan_b'],
+        'notes_x_ebitda': sized['senior_notes'],
+        'pik_x_ebitda': sized['pik_notes'],
+        'total_leverage': sized['term_loan_b'] + sized['senior_notes'] + sized['pik_notes'],
+        'initial_equity': result['initial_equity'],
+        'irr': result['irr'],
+        'moic': result['moic'],
+        'max_leverage': result['leverage'].max(axis=-1),
+        'min_coverage': result['interest_coverage'].min(axis=-1),
+        'compliant': result['compliant'],
+    })
+
+    return structures.sort_values(['compliant', 'irr'], ascending=[False, False]).reset_index(drop=True)
+
+def hold_period_returns(entry_prices, exit_multiples, hold_periods=(3, 4, 5, 6, 7), assumptions=None):
+    """
+    IRR / MOIC for every exit year from one extended projection pass
+
+    Projections run once to the longest hold period. For each hold period
+    h the equity cash flows are the first h years of FCF to equity with
+    the exit equity added in year h (zero-padded to a common length), so
+    all hold periods and scenarios are solved in a single IRR batch.
+    Interim distributions are tracked with a prefix sum.
+
+    Returns a LabeledCube over (entry_price, exit_multiple, hold_years).
+    """
+
+    hold_periods = np.asarray(hold_periods, dtype=int)
+    entry_prices = np.asarray(entry_prices, dtype=float)
+    exit_multiples = np.asarray(exit_multiples, dtype=float)
+    horizon = int(hold_periods.max())
+
+    proj = lbo_projections_batch(entry_prices[:, None], assumptions, n_years=horizon)
+    h_index = hold_periods - 1
+
+    # (entry, 1, H) exit-year slices; exit multiple broadcasts on axis 1
+    exit_ebitda = proj['ebitda'][..., h_index]
+    exit_debt = proj['debt_balance'][..., h_index]
+    exit_equity_value = exit_ebitda * exit_multiples[None, :, None] - exit_debt
+    cumulative_fcf = np.cumsum(proj['fcf_to_equity'], axis=-1)[..., h_index]
+
+    shape = (len(entry_prices), len(exit_multiples), len(hold_periods))
+    initial_equity = np.broadcast_to(proj['initial_equity'][..., None], shape)
+    exit_equity_value = np.broadcast_to(exit_equity_value, shape)
+
+    # Cash flows: years beyond the hold period are zeroed, exit lands in year h
+    years = np.arange(1, horizon + 1)
+    in_hold = years <= hold_periods[:, None]  # (H, horizon)
+    is_exit = years == hold_periods[:, None]
+    cash_flows = np.zeros(shape + (horizon + 1,))
+    cash_flows[..., 0] = -initial_equity
+    cash_flows[..., 1:] = np.where(in_hold, proj['fcf_to_equity'][..., None, :], 0.0)
+    cash_flows[..., 1:] += np.where(is_exit, exit_equity_value[..., None], 0.0)
+
+    irr_values = irr_batch(cash_flows.reshape(-1, horizon + 1))['irr'].reshape(shape)
+    moic = exit_equity_value / initial_equity
+
+    return LabeledCube(
+        ['entry_price', 'exit_multiple', 'hold_years'],
+        {'entry_price': entry_prices, 'exit_multiple': exit_multiples, 'hold_years': hold_periods},
+        {
+            'irr': irr_values,
+            'moic': moic,
+            'annualized_return': moic ** (1 / hold_periods) - 1,
+            'exit_equity_value': exit_equity_value,
+            'cumulative_fcf_to_equity': np.broadcast_to(cumulative_fcf, shape),
+        },
+    )
+
+# ============================================================================
+# STEP 3E: STOCHASTIC LBO (Monte Carlo with covenant tracking)
+# ============================================================================
+
+def default_lbo_monte_carlo_config():
+    """
+    Shock processes for the LBO Monte Carlo (deviations from the base plan)
+
+    - revenue_growth: AR(1) deviation from planned growth
+    - ebitda_margin:  AR(1) deviation from the planned margin ramp
+    - interest_rate:  random walk in the floating rate on the new debt
+    - exit_multiple:  normal around the base exit multiple, correlated
+                      with cumulative growth surprises and floored at 'min'
+
+    Yearly innovations are correlated via 'correlation' (order: growth,
+    margin, rate). Covenant schedules follow default_debt_market().
+    """
+
+    market = default_debt_market()
+
+    return {
+        'revenue_growth': {'std': 0.025, 'persistence': 0.5},
+        'ebitda_margin': {'std': 0.006, 'persistence': 0.8},
+        'interest_rate': {'std': 0.004},
+        'exit_multiple': {'std': 1.0, 'growth_correlation': 0.4, 'min': 5.0},
+        'correlation': [
+            # growth  margin  rate
+            [1.00,    0.50,   0.10],
+            [0.50,    1.00,   0.00],
+            [0.10,    0.00,   1.00],
+        ],
+        'max_total_leverage': market['max_total_leverage'],
+        'min_interest_coverage': market['min_interest_coverage'],
+    }
+
+def sample_lbo_paths(n_paths, config, rng, base_exit_multiple=9.0, n_years=5):
+    """Draw shock paths (n_paths, n_years) and exit multiples (n_paths,)"""
+
+    chol = np.linalg.cholesky(np.asarray(config['correlation'], dtype=float))
+    z = rng.standard_normal((n_paths, n_years, 3)) @ chol.T
+
+    def ar1(innovations, spec):
+        path = np.zeros_like(innovations)
+        level = 0.0
+        for t in range(n_years):
+            level = spec['persistence'] * level + spec['std'] * innovations[:, t]
+            path[:, t] = level
+        return path
+
+    shocks = {
+        'revenue_growth': ar1(z[..., 0], config['revenue_growth']),
+        'ebitda_margin': ar1(z[..., 1], config['ebitda_margin']),
+        'interest_rate': np.cumsum(config['interest_rate']['std'] * z[..., 2], axis=1),
+    }
+
+    spec = config['exit_multiple']
+    rho = spec['growth_correlation']
+    growth_surprise = z[..., 0].sum(axis=1) / np.sqrt(n_years)
+    exit_z = rho * growth_surprise + np.sqrt(1 - rho ** 2) * rng.standard_normal(n_paths)
+    exit_multiples = np.maximum(base_exit_multiple + spec['std'] * exit_z, spec['min'])
+
+    return shocks, exit_multiples
+
+# Fixed sketch ranges so per-chunk results from different workers can be merged
+LBO_MC_IRR_RANGE = (-1.0, 1.5)
+LBO_MC_MOIC_RANGE = (0.0, 8.0)
+
+def _lbo_monte_carlo_chunk(task):
+    """Simulate one chunk of paths and return mergeable partial aggregates"""
+
+    seed_seq, n, entry_price, exit_multiple, assumptions, config, hurdles = task
+    rng = np.random.default_rng(seed_seq)
+    shocks, exit_multiples = sample_lbo_paths(n, config, rng, exit_multiple)
+
+    proj = lbo_projections_batch(np.full(n, float(entry_price)), assumptions, shocks=shocks)
+    ebitda = proj['ebitda']
+    debt = proj['debt_balance']
+    interest = proj['interest_expense']
+
+    # Covenant tests on closing debt and year EBITDA, path by path
+    leverage = np.where(ebitda > 0, debt / np.where(ebitda > 0, ebitda, 1.0), np.inf)
+    coverage = np.where(interest > 0, ebitda / np.where(interest > 0, interest, 1.0), np.inf)
+    leverage_breach = leverage > np.asarray(config['max_total_leverage'])
+    coverage_breach = coverage < np.asarray(config['min_interest_coverage'])
+    breach = leverage_breach | coverage_breach
+    any_breach = breach.any(axis=1)
+    first_breach_year = np.where(any_breach, breach.argmax(axis=1) + 1, 0)
+
+    # Limited liability: equity value at exit cannot go below zero
+    exit_equity_value = np.maximum(ebitda[:, -1] * exit_multiples - debt[:, -1], 0.0)
+    initial_equity = proj['initial_equity']
+
+    cash_flows = np.zeros((n, 6))
+    cash_flows[:, 0] = -initial_equity
+    cash_flows[:, 1:] = proj['fcf_to_equity']
+    cash_flows[:, 5] += exit_equity_value
+
+    irr_result = irr_batch(cash_flows)
+    irr_values = np.where(irr_result['no_root'], -1.0, irr_result['irr'])  # Nothing back: total loss
+    moic = exit_equity_value / initial_equity
+
+    irr_sketch = StreamingHistogram(value_range=LBO_MC_IRR_RANGE)
+    irr_sketch.update(irr_values)
+    moic_sketch = StreamingHistogram(value_range=LBO_MC_MOIC_RANGE)
+    moic_sketch.update(moic)
+
+    return {
+        'irr': irr_sketch,
+        'moic': moic_sketch,
+        'below_hurdle': np.array([(irr_values < h).sum() for h in hurdles], dtype=np.int64),
+        'leverage_breach': int(leverage_breach.any(axis=1).sum()),
+        'coverage_breach': int(coverage_breach.any(axis=1).sum()),
+        'first_breach_year': np.bincount(first_breach_year, minlength=6),
+        'equity_wipeout': int((exit_equity_value <= 0).sum()),
+    }
+
+def lbo_monte_carlo(entry_price=355, exit_multiple=9.0, n_paths=1_000_000, chunk_size=100_000,
+                    seed=42, n_workers=None, config=None, assumptions=None,
+                    irr_hurdles=(0.15, 0.20, 0.25),
+                    percentiles=(0.05, 0.10, 0.25, 0.50, 0.75, 0.90, 0.95)):
+    """
+    Monte Carlo LBO: stochastic growth, margin and rate paths pushed
+    through the array engine with covenant tests in every year
+
+    Paths run in vectorized chunks, spread over a process pool
+    (n_workers=None uses all cores, 1 runs in-process). Each chunk gets
+    its own child seed from one SeedSequence, so results are identical
+    for any worker count. IRR / MOIC are aggregated in fixed-range
+    streaming sketches; hurdle and breach probabilities are exact counts.
+    """
+
+    config = config or default_lbo_monte_carlo_config()
+    sizes = [min(chunk_size, n_paths - start) for start in range(0, n_paths, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(s, n, entry_price, exit_multiple, assumptions, config, tuple(irr_hurdles))
+             for s, n in zip(seeds, sizes)]
+
+    n_workers = n_workers or os.cpu_count() or 1
+    if n_workers == 1 or len(tasks) == 1:
+        chunks = [_lbo_monte_carlo_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(n_workers, len(tasks))) as pool:
+            chunks = list(pool.map(_lbo_monte_carlo_chunk, tasks))
+
+    irr_sketch = StreamingHistogram(value_range=LBO_MC_IRR_RANGE)
+    moic_sketch = StreamingHistogram(value_range=LBO_MC_MOIC_RANGE)
+    for chunk in chunks:
+        irr_sketch.merge(chunk['irr'])
+        moic_sketch.merge(chunk['moic'])
+
+    below_hurdle = sum(chunk['below_hurdle'] for chunk in chunks)
+    first_breach = sum(chunk['first_breach_year'] for chunk in chunks)
+    n_breached = int(first_breach[1:].sum())
+
+    time_to_breach = pd.DataFrame({
+        'year': np.arange(1, 6),
+        'first_breach_probability': first_breach[1:] / n_paths,
+        'cumulative_breach_probability': np.cumsum(first_breach[1:]) / n_paths,
+    })
+
+    counts, edges = irr_sketch.histogram()
+
+    return {
+        'n_paths': n_paths,
+        'seed': seed,
+        'entry_price': entry_price,
+        'exit_multiple': exit_multiple,
+        'irr_mean': irr_sketch.mean,
+        'irr_percentiles': dict(zip(percentiles, irr_sketch.quantile(percentiles))),
+        'moic_mean': moic_sketch.mean,
+        'moic_percentiles': dict(zip(percentiles, moic_sketch.quantile(percentiles))),
+        'prob_irr_below': dict(zip(irr_hurdles, below_hurdle / n_paths)),
+        'breach_probability': n_breached / n_paths,
+        'leverage_breach_probability': sum(c['leverage_breach'] for c in chunks) / n_paths,
+        'coverage_breach_probability': sum(c['coverage_breach'] for c in chunks) / n_paths,
+        'time_to_breach': time_to_breach,
+        'mean_time_to_breach': (time_to_breach['year'] * first_breach[1:]).sum() / n_breached
+                               if n_breached else np.nan,
+        'equity_wipeout_probability': sum(c['equity_wipeout'] for c in chunks) / n_paths,
+        'irr_histogram_counts': counts,
+        'irr_histogram_edges': edges,
+    }
+
 # ============================================================================
 # STEP 4: RUN MULTIPLE SCENARIOS
 # ============================================================================
@@ -280,77 +1075,100 @@ def lbo_scenario_analysis(entry_prices, exit_multiples):
     Returns: DataFrame showing IRR and MOIC for each combination
     """
 
-    scenarios = []
+    cube = lbo_scenario_cube(entry_prices, exit_multiples)
+    scenarios = cube.to_frame().reset_index()
 
-    for entry_price in entry_prices:
-        for exit_multiple in exit_multiples:
-            # Build transaction
-            transaction = build_lbo_transaction(entry_price, None)
-            sources_uses_result = sources_and_uses(transaction)
+    return scenarios[['entry_price', 'implied_entry_multiple', 'exit_multiple',
+                      'initial_equity', 'exit_equity_value', 'moic', 'irr']].rename(
+        columns={'implied_entry_multiple': 'entry_multiple'}
+    )
 
-            # Build projections
-            projections = build_lbo_projections(transaction, sources_uses_result)
+# ============================================================================
+# STEP 5: REVERSE LBO (Target IRR)
+# ============================================================================
 
-            # Calculate returns
-            returns = calculate_lbo_returns(projections, sources_uses_result, exit_multiple)
+def solve_entry_price(targets, exit_multiples, metric='irr', price_bounds=(1.0, 2_000.0),
+                      assumptions=None, tol=0.001):
+    """
+    Maximum entry price per share that still delivers a target IRR or MOIC
 
-            scenarios.append({
-                'entry_price': entry_price,
-                'entry_multiple': transaction['implied_entry_multiple'],
-                'exit_multiple': exit_multiple,
-                'initial_equity': sources_uses_result['sources']['ascendra_equity'],
-                'exit_equity_value': returns['exit_equity_value'],
-                'moic': returns['moic'],
-                'irr': returns['irr'],
-            })
+    targets and exit_multiples are broadcastable arrays, so a whole grid
+    of (target, exit multiple) pairs is solved at once. Returns are
+    monotone decreasing in price, so each pair is solved by vectorized
+    bisection inside price_bounds and then floored to the cent. Pairs
+    whose target is out of reach inside the bounds return nan.
+    """
 
-    return pd.DataFrame(scenarios)
+    targets = np.asarray(targets, dtype=float)
+    exit_multiples = np.asarray(exit_multiples, dtype=float)
+    shape = np.broadcast_shapes(targets.shape, exit_multiples.shape)
+    targets = np.broadcast_to(targets, shape)
 
-# ============================================================================
-# STEP 5: REVERSE LBO (Target IRR)
-# ============================================================================
+    def excess(prices):
+        return lbo_returns_batch(prices, exit_multiples, assumptions)[metric] - targets
+
+    lo = np.full(shape, float(price_bounds[0]))
+    hi = np.full(shape, float(price_bounds[1]))
+    feasible = (excess(lo) >= 0) & (excess(hi) <= 0)
+
+    while np.max(hi - lo) > tol:
+        mid = 0.5 * (lo + hi)
+        above = excess(mid) >= 0
+        lo = np.where(above, mid, lo)
+        hi = np.where(above, hi, mid)
+
+    # Floor to the cent so the target is still met at the quoted price
+    price = np.floor(lo * 100) / 100
+    returns = lbo_returns_batch(price, exit_multiples, assumptions)
+
+    return {
+        'entry_price': np.where(feasible, price, np.nan),
+        'irr': np.where(feasible, returns['irr'], np.nan),
+        'moic': np.where(feasible, returns['moic'], np.nan),
+    }
 
-def reverse_lbo(target_irr, exit_multiple):
+def reverse_lbo(target_irr, exit_multiple, metric='irr'):
     """
-    Reverse LBO: What price can we pay to achieve target IRR?
+    Reverse LBO: What price can we pay to achieve target IRR (or MOIC)?
 
-    Logic:
-    - Start with various entry prices
-    - Calculate IRR for each
-    - Find price that delivers target IRR
+    Solves for the exact maximum entry price (to the cent) instead of
+    scanning a price grid.
     """
 
-    # Try entry prices from $200 to $450
-    entry_prices = np.arange(200, 451, 5)
+    result = solve_entry_price(target_irr, exit_multiple, metric=metric)
 
-    results = []
+    return pd.Series({
+        'entry_price': float(result['entry_price']),
+        'irr': float(result['irr']),
+        'moic': float(result['moic']),
+    })
 
-    for entry_price in entry_prices:
-        transaction = build_lbo_transaction(entry_price, None)
-        sources_uses_result = sources_and_uses(transaction)
-        projections = build_lbo_projections(transaction, sources_uses_result)
-        returns = calculate_lbo_returns(projections, sources_uses_result, exit_multiple)
+def max_bid_surface(target_irrs, exit_multiples):
+    """
+    Max entry price for every (target IRR, exit multiple) pair in one call
 
-        results.append({
-            'entry_price': entry_price,
-            'irr': returns['irr'],
-            'moic': returns['moic'],
-        })
+    Returns DataFrame (rows = target IRR, columns = exit multiple).
+    """
 
-    results_df = pd.DataFrame(results)
+    target_irrs = np.asarray(target_irrs, dtype=float)
+    exit_multiples = np.asarray(exit_multiples, dtype=float)
 
-    # Find closest to target IRR
-    results_df['irr_diff'] = abs(results_df['irr'] - target_irr)
-    closest = results_df.loc[results_df['irr_diff'].idxmin()]
+    result = solve_entry_price(target_irrs[:, None], exit_multiples[None, :])
 
-    return closest
+    return pd.DataFrame(result['entry_price'], index=target_irrs, columns=exit_multiples)
 
 # ============================================================================
 # STEP 6: GENERATE LBO REPORT
 # ============================================================================
 
-def generate_lbo_report():
-    """Generate comprehensive LBO analysis report"""
+def generate_lbo_report(monte_carlo_paths=100_000, monte_carlo_workers=1):
+    """
+    Generate comprehensive LBO analysis report
+
+    The Monte Carlo step defaults to 100k paths in-process; pass e.g.
+    monte_carlo_paths=1_000_000, monte_carlo_workers=None for the full
+    multi-process run.
+    """
 
     print("=" * 80)
     print("UHS LBO VALUATION MODEL")
@@ -361,15 +1179,17 @@ def generate_lbo_report():
     # Base case entry price: $355/share (midpoint of recommended range)
     entry_price = 355
     exit_multiple = 9.0  # Conservative exit (slightly below entry)
+    hold_period = 5  # Exit at the end of projection year 5
+    assumptions = default_lbo_assumptions()
 
     print(f"BASE CASE ASSUMPTIONS")
     print("-" * 80)
     print(f"Entry Price:           ${entry_price:.2f}/share")
     print(f"Exit Multiple:         {exit_multiple:.1f}x EBITDA")
-    print(f"Hold Period:           5 years")
-    print(f"Revenue Growth:        4% annually")
-    print(f"EBITDA Margin Target:  19% (from synergies)")
-    print(f"Exit Year:             2030")
+    print(f"Hold Period:           {hold_period} years")
+    print(f"Revenue Growth:        {assumptions['revenue_growth']:.0%} annually")
+    print(f"EBITDA Margin Target:  {assumptions['ebitda_margin_target']:.0%} (from synergies)")
+    print(f"Exit Year:             {LBO_BASE_FISCAL_YEAR + hold_period}")
     print()
 
     # Build transaction
@@ -409,10 +1229,10 @@ def generate_lbo_report():
     print()
 
     # Projections
-    print("STEP 3: 5-YEAR FINANCIAL PROJECTIONS")
+    print(f"STEP 3: {hold_period}-YEAR FINANCIAL PROJECTIONS")
     print("-" * 80)
 
-    projections = build_lbo_projections(transaction, sources_uses_result)
+    projections = build_lbo_projections(transaction, sources_uses_result, n_years=hold_period)
 
     proj_df = pd.DataFrame(projections)
     proj_display = proj_df[['year', 'revenue', 'ebitda', 'ebitda_margin', 'ebit', 'net_income',
@@ -426,9 +1246,9 @@ def generate_lbo_report():
     print("STEP 4: EXIT VALUATION & RETURNS")
     print("-" * 80)
 
-    returns = calculate_lbo_returns(projections, sources_uses_result, exit_multiple)
+    returns = calculate_lbo_returns(projections, sources_uses_result, exit_multiple, exit_year=hold_period)
 
-    print(f"Exit Year 5 EBITDA:        ${returns['exit_ebitda']:,.0f}M")
+    print(f"Exit Year {returns['exit_year']} EBITDA:        ${returns['exit_ebitda']:,.0f}M")
     print(f"Exit Multiple:             {returns['exit_multiple']:.1f}x")
     print(f"Exit Enterprise Value:     ${returns['exit_enterprise_value']:,.0f}M")
     print(f"Less: Exit Debt:           ${returns['exit_debt']:,.0f}M")
@@ -458,6 +1278,26 @@ def generate_lbo_report():
     print((irr_pivot * 100).round(1).to_string())
     print()
 
+    # Monte Carlo downside
+    print(f"STEP 5B: MONTE CARLO DOWNSIDE ({monte_carlo_paths:,} Paths, Covenant Tracking)")
+    print("-" * 80)
+
+    monte_carlo = lbo_monte_carlo(entry_price, exit_multiple, n_paths=monte_carlo_paths,
+                                  n_workers=monte_carlo_workers)
+    irr_p = monte_carlo['irr_percentiles']
+
+    print(f"IRR P10 / P50 / P90:       {irr_p[0.10]:.1%} / {irr_p[0.50]:.1%} / {irr_p[0.90]:.1%}")
+    print(f"MOIC P50:                  {monte_carlo['moic_percentiles'][0.50]:.2f}x")
+    for hurdle, prob in monte_carlo['prob_irr_below'].items():
+        print(f"{f'P(IRR < {hurdle:.0%}):':<27}{prob:.1%}")
+    print(f"P(Covenant Breach):        {monte_carlo['breach_probability']:.2%}"
+          f"  (leverage {monte_carlo['leverage_breach_probability']:.2%},"
+          f" coverage {monte_carlo['coverage_breach_probability']:.2%})")
+    print()
+    print("Cumulative breach probability by year:")
+    print(monte_carlo['time_to_breach'].to_string(index=False))
+    print()
+
     # Reverse LBO
     print("STEP 6: REVERSE LBO (Target Returns)")
     print("-" * 80)
@@ -511,7 +1351,7 @@ def generate_lbo_report():
         'exit_equity_value': returns['exit_equity_value'],
         'moic': returns['moic'],
         'irr': returns['irr'],
-        'hold_period_years': 5,
+        'hold_period_years': returns['exit_year'],
     }
 
     summary_df = pd.DataFrame([base_case_summary])
@@ -523,7 +1363,7 @@ def generate_lbo_report():
     print("LBO VALUATION COMPLETE!")
     print("=" * 80)
     print()
-    print(f"KEY TAKEAWAY: At ${entry_price}/share entry, Ascendra earns {returns['irr']:.1%} IRR (5-year hold)")
+    print(f"KEY TAKEAWAY: At ${entry_price}/share entry, Ascendra earns {returns['irr']:.1%} IRR ({returns['exit_year']}-year hold)")
     print(f"              This is {'ATTRACTIVE' if returns['irr'] >= 0.25 else 'ACCEPTABLE' if returns['irr'] >= 0.20 else 'BELOW TARGET'} for a healthcare LBO")
     print()
 
@@ -533,6 +1373,7 @@ def generate_lbo_report():
         'projections': projections,
         'returns': returns,
         'scenarios': scenarios,
+        'monte_carlo': monte_carlo,
     }
 
 # ============================================================================
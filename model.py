@@ -8,9 +8,12 @@ framework to identify hidden value in the current market valuation.
 
 import pandas as pd
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Dict, Optional
 
+from sotp_kernel import sotp_valuation_kernel
+from utils.labeled_cube import LabeledCube, orthogonal_grid
+
 # ==========================================
 # CONFIDENTIALITY BANNER
 # ==========================================
@@ -159,6 +162,9 @@ def calculate_sotp(data: dict, multiples: dict, scenario: str = "base"):
     """
     Calculate Sum-of-the-Parts valuation.
 
+    Multiples (and the data fields) may be NumPy arrays; the arithmetic
+    runs through sotp_kernel and broadcasts.
+
     Args:
         data: UHS financial data dictionary
         multiples: Valuation multiples dictionary
@@ -172,13 +178,9 @@ def calculate_sotp(data: dict, multiples: dict, scenario: str = "base"):
     capital = data["capital_structure"]
     overhead = data["corporate_overhead"]
 
-    # 1. Acute Care Valuation (EV)
+    # 1-2. Segment multiples (Acute Care, Behavioral Health)
     acute_multiple = multiples["acute_care"][scenario]
-    acute_ev = segments["acute_care"].ebitda * acute_multiple
-
-    # 2. Behavioral Health Valuation (EV)
     behavioral_multiple = multiples["behavioral"][scenario]
-    behavioral_ev = segments["behavioral"].ebitda * behavioral_multiple
 
     # 3. Real Estate Valuation (use higher of two methods)
     # Method A: Cap rate on annual rent
@@ -190,27 +192,30 @@ def calculate_sotp(data: dict, multiples: dict, scenario: str = "base"):
     re_value_sqft = real_estate.owned_sqft * sqft_value
 
     # Take the higher of the two methods (conservative approach)
-    real_estate_value = max(re_value_cap_rate, re_value_sqft)
+    real_estate_value = np.maximum(re_value_cap_rate, re_value_sqft)
 
     # 4. Corporate Overhead Adjustment (NPV of savings)
     # Assume 10x multiple on annual overhead reduction
     overhead_savings_annual = overhead["current_annual"] - overhead["optimized_annual"]
     overhead_value_creation = overhead_savings_annual * 10
 
-    # 5. Sum of Operating Values
-    total_operating_value = acute_ev + behavioral_ev
-
-    # 6. Add Real Estate Value
-    total_enterprise_value = total_operating_value + real_estate_value
-
-    # 7. Subtract Net Debt to get Equity Value
-    equity_value = total_enterprise_value - capital.net_debt
-
-    # 8. Add Overhead Value Creation
-    total_equity_value = equity_value + overhead_value_creation
-
-    # 9. Per-Share Value
-    value_per_share = total_equity_value / capital.shares_outstanding
+    # 5-9. Operating EVs + real estate - net debt + overhead -> per share
+    sotp = sotp_valuation_kernel(
+        opco={
+            "acute_care": (segments["acute_care"].ebitda, acute_multiple),
+            "behavioral": (segments["behavioral"].ebitda, behavioral_multiple),
+        },
+        other_ev={"real_estate": real_estate_value},
+        net_debt=capital.net_debt,
+        shares=capital.shares_outstanding,
+        equity_adjustments={"overhead": overhead_value_creation},
+    )
+
+    acute_ev = sotp["opco_values"]["acute_care"]
+    behavioral_ev = sotp["opco_values"]["behavioral"]
+    total_enterprise_value = sotp["enterprise_value"]
+    total_equity_value = sotp["equity_value"]
+    value_per_share = sotp["value_per_share"]
 
     # Current Market Metrics
     current_market_cap = capital.market_cap
@@ -288,39 +293,80 @@ def run_all_scenarios(data: dict, multiples: dict):
 # 5. SENSITIVITY ANALYSIS
 # ==========================================
 
-def sensitivity_analysis(data: dict, multiples: dict):
-    """
-    Create sensitivity table for key drivers.
-
-    Returns DataFrame with sensitivity matrix.
+# Sensitivity axes -> (multiples key) or (data section, dataclass field)
+SENSITIVITY_MULTIPLE_AXES = {
+    "behavioral_multiple": "behavioral",
+    "acute_multiple": "acute_care",
+    "cap_rate": "real_estate_cap_rate",
+    "sqft_value": "real_estate_sqft",
+}
+SENSITIVITY_DATA_AXES = {
+    "annual_rent_potential": "real_estate",
+    "owned_sqft": "real_estate",
+}
+
+def sotp_sensitivity(data: dict, multiples: dict, scenario: str = "base", **axes) -> LabeledCube:
     """
-    base_result = calculate_sotp(data, multiples, "base")
-    base_value = base_result["metrics"]["SOTP Value per Share"]
+    SOTP value per share over any combination of driver axes.
 
-    # Sensitivity on Behavioral Multiple (biggest driver)
-    behavioral_multiples = np.arange(8.0, 13.0, 0.5)
-    acute_multiples = np.arange(5.0, 9.0, 0.5)
+    Axes (keyword name -> values) may be any of the multiples
+    (behavioral_multiple, acute_multiple, cap_rate, sqft_value) or the
+    real estate fields annual_rent_potential and owned_sqft. Each axis gets
+    its own dimension and the whole grid is one broadcast calculate_sotp
+    call on fresh dictionaries / dataclass copies. The caller's data and
+    multiples are never modified.
 
-    sensitivity_data = []
+    Returns a LabeledCube with value per share, change vs base, implied
+    upside, real estate value and equity value.
+    """
+    unknown = set(axes) - set(SENSITIVITY_MULTIPLE_AXES) - set(SENSITIVITY_DATA_AXES)
+    if unknown:
+        raise ValueError(f"Unknown sensitivity axes: {sorted(unknown)}")
 
-    for behav_mult in behavioral_multiples:
-        for acute_mult in acute_multiples:
-            # Temporarily adjust multiples
-            temp_multiples = multiples.copy()
-            temp_multiples["behavioral"]["base"] = behav_mult
-            temp_multiples["acute_care"]["base"] = acute_mult
+    dims, coords, grid = orthogonal_grid(axes)
 
-            result = calculate_sotp(data, temp_multiples, "base")
-            value_per_share = result["metrics"]["SOTP Value per Share"]
+    grid_multiples = {
+        key: {scenario: grid[axis] if axis in axes else multiples[key][scenario]}
+        for axis, key in SENSITIVITY_MULTIPLE_AXES.items()
+    }
+    grid_data = dict(data)
+    grid_data["real_estate"] = replace(
+        data["real_estate"],
+        **{axis: grid[axis] for axis in SENSITIVITY_DATA_AXES if axis in axes},
+    )
+
+    base_value = calculate_sotp(data, multiples, scenario)["metrics"]["SOTP Value per Share"]
+    result = calculate_sotp(grid_data, grid_multiples, scenario)
+
+    return LabeledCube(dims, coords, {
+        "value_per_share": result["metrics"]["SOTP Value per Share"],
+        "vs_base": result["metrics"]["SOTP Value per Share"] - base_value,
+        "implied_upside_pct": result["metrics"]["Implied Upside (%)"],
+        "real_estate_value": result["components"]["Real Estate Value"],
+        "equity_value": result["metrics"]["SOTP Equity Value"],
+    })
 
-            sensitivity_data.append({
-                "Behavioral Multiple": behav_mult,
-                "Acute Multiple": acute_mult,
-                "Value per Share": value_per_share,
-                "vs Base": value_per_share - base_value,
-            })
+def sensitivity_analysis(data: dict, multiples: dict):
+    """
+    Create sensitivity table for key drivers.
 
-    return pd.DataFrame(sensitivity_data)
+    Returns DataFrame with sensitivity matrix.
+    """
+    # Sensitivity on Behavioral Multiple (biggest driver)
+    cube = sotp_sensitivity(
+        data, multiples, "base",
+        behavioral_multiple=np.arange(8.0, 13.0, 0.5),
+        acute_multiple=np.arange(5.0, 9.0, 0.5),
+    )
+
+    table = cube.to_frame().reset_index()
+
+    return table.rename(columns={
+        "behavioral_multiple": "Behavioral Multiple",
+        "acute_multiple": "Acute Multiple",
+        "value_per_share": "Value per Share",
+        "vs_base": "vs Base",
+    })[["Behavioral Multiple", "Acute Multiple", "Value per Share", "vs Base"]]
 
 # ==========================================
 # USAGE EXAMPLE
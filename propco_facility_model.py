@@ -0,0 +1,348 @@
+"""
+UHS FACILITY-LEVEL PROPCO MODEL
+Bottom-Up Real Estate Valuation of Every Owned Facility
+
+Purpose: Replace the single segment-level rent-per-bed imputation with a
+facility-by-facility PropCo: each owned property gets its own imputed
+rent (rent per bed x beds) and cap rate (segment base + state spread +
+size spread, or a facility override), and segment / state / size totals
+are vectorized groupbys over the portfolio.
+
+Aggregates are cached and updated incrementally: changing one facility's
+assumptions only re-values that facility and applies its delta to the
+totals, so facility-level what-ifs do not recompute the portfolio.
+
+Facility lists: Assets/Automation/Claude/ (US acute, US behavioral with
+NPI, UK behavioral). Owned / leased bed totals tie to 10-K Note 9.
+
+Author: Investment Analysis Team
+Date: October 30, 2025
+"""
+
+import pandas as pd
+import numpy as np
+
+from sotp_kernel import default_sotp_capital_structure, sotp_valuation_kernel
+from sotp_valuation_model_v3_corrected import load_10k_data, normalize_ebitda_for_sotp
+
+# ============================================================================
+# STEP 1: LOAD FACILITY PORTFOLIO
+# ============================================================================
+
+FACILITY_DATA_DIR = 'Assets/Automation/Claude'
+
+US_STATE_CODES = {
+    'Alabama': 'AL', 'Alaska': 'AK', 'Arizona': 'AZ', 'Arkansas': 'AR', 'California': 'CA',
+    'Colorado': 'CO', 'Connecticut': 'CT', 'Delaware': 'DE', 'D.C.': 'DC', 'Florida': 'FL',
+    'Georgia': 'GA', 'Hawaii': 'HI', 'Idaho': 'ID', 'Illinois': 'IL', 'Indiana': 'IN',
+    'Iowa': 'IA', 'Kansas': 'KS', 'Kentucky': 'KY', 'Louisiana': 'LA', 'Maine': 'ME',
+    'Maryland': 'MD', 'Massachusetts': 'MA', 'Michigan': 'MI', 'Minnesota': 'MN',
+    'Mississippi': 'MS', 'Missouri': 'MO', 'Montana': 'MT', 'Nebraska': 'NE', 'Nevada': 'NV',
+    'New Hampshire': 'NH', 'New Jersey': 'NJ', 'New Mexico': 'NM', 'New York': 'NY',
+    'North Carolina': 'NC', 'North Dakota': 'ND', 'Ohio': 'OH', 'Oklahoma': 'OK',
+    'Oregon': 'OR', 'Pennsylvania': 'PA', 'Rhode Island': 'RI', 'South Carolina': 'SC',
+    'South Dakota': 'SD', 'Tennessee': 'TN', 'Texas': 'TX', 'Utah': 'UT', 'Vermont': 'VT',
+    'Virginia': 'VA', 'Washington': 'WA', 'West Virginia': 'WV', 'Wisconsin': 'WI',
+    'Wyoming': 'WY',
+}
+
+# Bed-count size buckets: (upper bound exclusive, label)
+FACILITY_SIZE_BINS = [0, 50, 150, 300, np.inf]
+FACILITY_SIZE_LABELS = ['micro', 'small', 'medium', 'large']
+
+def _state_from_location(location):
+    """'Las Vegas Nevada' -> 'NV' (longest matching state name at the end)"""
+
+    for name in sorted(US_STATE_CODES, key=len, reverse=True):
+        if location.endswith(name):
+            return US_STATE_CODES[name]
+    return None
+
+def load_facility_portfolio(data_dir=FACILITY_DATA_DIR):
+    """
+    One row per facility: facility, segment, country, state, beds, owned, size_bucket
+
+    Acute locations are 'City State' strings and are mapped to state
+    codes; UK facilities use 'UK' as their state.
+    """
+
+    acute = pd.read_csv(f'{data_dir}/us_acute_care_facilities.csv')
+    behavioral_us = pd.read_csv(f'{data_dir}/UHS_BEHAVIORAL_COMPLETE_WITH_NPI.csv')
+    behavioral_uk = pd.read_csv(f'{data_dir}/uk_behavioral_facilities.csv')
+
+    frames = [
+        pd.DataFrame({
+            'facility': acute['Facility Name'],
+            'segment': 'acute',
+            'country': 'US',
+            'state': acute['Location'].map(_state_from_location),
+            'beds': acute['Number of Beds'],
+            'owned': acute['Property Ownership'].str.lower() == 'owned',
+        }),
+        pd.DataFrame({
+            'facility': behavioral_us['Facility_Name'],
+            'segment': 'behavioral',
+            'country': 'US',
+            'state': behavioral_us['State'],
+            'beds': behavioral_us['Beds'],
+            'owned': behavioral_us['Ownership'].str.lower() == 'owned',
+        }),
+        pd.DataFrame({
+            'facility': behavioral_uk['Facility Name'],
+            'segment': 'behavioral',
+            'country': 'UK',
+            'state': 'UK',
+            'beds': behavioral_uk['Number of Beds'],
+            'owned': behavioral_uk['Property Ownership'].str.lower() == 'owned',
+        }),
+    ]
+
+    facilities = pd.concat(frames, ignore_index=True)
+    facilities['beds'] = facilities['beds'].astype(float)
+    facilities['size_bucket'] = _size_bucket(facilities['beds'])
+    facilities.index.name = 'facility_id'
+    return facilities
+
+def _size_bucket(beds):
+    return pd.cut(beds, FACILITY_SIZE_BINS, right=False, labels=FACILITY_SIZE_LABELS).astype(str)
+
+# ============================================================================
+# STEP 2: ASSUMPTIONS
+# ============================================================================
+
+def default_facility_assumptions(normalized_data=None):
+    """
+    Rent per bed and cap rate tables for the facility PropCo
+
+    - rent_per_bed: segment market rent per bed ($M/bed/year), default
+      the rate normalize_ebitda_for_sotp imputes on owned beds (10-K
+      actual rent per leased bed unless overridden)
+    - rent_per_bed_size_factor: multiplier on rent per bed by size bucket
+    - base_cap_rate: segment cap rate (v3 base case 6.5%)
+    - state_cap_rate_spread / size_cap_rate_spread: additive spreads
+      (decimals) by state code and size bucket; missing keys are 0
+
+    With factors of 1.0 and zero spreads the facility PropCo ties exactly
+    to the v3 segment-level imputation.
+    """
+
+    normalized_data = normalized_data or normalize_ebitda_for_sotp(load_10k_data())
+
+    return {
+        'rent_per_bed': {
+            segment: normalized_data[segment]['rent_per_bed'] for segment in ['acute', 'behavioral']
+        },
+        'rent_per_bed_size_factor': {label: 1.0 for label in FACILITY_SIZE_LABELS},
+        'base_cap_rate': {'acute': 0.065, 'behavioral': 0.065},
+        'state_cap_rate_spread': {},
+        'size_cap_rate_spread': {label: 0.0 for label in FACILITY_SIZE_LABELS},
+    }
+
+# ============================================================================
+# STEP 3: FACILITY PROPCO ENGINE
+# ============================================================================
+
+class FacilityPropCo:
+    """Facility-level PropCo valuation with cached, incrementally updated aggregates
+
+    Each owned facility is valued at imputed rent / cap rate. Per-facility
+    overrides (cap_rate, rent_per_bed, beds, owned) are set through
+    update_facilities(), which re-values only the changed rows and applies
+    their deltas to the cached segment / state / size totals.
+    """
+
+    GROUP_LEVELS = ('segment', 'state', 'size_bucket')
+    SUM_COLUMNS = ['facilities', 'owned_facilities', 'owned_beds', 'imputed_rent', 'propco_value']
+
+    def __init__(self, facilities=None, assumptions=None):
+        self.facilities = (load_facility_portfolio() if facilities is None else facilities).copy()
+        self.assumptions = assumptions or default_facility_assumptions()
+
+        for column in ['cap_rate_override', 'rent_per_bed_override']:
+            if column not in self.facilities:
+                self.facilities[column] = np.nan
+
+        self.recalculate()
+
+    def _value(self, rows):
+        """Vectorized rent, cap rate and value for a block of facility rows"""
+
+        a = self.assumptions
+        segment, size = rows['segment'], rows['size_bucket']
+
+        rent_per_bed = (segment.map(a['rent_per_bed']).astype(float)
+                        * size.map(a['rent_per_bed_size_factor']).fillna(1.0).astype(float))
+        rent_per_bed = rows['rent_per_bed_override'].fillna(rent_per_bed)
+
+        cap_rate = (segment.map(a['base_cap_rate']).astype(float)
+                    + rows['state'].map(a['state_cap_rate_spread']).fillna(0.0).astype(float)
+                    + size.map(a['size_cap_rate_spread']).fillna(0.0).astype(float))
+        cap_rate = rows['cap_rate_override'].fillna(cap_rate)
+
+        owned = rows['owned'].to_numpy(dtype=float)
+        imputed_rent = owned * rent_per_bed * rows['beds']
+
+        return pd.DataFrame({
+            'rent_per_bed': rent_per_bed,
+            'cap_rate': cap_rate,
+            'facilities': 1.0,
+            'owned_facilities': owned,
+            'owned_beds': owned * rows['beds'],
+            'imputed_rent': imputed_rent,
+            'propco_value': imputed_rent / cap_rate,
+        }, index=rows.index)
+
+    def recalculate(self):
+        """Full re-valuation (after changing the assumption tables)"""
+
+        self.facilities[list(self._value(self.facilities))] = self._value(self.facilities)
+        self._totals = {
+            level: self.facilities.groupby(level)[self.SUM_COLUMNS].sum()
+            for level in self.GROUP_LEVELS
+        }
+        return self
+
+    def update_facilities(self, facility_ids, **changes):
+        """
+        Override cap_rate, rent_per_bed, beds and/or owned for some facilities
+
+        Values may be scalars or per-facility sequences; pass None to clear
+        a cap_rate / rent_per_bed override. Only the changed rows are
+        re-valued; cached aggregates move by the changed rows' deltas.
+        """
+
+        allowed = {'cap_rate': 'cap_rate_override', 'rent_per_bed': 'rent_per_bed_override',
+                   'beds': 'beds', 'owned': 'owned'}
+        unknown = set(changes) - set(allowed)
+        if unknown:
+            raise ValueError(f"Unknown facility assumptions: {sorted(unknown)}")
+
+        ids = pd.Index(np.atleast_1d(facility_ids))
+        before = self.facilities.loc[ids, list(self.GROUP_LEVELS) + self.SUM_COLUMNS]
+
+        for name, value in changes.items():
+            self.facilities.loc[ids, allowed[name]] = np.nan if value is None else value
+        if 'beds' in changes:
+            self.facilities.loc[ids, 'size_bucket'] = _size_bucket(self.facilities.loc[ids, 'beds'])
+
+        rows = self.facilities.loc[ids]
+        after = self._value(rows)
+        self.facilities.loc[ids, list(after)] = after
+
+        after = self.facilities.loc[ids, list(self.GROUP_LEVELS) + self.SUM_COLUMNS]
+        for level, totals in self._totals.items():
+            delta = (after.groupby(level)[self.SUM_COLUMNS].sum()
+                     .sub(before.groupby(level)[self.SUM_COLUMNS].sum(), fill_value=0.0))
+            self._totals[level] = totals.add(delta, fill_value=0.0)
+
+        return self.aggregate('segment')
+
+    def facility_ids(self, names):
+        """Facility ids for one or more facility names"""
+
+        names = [names] if isinstance(names, str) else list(names)
+        matches = self.facilities.index[self.facilities['facility'].isin(names)]
+        missing = set(names) - set(self.facilities.loc[matches, 'facility'])
+        if missing:
+            raise KeyError(f"Unknown facilities: {sorted(missing)}")
+        return matches
+
+    def aggregate(self, level='segment'):
+        """Cached totals by segment, state or size_bucket, with implied cap rate"""
+
+        if level not in self._totals:
+            raise ValueError(f"level must be one of {self.GROUP_LEVELS}")
+
+        totals = self._totals[level].copy()
+        totals['implied_cap_rate'] = totals['imputed_rent'] / totals['propco_value'].replace(0.0, np.nan)
+        return totals
+
+# ============================================================================
+# STEP 4: FACILITY-BASED SOTP
+# ============================================================================
+
+def facility_sotp_valuation(propco, normalized_data, behavioral_multiple=9.5, acute_multiple=7.0,
+                            leased_rent_cap_rate=0.065):
+    """
+    Four-part SOTP with PropCo built bottom-up from the facility engine
+
+    Per segment, PropCo NOI = actual rent (valued at leased_rent_cap_rate,
+    as in v3) + facility imputed rent on owned beds (valued facility by
+    facility); OpCo EBITDA = EBITDAR - PropCo NOI.
+    """
+
+    capital = default_sotp_capital_structure()
+    segments = propco.aggregate('segment')
+
+    opco, parts = {}, {}
+    for segment, multiple in [('behavioral', behavioral_multiple), ('acute', acute_multiple)]:
+        d = normalized_data[segment]
+        owned = segments.loc[segment]
+        opco[segment] = (d['ebitdar'] - d['actual_rent'] - owned['imputed_rent'], multiple)
+        parts[f'{segment}_leased_rent'] = (d['actual_rent'], leased_rent_cap_rate)
+        parts[f'{segment}_owned'] = (owned['imputed_rent'], owned['implied_cap_rate'])
+
+    return sotp_valuation_kernel(opco, parts, net_debt=capital['net_debt'],
+                                 shares=capital['shares_outstanding'])
+
+# ============================================================================
+# STEP 5: REPORT
+# ============================================================================
+
+def generate_facility_propco_report():
+    """Print the facility PropCo reconciliation and an example facility what-if"""
+
+    print("=" * 100)
+    print("UHS FACILITY-LEVEL PROPCO VALUATION")
+    print("=" * 100)
+    print()
+
+    normalized = normalize_ebitda_for_sotp(load_10k_data())
+    propco = FacilityPropCo(assumptions=default_facility_assumptions(normalized))
+
+    segments = propco.aggregate('segment')
+    print("PROPCO BY SEGMENT ($M)")
+    print("-" * 100)
+    print(segments.round(3).to_string())
+    print()
+
+    print("RECONCILIATION TO SEGMENT-LEVEL IMPUTATION (v3)")
+    print("-" * 100)
+    for segment in ['acute', 'behavioral']:
+        print(f"{segment.title():<12} owned beds {segments.loc[segment, 'owned_beds']:>8,.0f} "
+              f"(10-K {normalized[segment]['owned_beds']:>8,})   imputed rent "
+              f"${segments.loc[segment, 'imputed_rent']:>7.1f}M (v3 ${normalized[segment]['imputed_rent_owned']:.1f}M)")
+    print()
+
+    print("TOP 10 STATES BY PROPCO VALUE ($M)")
+    print("-" * 100)
+    print(propco.aggregate('state').nlargest(10, 'propco_value').round(3).to_string())
+    print()
+
+    print("PROPCO BY FACILITY SIZE ($M)")
+    print("-" * 100)
+    print(propco.aggregate('size_bucket').round(3).to_string())
+    print()
+
+    base = facility_sotp_valuation(propco, normalized)
+    largest = propco.facilities.loc[propco.facilities['owned']].nlargest(1, 'propco_value')
+    facility_id = largest.index[0]
+    propco.update_facilities(facility_id, cap_rate=largest['cap_rate'].iloc[0] + 0.01)
+    what_if = facility_sotp_valuation(propco, normalized)
+    propco.update_facilities(facility_id, cap_rate=None)
+
+    print("FACILITY WHAT-IF")
+    print("-" * 100)
+    print(f"Base SOTP value per share: ${base['value_per_share']:.2f}")
+    print(f"{largest['facility'].iloc[0]} cap rate +100 bps: ${what_if['value_per_share']:.2f} "
+          f"({what_if['value_per_share'] - base['value_per_share']:+.2f})")
+    print()
+
+    return {'propco': propco, 'sotp': base}
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    results = generate_facility_propco_report()
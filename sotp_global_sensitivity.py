@@ -0,0 +1,255 @@
+"""
+UHS SOTP GLOBAL SENSITIVITY ANALYSIS
+Variance-Based (Sobol) and Screening (Morris) Sensitivity for the v3 SOTP
+
+Purpose: Vary every SOTP assumption at once (OpCo multiples, PropCo cap
+rates, rent-per-bed imputation, net debt, share count) and attribute the
+variance of value per share to each driver, instead of moving two
+drivers at a time in a heatmap.
+
+- Sobol: Saltelli design, first-order (S1) and total-order (ST) indices
+  with bootstrap confidence intervals
+- Morris: elementary effects (mu*, sigma) as a cheap screening pass
+
+All designs are evaluated in one batched call through sotp_kernel.
+
+Author: Investment Analysis Team
+Date: October 30, 2025
+"""
+
+import pandas as pd
+import numpy as np
+from scipy.stats import qmc
+
+from sotp_kernel import default_sotp_capital_structure, four_part_sotp
+from sotp_valuation_model_v3_corrected import load_10k_data, normalize_ebitda_for_sotp, normalize_segment_rent
+
+# ============================================================================
+# STEP 1: FACTOR RANGES
+# ============================================================================
+
+def default_global_sensitivity_ranges():
+    """
+    Uniform (low, high) range for each SOTP driver
+
+    rent_per_bed_factor scales the imputed market rent per owned bed
+    (1.0 = rent per leased bed from the 10-K), which moves value between
+    OpCo EBITDA and PropCo NOI.
+    """
+
+    capital = default_sotp_capital_structure()
+
+    return {
+        'behavioral_multiple': (8.0, 11.0),
+        'acute_multiple': (6.0, 8.0),
+        'behavioral_cap_rate': (0.055, 0.075),
+        'acute_cap_rate': (0.055, 0.075),
+        'rent_per_bed_factor': (0.75, 1.25),
+        'net_debt': (capital['net_debt'] * 0.9, capital['net_debt'] * 1.1),
+        'shares': (capital['shares_outstanding'] * 0.97, capital['shares_outstanding'] * 1.03),
+    }
+
+# ============================================================================
+# STEP 2: BATCHED V3 SOTP
+# ============================================================================
+
+def sotp_v3_value_per_share(normalized_data, factors):
+    """
+    Value per share for arrays of factor values (dict of equal-length arrays)
+
+    Imputed rent on owned beds is rebuilt from the scaled rent per leased
+    bed through normalize_segment_rent, the same step used by
+    normalize_ebitda_for_sotp.
+    """
+
+    segments = {}
+    for segment in ['behavioral', 'acute']:
+        d = normalized_data[segment]
+        normalized = normalize_segment_rent(
+            d['reported_ebitda'], d['actual_rent'], d['owned_beds'], d['leased_beds'],
+            rent_per_bed=factors['rent_per_bed_factor'] * d['rent_per_leased_bed'],
+        )
+        segments[segment] = (normalized['opco_ebitda_normalized'], normalized['propco_noi'])
+
+    return four_part_sotp(
+        segments['behavioral'][0], factors['behavioral_multiple'], segments['behavioral'][1],
+        segments['acute'][0], factors['acute_multiple'], segments['acute'][1],
+        factors['behavioral_cap_rate'], factors['net_debt'], factors['shares'],
+        acute_cap_rate=factors['acute_cap_rate'],
+    )['value_per_share']
+
+def _scale(unit_sample, ranges):
+    """Map a (N, k) unit-hypercube sample onto the factor ranges"""
+
+    low = np.array([lo for lo, _ in ranges.values()])
+    high = np.array([hi for _, hi in ranges.values()])
+    values = low + unit_sample * (high - low)
+    return {name: values[..., i] for i, name in enumerate(ranges)}
+
+# ============================================================================
+# STEP 3: SOBOL INDICES (SALTELLI DESIGN)
+# ============================================================================
+
+def _sobol_estimates(f_a, f_b, f_ab):
+    """First-order (Saltelli 2010) and total-order (Jansen) estimators
+
+    f_a, f_b: (..., N); f_ab: (k, ..., N). Leading axes are bootstrap draws.
+    Outputs are centred first, which leaves the estimators unbiased but
+    removes most of the S1 sampling noise from the large mean value.
+    """
+
+    pooled = np.concatenate([f_a, f_b], axis=-1)
+    mean = pooled.mean(axis=-1, keepdims=True)
+    variance = pooled.var(axis=-1)
+    first_order = np.mean((f_b - mean) * (f_ab - f_a), axis=-1) / variance
+    total_order = 0.5 * np.mean((f_a - f_ab) ** 2, axis=-1) / variance
+    return first_order, total_order
+
+def sobol_analysis(normalized_data, ranges=None, n_base=2 ** 14, n_bootstrap=500,
+                   confidence=0.95, seed=42):
+    """
+    First- and total-order Sobol indices of value per share
+
+    Uses a scrambled Sobol sequence for the A and B matrices and the
+    Saltelli radial design (A with column i taken from B), i.e.
+    n_base x (k + 2) model evaluations in one batched call. Confidence
+    intervals come from resampling the n_base rows.
+
+    Returns:
+        Dictionary with the indices DataFrame (one row per factor) and
+        run metadata
+    """
+
+    ranges = ranges or default_global_sensitivity_ranges()
+    names = list(ranges)
+    k = len(names)
+
+    unit = qmc.Sobol(d=2 * k, scramble=True, seed=seed).random(n_base)
+    a, b = unit[:, :k], unit[:, k:]
+
+    # Stack A, B and the k hybrid matrices AB_i: (k + 2, N, k)
+    ab = np.repeat(a[None], k, axis=0)
+    ab[np.arange(k), :, np.arange(k)] = b[:, np.arange(k)].T
+    design = np.concatenate([a[None], b[None], ab], axis=0)
+
+    f = sotp_v3_value_per_share(normalized_data, _scale(design, ranges))
+    f_a, f_b, f_ab = f[0], f[1], f[2:]
+
+    first_order, total_order = _sobol_estimates(f_a, f_b, f_ab)
+
+    # Bootstrap over base rows, one factor at a time to bound memory
+    rng = np.random.default_rng(seed)
+    rows = rng.integers(0, n_base, size=(n_bootstrap, n_base))
+    boot_first = np.empty((k, n_bootstrap))
+    boot_total = np.empty((k, n_bootstrap))
+    for i in range(k):
+        boot_first[i], boot_total[i] = _sobol_estimates(f_a[rows], f_b[rows], f_ab[i][rows])
+
+    tail = (1 - confidence) / 2
+    indices = pd.DataFrame({
+        'S1': first_order,
+        'S1_low': np.quantile(boot_first, tail, axis=1),
+        'S1_high': np.quantile(boot_first, 1 - tail, axis=1),
+        'ST': total_order,
+        'ST_low': np.quantile(boot_total, tail, axis=1),
+        'ST_high': np.quantile(boot_total, 1 - tail, axis=1),
+    }, index=pd.Index(names, name='factor'))
+
+    return {
+        'indices': indices.sort_values('ST', ascending=False),
+        'n_evaluations': int(f.size),
+        'mean_value_per_share': float(np.mean(np.concatenate([f_a, f_b]))),
+        'std_value_per_share': float(np.std(np.concatenate([f_a, f_b]))),
+        'ranges': ranges,
+        'seed': seed,
+    }
+
+# ============================================================================
+# STEP 4: MORRIS ELEMENTARY EFFECTS (SCREENING)
+# ============================================================================
+
+def morris_analysis(normalized_data, ranges=None, n_trajectories=1_000, n_levels=4, seed=42):
+    """
+    Morris elementary effects: mu* (mean |effect|) and sigma per factor
+
+    Each trajectory starts on the p-level grid and moves one factor at a
+    time by delta = p / (2(p - 1)) in random order and direction. Effects
+    are in $/share per full factor range.
+    """
+
+    ranges = ranges or default_global_sensitivity_ranges()
+    names = list(ranges)
+    k = len(names)
+    delta = n_levels / (2 * (n_levels - 1))
+    rng = np.random.default_rng(seed)
+
+    # Start points on the grid such that a +/- delta step stays inside [0, 1]
+    levels = np.arange(n_levels) / (n_levels - 1)
+    start = rng.choice(levels[levels <= 1 - delta + 1e-12], size=(n_trajectories, k))
+    direction = rng.choice([-1.0, 1.0], size=(n_trajectories, k))
+    start = np.where(direction < 0, start + delta, start)
+
+    order = np.argsort(rng.random((n_trajectories, k)), axis=1)
+    steps = np.zeros((n_trajectories, k + 1, k))
+    rows = np.arange(n_trajectories)
+    for m in range(k):
+        steps[:, m + 1] = steps[:, m]
+        steps[rows, m + 1, order[:, m]] = direction[rows, order[:, m]] * delta
+
+    trajectories = start[:, None, :] + steps  # (r, k + 1, k)
+    f = sotp_v3_value_per_share(normalized_data, _scale(trajectories, ranges))
+
+    # Effect of the factor moved at step m
+    effects = np.empty((n_trajectories, k))
+    moved_direction = direction[rows[:, None], order]
+    effects[rows[:, None], order] = np.diff(f, axis=1) / (moved_direction * delta)
+
+    table = pd.DataFrame({
+        'mu': effects.mean(axis=0),
+        'mu_star': np.abs(effects).mean(axis=0),
+        'sigma': effects.std(axis=0, ddof=1),
+    }, index=pd.Index(names, name='factor'))
+
+    return {
+        'effects': table.sort_values('mu_star', ascending=False),
+        'n_evaluations': int(f.size),
+        'ranges': ranges,
+        'seed': seed,
+    }
+
+# ============================================================================
+# STEP 5: REPORT
+# ============================================================================
+
+def generate_global_sensitivity_report():
+    """Print Sobol and Morris rankings for the v3 SOTP"""
+
+    print("=" * 100)
+    print("UHS SOTP v3 - GLOBAL SENSITIVITY ANALYSIS")
+    print("=" * 100)
+    print()
+
+    normalized = normalize_ebitda_for_sotp(load_10k_data())
+
+    sobol = sobol_analysis(normalized)
+    print(f"SOBOL INDICES ({sobol['n_evaluations']:,} evaluations, "
+          f"value/share mean ${sobol['mean_value_per_share']:.2f}, "
+          f"std ${sobol['std_value_per_share']:.2f})")
+    print("-" * 100)
+    print(sobol['indices'].round(3).to_string())
+    print()
+
+    morris = morris_analysis(normalized)
+    print(f"MORRIS ELEMENTARY EFFECTS ({morris['n_evaluations']:,} evaluations, $/share per full range)")
+    print("-" * 100)
+    print(morris['effects'].round(2).to_string())
+    print()
+
+    return {'sobol': sobol, 'morris': morris}
+
+# ============================================================================
+# MAIN EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    results = generate_global_sensitivity_report()
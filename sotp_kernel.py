@@ -0,0 +1,159 @@
+"""
+UHS SOTP CALCULATION KERNEL
+Array-Native Sum-of-the-Parts Arithmetic Shared by All SOTP Models
+
+Purpose: One implementation of the OpCo multiple / PropCo cap rate / net
+debt / per-share bridge used by model.py, the v2 and v3 SOTP models and
+the Streamlit apps. Every input may be a scalar or a NumPy array; arrays
+broadcast against each other, so a single call values one scenario, a
+scenario set or a full sensitivity grid.
+
+Author: Investment Analysis Team
+Date: October 30, 2025
+"""
+
+import numpy as np
+
+from utils.labeled_cube import LabeledCube, orthogonal_grid
+
+# ============================================================================
+# CAPITAL STRUCTURE ($M, from 10-K)
+# ============================================================================
+
+def default_sotp_capital_structure():
+    """Net debt, share count and reference price shared by the SOTP models"""
+
+    return {
+        'net_debt': 4_378.5,  # $4,378.5M (10-K balance sheet & debt schedule)
+        'shares_outstanding': 64.98,  # Million shares (10-K capital structure)
+        'current_price': 208.39,  # As of valuation date
+    }
+
+# ============================================================================
+# SOTP KERNEL
+# ============================================================================
+
+def sotp_valuation_kernel(opco, propco=None, net_debt=0.0, shares=1.0,
+                          other_ev=None, equity_adjustments=None):
+    """
+    Sum-of-the-parts bridge from segment earnings to value per share
+
+    Args:
+        opco: {segment: (ebitda, multiple)} OpCo parts valued at EBITDA x multiple
+        propco: {segment: (noi, cap_rate)} PropCo parts valued at NOI / cap rate
+            (cap rate as a decimal, e.g. 0.065)
+        net_debt: Net debt deducted from enterprise value
+        shares: Share count for the per-share value
+        other_ev: {name: value} other enterprise value components
+        equity_adjustments: {name: value} items added after net debt
+
+    Every value may be a scalar or an array; results take the broadcast
+    shape of all inputs.
+
+    Returns:
+        Dictionary with per-part values and the EV -> equity -> per-share bridge
+    """
+
+    propco = propco or {}
+    other_ev = other_ev or {}
+    equity_adjustments = equity_adjustments or {}
+
+    opco_values = {name: np.multiply(ebitda, multiple) for name, (ebitda, multiple) in opco.items()}
+    propco_values = {name: np.divide(noi, cap_rate) for name, (noi, cap_rate) in propco.items()}
+
+    total_opco_value = sum(opco_values.values(), 0.0)
+    total_propco_value = sum(propco_values.values(), 0.0)
+    total_other_ev = sum(other_ev.values(), 0.0)
+
+    enterprise_value = total_opco_value + total_propco_value + total_other_ev
+    equity_value = enterprise_value - net_debt + sum(equity_adjustments.values(), 0.0)
+    value_per_share = equity_value / np.asarray(shares, dtype=float)
+
+    return {
+        'opco_values': opco_values,
+        'propco_values': propco_values,
+        'other_ev': dict(other_ev),
+        'equity_adjustments': dict(equity_adjustments),
+        'total_opco_value': total_opco_value,
+        'total_propco_value': total_propco_value,
+        'enterprise_value': enterprise_value,
+        'net_debt': net_debt,
+        'equity_value': equity_value,
+        'shares': shares,
+        'value_per_share': value_per_share,
+    }
+
+def four_part_sotp(behavioral_opco_ebitda, behavioral_multiple, behavioral_propco_noi,
+                   acute_opco_ebitda, acute_multiple, acute_propco_noi,
+                   cap_rate, net_debt, shares, acute_cap_rate=None):
+    """
+    Behavioral / acute OpCo + PropCo split used by the v2 / v3 models and apps
+
+    acute_cap_rate defaults to cap_rate (one PropCo cap rate for both
+    segments). All arguments broadcast.
+    """
+
+    acute_cap_rate = cap_rate if acute_cap_rate is None else acute_cap_rate
+
+    return sotp_valuation_kernel(
+        opco={
+            'behavioral': (behavioral_opco_ebitda, behavioral_multiple),
+            'acute': (acute_opco_ebitda, acute_multiple),
+        },
+        propco={
+            'behavioral': (behavioral_propco_noi, cap_rate),
+            'acute': (acute_propco_noi, acute_cap_rate),
+        },
+        net_debt=net_debt,
+        shares=shares,
+    )
+
+# ============================================================================
+# N-DIMENSIONAL SENSITIVITY ENGINE
+# ============================================================================
+
+def four_part_sotp_inputs(behavioral_opco_ebitda, behavioral_propco_noi,
+                          acute_opco_ebitda, acute_propco_noi,
+                          behavioral_multiple, acute_multiple, cap_rate,
+                          net_debt=None, shares=None, acute_cap_rate=None):
+    """Base-case keyword set for four_part_sotp / sotp_sensitivity_cube"""
+
+    capital = default_sotp_capital_structure()
+
+    return {
+        'behavioral_opco_ebitda': behavioral_opco_ebitda,
+        'behavioral_multiple': behavioral_multiple,
+        'behavioral_propco_noi': behavioral_propco_noi,
+        'acute_opco_ebitda': acute_opco_ebitda,
+        'acute_multiple': acute_multiple,
+        'acute_propco_noi': acute_propco_noi,
+        'cap_rate': cap_rate,
+        'acute_cap_rate': acute_cap_rate,
+        'net_debt': capital['net_debt'] if net_debt is None else net_debt,
+        'shares': capital['shares_outstanding'] if shares is None else shares,
+    }
+
+def sotp_sensitivity_cube(base_inputs, axes,
+                          outputs=('value_per_share', 'enterprise_value', 'equity_value')):
+    """
+    Evaluate the four-part SOTP over a full tensor of named axes
+
+    Args:
+        base_inputs: four_part_sotp_inputs() dictionary (held fixed unless varied)
+        axes: ordered {input name: values}, e.g. {'behavioral_multiple': [...],
+            'acute_multiple': [...], 'cap_rate': [...], 'net_debt': [...]}
+        outputs: kernel results to keep in the cube
+
+    Each axis is placed on its own dimension and the kernel is evaluated
+    once by broadcasting. Returns a LabeledCube, so any 2-D pivot or
+    slice is available without recomputation.
+    """
+
+    unknown = set(axes) - set(base_inputs)
+    if unknown:
+        raise ValueError(f"Unknown sensitivity axes: {sorted(unknown)}")
+
+    dims, coords, grid = orthogonal_grid(axes)
+    result = four_part_sotp(**{**base_inputs, **grid})
+
+    return LabeledCube(dims, coords, {name: result[name] for name in outputs})
@@ -17,6 +17,9 @@ import numpy as np
 import json
 from datetime import datetime
 
+from sotp_kernel import (default_sotp_capital_structure, four_part_sotp, four_part_sotp_inputs,
+                         sotp_sensitivity_cube)
+
 # ============================================================================
 # STEP 1: LOAD COMPREHENSIVE 10-K DATA
 # ============================================================================
@@ -153,42 +156,36 @@ def calculate_sotp_valuation(proforma_data, scenario='base'):
     }
 
     params = multiples[scenario]
+    capital = default_sotp_capital_structure()
 
-    # PART 1: BEHAVIORAL OPCO VALUE
+    # OpCo EBITDA x multiple; PropCo value = NOI / Cap Rate, where NOI = Imputed Rent
     behavioral_opco_ebitda = proforma_data['behavioral']['proforma_opco_ebitda']
-    behavioral_opco_value = behavioral_opco_ebitda * params['behavioral_opco_multiple']
-
-    # PART 2: BEHAVIORAL PROPCO VALUE (Cap Rate Method)
-    # Value = NOI / Cap Rate, where NOI = Imputed Rent
     behavioral_propco_noi = proforma_data['behavioral']['imputed_rent']
-    behavioral_propco_value = behavioral_propco_noi / params['cap_rate']
-
-    # PART 3: ACUTE CARE OPCO VALUE
     acute_opco_ebitda = proforma_data['acute']['proforma_opco_ebitda']
-    acute_opco_value = acute_opco_ebitda * params['acute_opco_multiple']
-
-    # PART 4: ACUTE CARE PROPCO VALUE
     acute_propco_noi = proforma_data['acute']['imputed_rent']
-    acute_propco_value = acute_propco_noi / params['cap_rate']
-
-    # TOTAL ENTERPRISE VALUE
-    total_enterprise_value = (
-        behavioral_opco_value +
-        behavioral_propco_value +
-        acute_opco_value +
-        acute_propco_value
+
+    net_debt = capital['net_debt']
+    shares_outstanding = capital['shares_outstanding']
+
+    sotp = four_part_sotp(
+        behavioral_opco_ebitda, params['behavioral_opco_multiple'], behavioral_propco_noi,
+        acute_opco_ebitda, params['acute_opco_multiple'], acute_propco_noi,
+        params['cap_rate'], net_debt, shares_outstanding,
     )
 
-    # EQUITY VALUE (EV - Net Debt)
-    net_debt = 4378.5  # From 10-K: $4,378.5M net debt
-    equity_value = total_enterprise_value - net_debt
+    # PARTS 1-4
+    behavioral_opco_value = sotp['opco_values']['behavioral']
+    behavioral_propco_value = sotp['propco_values']['behavioral']
+    acute_opco_value = sotp['opco_values']['acute']
+    acute_propco_value = sotp['propco_values']['acute']
 
-    # PER SHARE VALUE
-    shares_outstanding = 64.98  # From capital structure
-    value_per_share = equity_value / shares_outstanding
+    # TOTAL ENTERPRISE VALUE -> EQUITY VALUE (EV - Net Debt) -> PER SHARE VALUE
+    total_enterprise_value = sotp['enterprise_value']
+    equity_value = sotp['equity_value']
+    value_per_share = sotp['value_per_share']
 
     # Current market price
-    current_price = 208.39
+    current_price = capital['current_price']
     upside_pct = ((value_per_share - current_price) / current_price) * 100
 
     results = {
@@ -231,38 +228,27 @@ def create_sensitivity_table(proforma_data):
     acute_multiples = np.arange(5.0, 9.5, 0.5)
     cap_rates = np.arange(0.050, 0.085, 0.005)
 
-    # TABLE 1: Value per share vs Behavioral Multiple & Cap Rate
-    sensitivity_1 = pd.DataFrame(index=behavioral_multiples, columns=cap_rates)
-
-    for beh_mult in behavioral_multiples:
-        for cap_rate in cap_rates:
-            # Calculate value with these parameters
-            beh_opco = proforma_data['behavioral']['proforma_opco_ebitda'] * beh_mult
-            beh_propco = proforma_data['behavioral']['imputed_rent'] / cap_rate
-            acute_opco = proforma_data['acute']['proforma_opco_ebitda'] * 7.0  # Hold acute at base
-            acute_propco = proforma_data['acute']['imputed_rent'] / cap_rate
-
-            ev = beh_opco + beh_propco + acute_opco + acute_propco
-            equity = ev - 4378.5
-            per_share = equity / 64.98
-
-            sensitivity_1.loc[beh_mult, cap_rate] = round(per_share, 2)
-
-    # TABLE 2: Value per share vs Behavioral Multiple & Acute Multiple
-    sensitivity_2 = pd.DataFrame(index=behavioral_multiples, columns=acute_multiples)
+    # One cube over all three axes; both tables are slices of it
+    cube = sotp_sensitivity_cube(
+        four_part_sotp_inputs(
+            proforma_data['behavioral']['proforma_opco_ebitda'], proforma_data['behavioral']['imputed_rent'],
+            proforma_data['acute']['proforma_opco_ebitda'], proforma_data['acute']['imputed_rent'],
+            behavioral_multiple=9.5, acute_multiple=7.0, cap_rate=0.065,
+        ),
+        {'behavioral_multiple': behavioral_multiples, 'acute_multiple': acute_multiples, 'cap_rate': cap_rates},
+        outputs=('value_per_share',),
+    )
 
-    for beh_mult in behavioral_multiples:
-        for acute_mult in acute_multiples:
-            beh_opco = proforma_data['behavioral']['proforma_opco_ebitda'] * beh_mult
-            beh_propco = proforma_data['behavioral']['imputed_rent'] / 0.065  # Base cap rate
-            acute_opco = proforma_data['acute']['proforma_opco_ebitda'] * acute_mult
-            acute_propco = proforma_data['acute']['imputed_rent'] / 0.065
+    def table(columns, **fixed):
+        values = cube.pivot('value_per_share', 'behavioral_multiple', columns, **fixed).round(2)
+        values.index.name = values.columns.name = None
+        return values
 
-            ev = beh_opco + beh_propco + acute_opco + acute_propco
-            equity = ev - 4378.5
-            per_share = equity / 64.98
+    # TABLE 1: Value per share vs Behavioral Multiple & Cap Rate (acute held at base 7.0x)
+    sensitivity_1 = table('cap_rate', acute_multiple=7.0)
 
-            sensitivity_2.loc[beh_mult, acute_mult] = round(per_share, 2)
+    # TABLE 2: Value per share vs Behavioral Multiple & Acute Multiple (base 6.5% cap rate)
+    sensitivity_2 = table('acute_multiple', cap_rate=0.065)
 
     return {
         'behavioral_mult_vs_cap_rate': sensitivity_1,
@@ -281,7 +267,8 @@ def calculate_acquisition_premium(base_value_per_share):
     For family-controlled companies: Often require 50-80% premiums
     """
 
-    current_price = 208.39
+    capital = default_sotp_capital_structure()
+    current_price = capital['current_price']
 
     premiums = [0.20, 0.30, 0.40, 0.50, 0.60, 0.70, 0.80]
 
@@ -295,7 +282,7 @@ def calculate_acquisition_premium(base_value_per_share):
         premium_to_fair = ((offer_price - base_value_per_share) / base_value_per_share) * 100
 
         # Total equity value at offer price
-        total_equity_value = offer_price * 64.98  # Million
+        total_equity_value = offer_price * capital['shares_outstanding']  # Million
 
         # Miller family proceeds (11% economic ownership)
         miller_family_proceeds = total_equity_value * 0.108
@@ -306,7 +293,7 @@ def calculate_acquisition_premium(base_value_per_share):
             'premium_to_fair_value_pct': round(premium_to_fair, 1),
             'total_equity_value_m': round(total_equity_value, 0),
             'miller_family_proceeds_m': round(miller_family_proceeds, 0),
-            'enterprise_value_m': round(total_equity_value + 4378.5, 0)
+            'enterprise_value_m': round(total_equity_value + capital['net_debt'], 0)
         })
 
     return pd.DataFrame(results)
@@ -20,6 +20,9 @@ import numpy as np
 import json
 from datetime import datetime
 
+from sotp_kernel import default_sotp_capital_structure, four_part_sotp
+from utils.labeled_cube import LabeledCube, orthogonal_grid
+
 # ============================================================================
 # STEP 1: LOAD 10-K DATA WITH FULL TRACEABILITY
 # ============================================================================
@@ -34,7 +37,57 @@ def load_10k_data():
 # STEP 2: BUILD EBITDA → EBITDAR → NORMALIZED OPCO EBITDA
 # ============================================================================
 
-def normalize_ebitda_for_sotp(data):
+def default_segment_rents():
+    """Actual lease and rental expense by segment ($M)"""
+
+    return {
+        'acute': 99.1,  # 10-K Income Statement (Acute segment detail)
+        'behavioral': 47.0,  # 10-K Income Statement (Behavioral segment detail)
+    }
+
+def normalize_segment_rent(reported_ebitda, actual_rent, owned_beds, leased_beds, rent_per_bed=None):
+    """
+    EBITDA -> EBITDAR -> normalized OpCo EBITDA and PropCo NOI for one segment
+
+    Every input may be a scalar or an array (e.g. a sweep over rent
+    assumptions); outputs broadcast. rent_per_bed overrides the market
+    rent imputed per owned bed, which otherwise defaults to actual rent
+    per leased bed. Both rates are returned: rent_per_leased_bed is
+    always the 10-K actual, rent_per_bed the rate used for imputation.
+    """
+
+    total_beds = owned_beds + leased_beds
+
+    # STEP 1: Calculate EBITDAR (add back actual rent)
+    ebitdar = reported_ebitda + actual_rent
+
+    # STEP 2: Impute market rent on owned facilities ($/bed/year from leased facilities)
+    rent_per_leased_bed = actual_rent / leased_beds
+    rent_per_bed = rent_per_leased_bed if rent_per_bed is None else rent_per_bed
+    imputed_rent_owned = rent_per_bed * owned_beds
+
+    # STEP 3: Total rent (actual + imputed)
+    total_rent = actual_rent + imputed_rent_owned
+
+    return {
+        'actual_rent': actual_rent,
+        'total_beds': total_beds,
+        'owned_beds': owned_beds,
+        'leased_beds': leased_beds,
+        'owned_pct': owned_beds / total_beds,
+        'ebitdar': ebitdar,
+        'rent_per_leased_bed': rent_per_leased_bed,
+        'rent_per_bed': rent_per_bed,
+        'imputed_rent_owned': imputed_rent_owned,
+        'total_rent': total_rent,
+        # STEP 4: Normalized OpCo EBITDA (post-rent)
+        'opco_ebitda_normalized': ebitdar - total_rent,
+        # STEP 5: PropCo NOI (= total rent under NNN assumption)
+        'propco_noi': total_rent,
+    }
+
+def normalize_ebitda_for_sotp(data, actual_rents=None, owned_beds=None, leased_beds=None,
+                              rent_per_bed=None):
     """
     Normalize segment EBITDAs for OpCo/PropCo split
 
@@ -46,6 +99,10 @@ def normalize_ebitda_for_sotp(data):
     5. Normalized OpCo EBITDA = EBITDAR - Total Rent (actual + imputed)
     6. PropCo NOI = Total Rent (actual + imputed)
 
+    actual_rents, owned_beds, leased_beds and rent_per_bed optionally
+    override the 10-K inputs per segment ({'acute': ..., 'behavioral': ...});
+    values may be arrays for rent sweeps.
+
     SOURCE DOCUMENTATION:
     - Segment EBITDA: 10-K Note 15 (Segment Reporting)
     - Actual Rent: 10-K Consolidated Income Statement
@@ -53,173 +110,76 @@ def normalize_ebitda_for_sotp(data):
     - PPE Values: 10-K Consolidated Balance Sheet
     """
 
-    # EXTRACT BASELINE DATA FROM 10-K
-    behavioral = data['segment_financials']['behavioral_health']['2024']
-    acute = data['segment_financials']['acute_care']['2024']
-    real_estate = data['real_estate']
-
-    # -------------------------------------------------------------------
-    # ACUTE CARE NORMALIZATION
-    # -------------------------------------------------------------------
-
-    # Source: 10-K Note 15 (Segment Reporting)
-    acute_revenue = acute['revenue'] / 1_000_000  # $8,922M
-    acute_reported_ebitda = acute['adjusted_ebitda'] / 1_000_000  # $1,208M
-    acute_ebitda_margin = acute['ebitda_margin']  # 13.5%
-
-    # Source: 10-K Income Statement (Acute Care segment detail)
-    # Note: Found in segment income statement detail
-    acute_actual_rent = 99.1  # $99.1M (lease and rental expense)
+    actual_rents = {**default_segment_rents(), **(actual_rents or {})}
+    owned_beds = owned_beds or {}
+    leased_beds = leased_beds or {}
+    rent_per_bed = rent_per_bed or {}
 
-    # Source: 10-K Note 9 (Owned vs Leased)
-    acute_owned_beds = real_estate['owned_vs_leased']['acute_care']['owned_beds']  # 5,190
-    acute_leased_beds = real_estate['owned_vs_leased']['acute_care']['leased_beds']  # 1,246
-    acute_total_beds = acute_owned_beds + acute_leased_beds  # 6,436
-    acute_owned_pct = acute_owned_beds / acute_total_beds  # 80.6%
-    acute_leased_pct = acute_leased_beds / acute_total_beds  # 19.4%
-
-    # STEP 1: Calculate EBITDAR (add back actual rent)
-    acute_ebitdar = acute_reported_ebitda + acute_actual_rent  # $1,307M
-
-    # STEP 2: Impute market rent on owned facilities
-    # Method: Use actual rent on leased facilities to calculate $/bed, then apply to owned
-    acute_rent_per_leased_bed = acute_actual_rent / acute_leased_beds  # $/bed/year
-    acute_imputed_rent_owned = acute_rent_per_leased_bed * acute_owned_beds
-
-    # STEP 3: Total rent (actual + imputed)
-    acute_total_rent = acute_actual_rent + acute_imputed_rent_owned
-
-    # STEP 4: Normalized OpCo EBITDA (post-rent)
-    acute_opco_ebitda_normalized = acute_ebitdar - acute_total_rent
-
-    # STEP 5: PropCo NOI (= total rent under NNN assumption)
-    acute_propco_noi = acute_total_rent
-
-    # -------------------------------------------------------------------
-    # BEHAVIORAL HEALTH NORMALIZATION
-    # -------------------------------------------------------------------
-
-    # Source: 10-K Note 15 (Segment Reporting)
-    behavioral_revenue = behavioral['revenue'] / 1_000_000  # $6,895M
-    behavioral_reported_ebitda = behavioral['adjusted_ebitda'] / 1_000_000  # $1,567M
-    behavioral_ebitda_margin = behavioral['ebitda_margin']  # 22.7%
-
-    # Source: 10-K Income Statement (Behavioral segment detail)
-    behavioral_actual_rent = 47.0  # $47.0M (lease and rental expense)
-
-    # Source: 10-K Note 9 (Owned vs Leased)
-    behavioral_owned_beds = real_estate['owned_vs_leased']['behavioral_health']['owned_beds']  # 22,465
-    behavioral_leased_beds = real_estate['owned_vs_leased']['behavioral_health']['leased_beds']  # 1,656
-    behavioral_total_beds = behavioral_owned_beds + behavioral_leased_beds  # 24,121
-    behavioral_owned_pct = behavioral_owned_beds / behavioral_total_beds  # 93.1%
-    behavioral_leased_pct = behavioral_leased_beds / behavioral_total_beds  # 6.9%
-
-    # STEP 1: Calculate EBITDAR (add back actual rent)
-    behavioral_ebitdar = behavioral_reported_ebitda + behavioral_actual_rent  # $1,614M
-
-    # STEP 2: Impute market rent on owned facilities
-    behavioral_rent_per_leased_bed = behavioral_actual_rent / behavioral_leased_beds  # $/bed/year
-    behavioral_imputed_rent_owned = behavioral_rent_per_leased_bed * behavioral_owned_beds
-
-    # STEP 3: Total rent (actual + imputed)
-    behavioral_total_rent = behavioral_actual_rent + behavioral_imputed_rent_owned
-
-    # STEP 4: Normalized OpCo EBITDA (post-rent)
-    behavioral_opco_ebitda_normalized = behavioral_ebitdar - behavioral_total_rent
-
-    # STEP 5: PropCo NOI (= total rent under NNN assumption)
-    behavioral_propco_noi = behavioral_total_rent
-
-    # -------------------------------------------------------------------
-    # CALCULATE IMPLIED REAL ESTATE VALUES (VALIDATION)
-    # -------------------------------------------------------------------
+    segment_keys = {'acute': 'acute_care', 'behavioral': 'behavioral_health'}
+    rent_sources = {
+        'acute': '10-K Income Statement (Acute segment detail)',
+        'behavioral': '10-K Income Statement (Behavioral segment detail)',
+    }
 
-    # Using base case 6.5% cap rate
+    # Using base case 6.5% cap rate for the implied real estate value check
     cap_rate_base = 0.065
 
-    acute_implied_re_value = acute_propco_noi / cap_rate_base
-    behavioral_implied_re_value = behavioral_propco_noi / cap_rate_base
-    total_implied_re_value = acute_implied_re_value + behavioral_implied_re_value
+    results = {}
+    for segment, key in segment_keys.items():
+        # Source: 10-K Note 15 (Segment Reporting)
+        financials = data['segment_financials'][key]['2024']
+        # Source: 10-K Note 9 (Owned vs Leased)
+        beds = data['real_estate']['owned_vs_leased'][key]
 
-    # Compare to actual PPE (net) from balance sheet
-    total_ppe_net = real_estate['property_plant_equipment']['total_ppe_net'] / 1_000_000  # $6,572M
+        reported_ebitda = financials['adjusted_ebitda'] / 1_000_000
 
-    # -------------------------------------------------------------------
-    # PACKAGE RESULTS
-    # -------------------------------------------------------------------
+        normalized = normalize_segment_rent(
+            reported_ebitda,
+            actual_rents[segment],
+            owned_beds.get(segment, beds['owned_beds']),
+            leased_beds.get(segment, beds['leased_beds']),
+            rent_per_bed.get(segment),
+        )
 
-    results = {
-        'acute': {
+        results[segment] = {
             # Source data
-            'revenue': acute_revenue,
-            'reported_ebitda': acute_reported_ebitda,
-            'ebitda_margin': acute_ebitda_margin,
-            'actual_rent': acute_actual_rent,
-            'total_beds': acute_total_beds,
-            'owned_beds': acute_owned_beds,
-            'leased_beds': acute_leased_beds,
-            'owned_pct': acute_owned_pct,
-
-            # Normalization flow
-            'ebitdar': acute_ebitdar,
-            'rent_per_leased_bed': acute_rent_per_leased_bed,
-            'imputed_rent_owned': acute_imputed_rent_owned,
-            'total_rent': acute_total_rent,
-            'opco_ebitda_normalized': acute_opco_ebitda_normalized,
-            'propco_noi': acute_propco_noi,
+            'revenue': financials['revenue'] / 1_000_000,
+            'reported_ebitda': reported_ebitda,
+            'ebitda_margin': financials['ebitda_margin'],
+            **normalized,
 
             # Implied values
-            'implied_re_value_6_5_cap': acute_implied_re_value,
+            'implied_re_value_6_5_cap': normalized['propco_noi'] / cap_rate_base,
 
             # 10-K references
             'sources': {
                 'ebitda': '10-K Note 15 (Segment Reporting)',
-                'rent': '10-K Income Statement (Acute segment detail)',
+                'rent': rent_sources[segment],
                 'owned_leased': '10-K Note 9 (Related Party Transactions)',
             }
-        },
-        'behavioral': {
-            # Source data
-            'revenue': behavioral_revenue,
-            'reported_ebitda': behavioral_reported_ebitda,
-            'ebitda_margin': behavioral_ebitda_margin,
-            'actual_rent': behavioral_actual_rent,
-            'total_beds': behavioral_total_beds,
-            'owned_beds': behavioral_owned_beds,
-            'leased_beds': behavioral_leased_beds,
-            'owned_pct': behavioral_owned_pct,
-
-            # Normalization flow
-            'ebitdar': behavioral_ebitdar,
-            'rent_per_leased_bed': behavioral_rent_per_leased_bed,
-            'imputed_rent_owned': behavioral_imputed_rent_owned,
-            'total_rent': behavioral_total_rent,
-            'opco_ebitda_normalized': behavioral_opco_ebitda_normalized,
-            'propco_noi': behavioral_propco_noi,
+        }
 
-            # Implied values
-            'implied_re_value_6_5_cap': behavioral_implied_re_value,
+    acute, behavioral = results['acute'], results['behavioral']
 
-            # 10-K references
-            'sources': {
-                'ebitda': '10-K Note 15 (Segment Reporting)',
-                'rent': '10-K Income Statement (Behavioral segment detail)',
-                'owned_leased': '10-K Note 9 (Related Party Transactions)',
-            }
-        },
-        'consolidated': {
-            'total_revenue': acute_revenue + behavioral_revenue,
-            'total_reported_ebitda': acute_reported_ebitda + behavioral_reported_ebitda,
-            'total_actual_rent': acute_actual_rent + behavioral_actual_rent,
-            'total_ebitdar': acute_ebitdar + behavioral_ebitdar,
-            'total_imputed_rent': acute_imputed_rent_owned + behavioral_imputed_rent_owned,
-            'total_rent_normalized': acute_total_rent + behavioral_total_rent,
-            'total_opco_ebitda_normalized': acute_opco_ebitda_normalized + behavioral_opco_ebitda_normalized,
-            'total_propco_noi': acute_propco_noi + behavioral_propco_noi,
-            'total_implied_re_value_6_5_cap': total_implied_re_value,
-            'actual_ppe_net': total_ppe_net,
-            're_value_reconciliation': (total_implied_re_value / total_ppe_net) - 1  # % difference
-        }
+    # Compare to actual PPE (net) from balance sheet
+    total_ppe_net = data['real_estate']['property_plant_equipment']['total_ppe_net'] / 1_000_000  # $6,572M
+    total_implied_re_value = acute['implied_re_value_6_5_cap'] + behavioral['implied_re_value_6_5_cap']
+
+    def total(field):
+        return acute[field] + behavioral[field]
+
+    results['consolidated'] = {
+        'total_revenue': total('revenue'),
+        'total_reported_ebitda': total('reported_ebitda'),
+        'total_actual_rent': total('actual_rent'),
+        'total_ebitdar': total('ebitdar'),
+        'total_imputed_rent': total('imputed_rent_owned'),
+        'total_rent_normalized': total('total_rent'),
+        'total_opco_ebitda_normalized': total('opco_ebitda_normalized'),
+        'total_propco_noi': total('propco_noi'),
+        'total_implied_re_value_6_5_cap': total_implied_re_value,
+        'actual_ppe_net': total_ppe_net,
+        're_value_reconciliation': (total_implied_re_value / total_ppe_net) - 1  # % difference
     }
 
     return results
@@ -264,42 +224,35 @@ def calculate_sotp_valuation(normalized_data, scenario='base'):
 
     params = multiples[scenario]
 
-    # PART 1: BEHAVIORAL OPCO
-    behavioral_opco_ebitda = normalized_data['behavioral']['opco_ebitda_normalized']
-    behavioral_opco_value = behavioral_opco_ebitda * params['behavioral_opco_multiple']
+    # Net debt (10-K balance sheet & debt schedule) and shares (10-K capital structure)
+    capital = default_sotp_capital_structure()
+    net_debt = capital['net_debt']
+    shares_outstanding = capital['shares_outstanding']
 
-    # PART 2: BEHAVIORAL PROPCO
+    behavioral_opco_ebitda = normalized_data['behavioral']['opco_ebitda_normalized']
     behavioral_propco_noi = normalized_data['behavioral']['propco_noi']
-    behavioral_propco_value = behavioral_propco_noi / params['cap_rate']
-
-    # PART 3: ACUTE OPCO
     acute_opco_ebitda = normalized_data['acute']['opco_ebitda_normalized']
-    acute_opco_value = acute_opco_ebitda * params['acute_opco_multiple']
-
-    # PART 4: ACUTE PROPCO
     acute_propco_noi = normalized_data['acute']['propco_noi']
-    acute_propco_value = acute_propco_noi / params['cap_rate']
-
-    # TOTAL ENTERPRISE VALUE
-    total_enterprise_value = (
-        behavioral_opco_value +
-        behavioral_propco_value +
-        acute_opco_value +
-        acute_propco_value
+
+    sotp = four_part_sotp(
+        behavioral_opco_ebitda, params['behavioral_opco_multiple'], behavioral_propco_noi,
+        acute_opco_ebitda, params['acute_opco_multiple'], acute_propco_noi,
+        params['cap_rate'], net_debt, shares_outstanding,
     )
 
-    # EQUITY VALUE
-    # Source: 10-K Balance Sheet & Debt Schedule
-    net_debt = 4378.5  # $4,378.5M (from 10-K)
-    equity_value = total_enterprise_value - net_debt
+    # PARTS 1-4: Behavioral / Acute OpCo and PropCo
+    behavioral_opco_value = sotp['opco_values']['behavioral']
+    behavioral_propco_value = sotp['propco_values']['behavioral']
+    acute_opco_value = sotp['opco_values']['acute']
+    acute_propco_value = sotp['propco_values']['acute']
 
-    # PER SHARE VALUE
-    # Source: 10-K Capital Structure
-    shares_outstanding = 64.98  # Million shares
-    value_per_share = equity_value / shares_outstanding
+    # TOTAL ENTERPRISE VALUE -> EQUITY VALUE -> PER SHARE VALUE
+    total_enterprise_value = sotp['enterprise_value']
+    equity_value = sotp['equity_value']
+    value_per_share = sotp['value_per_share']
 
     # CURRENT MARKET (as of valuation date)
-    current_price = 208.39
+    current_price = capital['current_price']
     current_market_cap = current_price * shares_outstanding
     current_ev = current_market_cap + net_debt
 
@@ -316,14 +269,14 @@ def calculate_sotp_valuation(normalized_data, scenario='base'):
         'behavioral_opco_value': behavioral_opco_value,
         'acute_opco_ebitda': acute_opco_ebitda,
         'acute_opco_value': acute_opco_value,
-        'total_opco_value': behavioral_opco_value + acute_opco_value,
+        'total_opco_value': sotp['total_opco_value'],
 
         # PropCo values
         'behavioral_propco_noi': behavioral_propco_noi,
         'behavioral_propco_value': behavioral_propco_value,
         'acute_propco_noi': acute_propco_noi,
         'acute_propco_value': acute_propco_value,
-        'total_propco_value': behavioral_propco_value + acute_propco_value,
+        'total_propco_value': sotp['total_propco_value'],
 
         # Enterprise & equity
         'total_enterprise_value': total_enterprise_value,
@@ -340,8 +293,8 @@ def calculate_sotp_valuation(normalized_data, scenario='base'):
         'ev_upside_pct': ev_upside_pct,
 
         # Mix analysis
-        'opco_pct_of_ev': (behavioral_opco_value + acute_opco_value) / total_enterprise_value * 100,
-        'propco_pct_of_ev': (behavioral_propco_value + acute_propco_value) / total_enterprise_value * 100,
+        'opco_pct_of_ev': sotp['total_opco_value'] / total_enterprise_value * 100,
+        'propco_pct_of_ev': sotp['total_propco_value'] / total_enterprise_value * 100,
     }
 
     return results
@@ -350,7 +303,117 @@ def calculate_sotp_valuation(normalized_data, scenario='base'):
 # STEP 4: PROPCO DIVIDEND YIELD ANALYSIS (CAP RATE VS DIVIDEND YIELD)
 # ============================================================================
 
-def analyze_propco_dividend_feasibility(normalized_data, target_dividend_yield=0.08):
+def mortgage_constant(interest_rate, amortization_years=25, payments_per_year=12):
+    """
+    Annual debt constant (debt service / loan amount) of a level-payment mortgage
+
+    constant = m * (r/m) / (1 - (1 + r/m)^(-n*m)) for annual rate r, n years
+    and m payments per year; 1/n at a zero rate and r when
+    amortization_years is np.inf (interest only). All arguments broadcast.
+    """
+
+    interest_rate = np.asarray(interest_rate, dtype=float)
+    amortization_years = np.asarray(amortization_years, dtype=float)
+
+    periodic_rate = interest_rate / payments_per_year
+    n_payments = amortization_years * payments_per_year
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        amortizing = payments_per_year * periodic_rate / -np.expm1(-n_payments * np.log1p(periodic_rate))
+
+    return np.where(periodic_rate == 0, 1.0 / amortization_years, amortizing)
+
+def propco_feasibility_grid(propco_noi, ltv, interest_rate, cap_rate=0.065, amortization_years=25,
+                            payments_per_year=12, target_dividend_yield=0.08, min_dscr=1.20):
+    """
+    PropCo leverage metrics over a full LTV x rate x cap rate x amortization grid
+
+    Each axis is placed on its own dimension and every metric is computed
+    by broadcasting, so dense (e.g. 10^6-point) grids cost a few array
+    operations. Returns a LabeledCube with the debt constant, equity
+    yield, DSCR, capital stack and a 'feasible' mask (DSCR and yield
+    constraints both met).
+    """
+
+    dims, coords, grid = orthogonal_grid({
+        'ltv': ltv,
+        'interest_rate': interest_rate,
+        'cap_rate': cap_rate,
+        'amortization_years': amortization_years,
+    })
+
+    ltv, cap_rate = grid['ltv'], grid['cap_rate']
+    debt_constant = mortgage_constant(grid['interest_rate'], grid['amortization_years'], payments_per_year)
+
+    propco_value = propco_noi / cap_rate
+    debt = propco_value * ltv
+    debt_service = debt * debt_constant
+    cash_to_equity = propco_noi - debt_service
+
+    with np.errstate(divide='ignore'):
+        dscr = np.where(debt_service > 0, propco_noi / debt_service, np.inf)
+    equity_yield = (cap_rate - debt_constant * ltv) / (1 - ltv)
+
+    return LabeledCube(dims, coords, {
+        'debt_constant': debt_constant,
+        'equity_yield': equity_yield,
+        'propco_value': propco_value,
+        'debt': debt,
+        'equity': propco_value * (1 - ltv),
+        'debt_service': debt_service,
+        'cash_to_equity': cash_to_equity,
+        'dscr': dscr,
+        'meets_target_yield': equity_yield >= target_dividend_yield,
+        'feasible': (equity_yield >= target_dividend_yield) & (dscr >= min_dscr),
+    })
+
+def propco_feasible_frontier(interest_rate, cap_rate=0.065, amortization_years=25, payments_per_year=12,
+                             target_dividend_yield=0.08, min_dscr=1.20, min_ltv=0.0, max_ltv=0.95):
+    """
+    Closed-form feasible LTV band for every rate x cap rate x amortization
+
+    With debt constant k, cap rate c and target yield y:
+    - DSCR:  c / (k * LTV) >= min_dscr  =>  LTV <= c / (k * min_dscr)
+    - Yield: (c - k * LTV) / (1 - LTV) >= y  =>  LTV >= (y - c) / (y - k)
+      when k < y (positive leverage), LTV <= (c - y) / (k - y) when k > y
+
+    The band is clipped to [min_ltv, max_ltv]. Returns a LabeledCube with
+    min_ltv, max_ltv, feasible and the equity yield / DSCR at max_ltv (the
+    highest-leverage feasible structure).
+    """
+
+    dims, coords, grid = orthogonal_grid({
+        'interest_rate': interest_rate, 'cap_rate': cap_rate, 'amortization_years': amortization_years,
+    })
+
+    c, y = grid['cap_rate'], target_dividend_yield
+    k = mortgage_constant(grid['interest_rate'], grid['amortization_years'], payments_per_year)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        yield_floor = np.where(k < y, (y - c) / (y - k), np.where(c >= y, 0.0, np.inf))
+        yield_cap = np.where(k > y, (c - y) / (k - y), np.inf)
+        dscr_cap = c / (k * min_dscr)
+
+    min_ltv = np.maximum(yield_floor, min_ltv)
+    max_ltv = np.minimum(np.minimum(yield_cap, dscr_cap), max_ltv)
+    feasible = min_ltv <= max_ltv
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        frontier_ltv = np.where(feasible, max_ltv, np.nan)
+        equity_yield = (c - k * frontier_ltv) / (1 - frontier_ltv)
+        dscr = c / (k * frontier_ltv)
+
+    return LabeledCube(dims, coords, {
+        'debt_constant': k,
+        'min_ltv': np.where(feasible, min_ltv, np.nan),
+        'max_ltv': frontier_ltv,
+        'feasible': feasible,
+        'equity_yield_at_max_ltv': equity_yield,
+        'dscr_at_max_ltv': dscr,
+    })
+
+def analyze_propco_dividend_feasibility(normalized_data, target_dividend_yield=0.08,
+                                        amortization_years=25, min_dscr=1.20):
     """
     Validate whether 8% dividend yield is feasible given PropCo NOI and leverage
 
@@ -359,7 +422,8 @@ def analyze_propco_dividend_feasibility(normalized_data, target_dividend_yield=0
 
     Where:
     - Cap Rate = NOI / Property Value
-    - Debt Constant = Annual Debt Service / Loan Amount (includes interest + amortization)
+    - Debt Constant = Annual Debt Service / Loan Amount (includes interest + amortization),
+      exact level-payment constant from mortgage_constant()
     - LTV = Loan-to-Value ratio
     - Equity Yield = Cash to Equity / Equity Investment (pre-tax dividend yield)
     """
@@ -368,59 +432,32 @@ def analyze_propco_dividend_feasibility(normalized_data, target_dividend_yield=0
     total_propco_noi = normalized_data['consolidated']['total_propco_noi']
     cap_rate = 0.065  # Base case
 
-    # Calculate PropCo value
-    propco_value = total_propco_noi / cap_rate
-
-    # Test various leverage scenarios
-    scenarios = []
-
-    for ltv in np.arange(0.50, 0.76, 0.05):
-        for interest_rate in [0.055, 0.060, 0.065, 0.070]:
-            # Assume 25-year amortization for debt constant calculation
-            # Debt constant ≈ interest rate + 1% (simplified for 25-year amortization)
-            debt_constant = interest_rate + 0.01
-
-            # Calculate equity yield
-            equity_yield = (cap_rate - (debt_constant * ltv)) / (1 - ltv)
+    # Test various leverage scenarios (monthly-pay, 25-year amortization by default)
+    interest_rates = [0.055, 0.060, 0.065, 0.070]
+    ltvs = np.arange(0.50, 0.76, 0.05)
+    grid = propco_feasibility_grid(
+        total_propco_noi, ltvs, interest_rates, cap_rate, amortization_years,
+        target_dividend_yield=target_dividend_yield, min_dscr=min_dscr,
+    ).sel(cap_rate=cap_rate, amortization_years=amortization_years)
 
-            # Debt and equity sizing
-            debt = propco_value * ltv
-            equity = propco_value * (1 - ltv)
-            debt_service = debt * debt_constant
-            cash_to_equity = total_propco_noi - debt_service
+    df = grid.to_frame().reset_index()
+    df = df.rename(columns={'meets_target_yield': 'meets_8pct_target'})
+    viable_scenarios = df[df.pop('feasible')]
 
-            # DSCR (Debt Service Coverage Ratio)
-            dscr = total_propco_noi / debt_service if debt_service > 0 else 0
-
-            # Check if target dividend is achievable
-            meets_target = equity_yield >= target_dividend_yield
-
-            scenarios.append({
-                'ltv': ltv,
-                'interest_rate': interest_rate,
-                'debt_constant': debt_constant,
-                'equity_yield': equity_yield,
-                'propco_value': propco_value,
-                'debt': debt,
-                'equity': equity,
-                'debt_service': debt_service,
-                'cash_to_equity': cash_to_equity,
-                'dscr': dscr,
-                'meets_8pct_target': meets_target
-            })
-
-    df = pd.DataFrame(scenarios)
-
-    # Filter to viable scenarios (DSCR > 1.20 and meets target)
-    viable_scenarios = df[(df['dscr'] >= 1.20) & (df['meets_8pct_target'] == True)]
+    # Continuous LTV band over the same cap rate, amortization and LTV range as the grid
+    frontier = propco_feasible_frontier(interest_rates, cap_rate, amortization_years,
+                                        target_dividend_yield=target_dividend_yield, min_dscr=min_dscr,
+                                        min_ltv=ltvs.min(), max_ltv=ltvs.max())
 
     return {
         'all_scenarios': df,
         'viable_scenarios': viable_scenarios,
+        'frontier': frontier.sel(cap_rate=cap_rate, amortization_years=amortization_years).to_frame().reset_index(),
+        'has_feasible_ltv_band': bool(frontier['feasible'].any()),
         'total_propco_noi': total_propco_noi,
-        'propco_value_at_6_5_cap': propco_value,
+        'propco_value_at_6_5_cap': total_propco_noi / cap_rate,
         'target_dividend_yield': target_dividend_yield,
-        'is_8pct_feasible': len(viable_scenarios) > 0
+        'is_8pct_feasible': len(viable_scenarios) > 0,
     }
 
 # ============================================================================
@@ -593,6 +630,12 @@ def generate_valuation_report():
     print(f"")
     print(f"Is 8% dividend feasible?           {'YES' if dividend_analysis['is_8pct_feasible'] else 'NO'}")
 
+    print(f"\nFeasible LTV Band within 50-75% (25-year amortization, exact debt constant):")
+    frontier = dividend_analysis['frontier']
+    for _, row in frontier.iterrows():
+        band = (f"{row['min_ltv']:.0%} - {row['max_ltv']:.0%}" if row['feasible'] else "none")
+        print(f"  Rate {row['interest_rate']:.1%}: debt constant {row['debt_constant']:.2%}, LTV {band}")
+
     if dividend_analysis['is_8pct_feasible']:
         print(f"\nViable Scenarios (DSCR ≥ 1.20 and Equity Yield ≥ 8%):")
         viable = dividend_analysis['viable_scenarios']
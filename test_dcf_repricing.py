@@ -0,0 +1,77 @@
+"""
+Test script for cached-FCF DCF repricing
+Checks that batched (N, 10) FCF matrices price exactly like one scalar
+assumption set at a time
+"""
+
+import copy
+
+import numpy as np
+
+from dcf_valuation_model import (
+    load_financial_data, default_dcf_assumptions, cached_fcf, reprice_dcf, reprice_dcf_grid,
+    dcf_value_by_date
+)
+
+GROWTH_1_3 = [0.03, 0.05, 0.07]
+
+def scenario_assumptions():
+    """Base assumptions plus one scalar copy per years 1-3 growth rate"""
+
+    base = default_dcf_assumptions()
+    batched = copy.deepcopy(base)
+    batched['revenue_growth']['years_1_3'] = np.array(GROWTH_1_3)
+
+    scalars = []
+    for growth in GROWTH_1_3:
+        single = copy.deepcopy(base)
+        single['revenue_growth']['years_1_3'] = growth
+        scalars.append(single)
+
+    return base, batched, scalars
+
+def test_reprice_dcf_batch_matches_scalar():
+    """Each row of a batched repricing equals the scalar repricing of that scenario"""
+
+    financials = load_financial_data()
+    base, batched, scalars = scenario_assumptions()
+    args = (base['wacc'], base['terminal_growth_rate'], financials['net_debt'], financials['shares_outstanding'])
+
+    batch = reprice_dcf(cached_fcf(financials, batched), *args)['value_per_share']
+    single = [reprice_dcf(cached_fcf(financials, a), *args)['value_per_share'] for a in scalars]
+
+    assert batch.shape == (len(GROWTH_1_3),)
+    np.testing.assert_allclose(batch, single, rtol=1e-12)
+
+def test_reprice_dcf_grid_batch_matches_scalar():
+    """A batched WACC x growth grid is one scalar grid per scenario"""
+
+    financials = load_financial_data()
+    _, batched, scalars = scenario_assumptions()
+    wacc_range, growth_range = [0.08, 0.085, 0.09], [0.02, 0.025]
+    args = (wacc_range, growth_range, financials['net_debt'], financials['shares_outstanding'])
+
+    batch = reprice_dcf_grid(cached_fcf(financials, batched), *args)
+    single = np.stack([reprice_dcf_grid(cached_fcf(financials, a), *args) for a in scalars])
+
+    assert batch.shape == (len(GROWTH_1_3), len(wacc_range), len(growth_range))
+    np.testing.assert_allclose(batch, single, rtol=1e-12)
+
+def test_dcf_value_by_date_batch_matches_scalar():
+    """Array operating assumptions are priced row by row against the valuation dates"""
+
+    financials = load_financial_data()
+    _, batched, scalars = scenario_assumptions()
+    dates = ['2025-03-31', '2025-10-30', '2026-06-30']
+
+    batch = dcf_value_by_date(financials, batched, dates)['value_per_share'].values
+    single = [dcf_value_by_date(financials, a, [date])['value_per_share'].iloc[0]
+              for a, date in zip(scalars, dates)]
+
+    np.testing.assert_allclose(batch, single, rtol=1e-12)
+
+if __name__ == "__main__":
+    test_reprice_dcf_batch_matches_scalar()
+    test_reprice_dcf_grid_batch_matches_scalar()
+    test_dcf_value_by_date_batch_matches_scalar()
+    print("✅ Batched DCF repricing matches per-scenario values")
@@ -0,0 +1,51 @@
+"""
+Test script for the templated football field renderer
+Checks that a chart's bytes depend only on its data, not on which
+scenarios the shared figure template rendered before
+"""
+
+import os
+import subprocess
+import sys
+
+import pandas as pd
+
+from football_field_chart import render_football_field
+
+BASE_RANGES = {
+    'SOTP (4-Part)': (417, 471, 506),
+    'DCF (10-Year)': (388, 463, 555),
+    'Comparable Companies': (193, 236, 280),
+    'Precedent Transactions': (280, 367, 455),
+}
+WEIGHTED_AVERAGE = {'method': 'WEIGHTED AVERAGE', 'low': 393, 'base': 424, 'high': 455}
+
+def valuations(**ranges):
+    """Football field rows with the given {method: (low, base, high)} overrides"""
+
+    rows = {**BASE_RANGES, **ranges}
+    return pd.DataFrame([
+        {'method': method, 'low': low, 'base': base, 'high': high}
+        for method, (low, base, high) in rows.items()
+    ])
+
+def render_base(fmt='png'):
+    return render_football_field(valuations(), WEIGHTED_AVERAGE, fmt=fmt, dpi=50)
+
+def test_render_independent_of_history():
+    """render(A) after render(B) equals render(A) in a fresh process"""
+
+    render_football_field(valuations(**{'SOTP (4-Part)': (200, 450, 700)}), WEIGHTED_AVERAGE, dpi=50)
+    after_wide = render_base()
+
+    fresh = subprocess.run(
+        [sys.executable, '-c',
+         'import sys, test_football_field_render as t; sys.stdout.buffer.write(t.render_base())'],
+        capture_output=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__)),
+    ).stdout
+
+    assert after_wide == fresh
+
+if __name__ == "__main__":
+    test_render_independent_of_history()
+    print("✅ Football field renders are independent of render history")
@@ -0,0 +1,37 @@
+"""
+Test script for batched LBO returns
+Checks that lbo_returns_batch sizes its cash flows from the projection
+horizon and matches the scalar LBO for holds other than 5 years
+"""
+
+import numpy as np
+
+from lbo_valuation_model import (
+    build_lbo_transaction, sources_and_uses, build_lbo_projections, calculate_lbo_returns,
+    lbo_projections_batch, lbo_returns_batch
+)
+
+ENTRY_PRICES = [300.0, 355.0, 400.0]
+EXIT_MULTIPLE = 9.0
+
+def test_lbo_returns_batch_matches_scalar_hold_periods():
+    """Batched IRR / MOIC equal the scalar LBO for 3, 5 and 7 year horizons"""
+
+    for n_years in (3, 5, 7):
+        proj = lbo_projections_batch(ENTRY_PRICES, n_years=n_years)
+        batch = lbo_returns_batch(ENTRY_PRICES, EXIT_MULTIPLE, projections=proj)
+
+        single = []
+        for price in ENTRY_PRICES:
+            transaction = build_lbo_transaction(price, None)
+            sources_uses_result = sources_and_uses(transaction)
+            projections = build_lbo_projections(transaction, sources_uses_result, n_years=n_years)
+            single.append(calculate_lbo_returns(projections, sources_uses_result, EXIT_MULTIPLE,
+                                                exit_year=n_years))
+
+        np.testing.assert_allclose(batch['irr'], [r['irr'] for r in single], rtol=1e-9)
+        np.testing.assert_allclose(batch['moic'], [r['moic'] for r in single], rtol=1e-9)
+
+if __name__ == "__main__":
+    test_lbo_returns_batch_matches_scalar_hold_periods()
+    print("✅ Batched LBO returns match the scalar model for every hold period")
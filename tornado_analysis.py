@@ -0,0 +1,183 @@
+"""
+UHS TORNADO ANALYSIS
+One-at-a-Time Low/High Swings for the SOTP and DCF Models
+
+Purpose: Rank value drivers by how far value per share moves when each
+input is pushed to its low and high bound with everything else at base.
+All 2 x K perturbed cases (plus the base case) are stacked into one
+design and evaluated in a single batched model call, so the cost does
+not grow with the number of Python calls as K increases.
+
+Author: Investment Analysis Team
+Date: October 30, 2025
+"""
+
+import pandas as pd
+import numpy as np
+
+from dcf_valuation_model import load_financial_data, default_dcf_assumptions, dcf_valuation_batch
+from sotp_kernel import default_sotp_capital_structure
+from sotp_global_sensitivity import default_global_sensitivity_ranges, sotp_v3_value_per_share
+from sotp_valuation_model_v3_corrected import load_10k_data, normalize_ebitda_for_sotp
+
+# ============================================================================
+# STEP 1: GENERIC BATCHED TORNADO
+# ============================================================================
+
+def tornado_analysis(evaluate, base, bounds):
+    """
+    Low/high swing of a batched model for every driver in bounds
+
+    Args:
+        evaluate: callable taking {driver: (2K + 1,) array} and returning
+            (2K + 1,) values
+        base: {driver: base value} for every model input
+        bounds: {driver: (low, high)} for the drivers to perturb
+
+    Row 2i / 2i + 1 of the design holds driver i at its low / high bound;
+    the last row is the base case.
+
+    Returns:
+        Dictionary with the swing table (sorted, largest swing first) and
+        the base value
+    """
+
+    drivers = list(bounds)
+    n_cases = 2 * len(drivers) + 1
+
+    design = {name: np.full(n_cases, value, dtype=float) for name, value in base.items()}
+    for i, name in enumerate(drivers):
+        design[name][2 * i], design[name][2 * i + 1] = bounds[name]
+
+    values = np.asarray(evaluate(design), dtype=float)
+    base_value = values[-1]
+    low_values = values[0:-1:2]
+    high_values = values[1::2]
+
+    table = pd.DataFrame({
+        'driver': drivers,
+        'base_input': [base[name] for name in drivers],
+        'low_input': [bounds[name][0] for name in drivers],
+        'high_input': [bounds[name][1] for name in drivers],
+        'low_value': low_values,
+        'high_value': high_values,
+        'downside': np.minimum(low_values, high_values) - base_value,
+        'upside': np.maximum(low_values, high_values) - base_value,
+        'swing': np.abs(high_values - low_values),
+    })
+
+    return {
+        'table': table.sort_values('swing', ascending=False).reset_index(drop=True),
+        'base_value': base_value,
+        'n_evaluations': n_cases,
+    }
+
+def percentage_bounds(base, pct, drivers=None):
+    """Symmetric +/- pct bounds around each base input"""
+
+    drivers = drivers or list(base)
+    return {name: (base[name] * (1 - pct), base[name] * (1 + pct)) for name in drivers}
+
+# ============================================================================
+# STEP 2: SOTP (v3) TORNADO
+# ============================================================================
+
+def default_sotp_tornado_base():
+    """v3 base case: 9.5x / 7.0x OpCo multiples, 6.5% cap rates, 10-K rent per bed"""
+
+    capital = default_sotp_capital_structure()
+
+    return {
+        'behavioral_multiple': 9.5,
+        'acute_multiple': 7.0,
+        'behavioral_cap_rate': 0.065,
+        'acute_cap_rate': 0.065,
+        'rent_per_bed_factor': 1.0,
+        'net_debt': capital['net_debt'],
+        'shares': capital['shares_outstanding'],
+    }
+
+def sotp_tornado(normalized_data=None, bounds=None, base=None):
+    """Tornado of v3 SOTP value per share (bounds default to the global sensitivity ranges)"""
+
+    normalized_data = normalized_data or normalize_ebitda_for_sotp(load_10k_data())
+    base = base or default_sotp_tornado_base()
+    bounds = bounds or default_global_sensitivity_ranges()
+
+    return tornado_analysis(lambda design: sotp_v3_value_per_share(normalized_data, design), base, bounds)
+
+# ============================================================================
+# STEP 3: DCF TORNADO
+# ============================================================================
+
+# Flat driver name -> nested DCF assumption path
+DCF_TORNADO_ASSUMPTIONS = {
+    'growth_1_3': ('revenue_growth', 'years_1_3'),
+    'growth_4_5': ('revenue_growth', 'years_4_5'),
+    'growth_6_10': ('revenue_growth', 'years_6_10'),
+    'ebitda_margin_target': ('ebitda_margin_target',),
+    'tax_rate': ('tax_rate',),
+    'capex_pct': ('capex_pct',),
+    'depreciation_pct': ('depreciation_pct',),
+    'nwc_change_pct': ('nwc_change_pct',),
+    'terminal_growth_rate': ('terminal_growth_rate',),
+    'wacc': ('wacc',),
+}
+DCF_TORNADO_FINANCIALS = ['revenue', 'ebitda', 'net_debt', 'shares_outstanding']
+
+def default_dcf_tornado_bounds(financials=None):
+    """Low / high bounds for the DCF drivers (rates in decimals, $M for financials)"""
+
+    financials = financials or load_financial_data()
+
+    return {
+        'growth_1_3': (0.04, 0.06),
+        'growth_4_5': (0.03, 0.05),
+        'growth_6_10': (0.02, 0.04),
+        'ebitda_margin_target': (0.175, 0.20),
+        'tax_rate': (0.19, 0.25),
+        'capex_pct': (0.035, 0.05),
+        'depreciation_pct': (0.033, 0.041),
+        'nwc_change_pct': (0.005, 0.02),
+        'terminal_growth_rate': (0.015, 0.030),
+        'wacc': (0.075, 0.095),
+        'revenue': (financials['revenue'] * 0.95, financials['revenue'] * 1.05),
+        'ebitda': (financials['ebitda'] * 0.95, financials['ebitda'] * 1.05),
+        'net_debt': (financials['net_debt'] * 0.9, financials['net_debt'] * 1.1),
+        'shares_outstanding': (financials['shares_outstanding'] * 0.97,
+                               financials['shares_outstanding'] * 1.03),
+    }
+
+def dcf_tornado_base(financials=None, assumptions=None):
+    """Flat base inputs for the DCF tornado"""
+
+    financials = financials or load_financial_data()
+    assumptions = assumptions or default_dcf_assumptions()
+
+    base = {}
+    for name, path in DCF_TORNADO_ASSUMPTIONS.items():
+        value = assumptions
+        for key in path:
+            value = value[key]
+        base[name] = value
+    base.update({name: financials[name] for name in DCF_TORNADO_FINANCIALS})
+    return base
+
+def dcf_tornado(financials=None, assumptions=None, bounds=None):
+    """Tornado of DCF value per share across growth, margin, reinvestment, rate and balance sheet inputs"""
+
+    financials = financials or load_financial_data()
+    base = dcf_tornado_base(financials, assumptions)
+    bounds = bounds or default_dcf_tornado_bounds(financials)
+
+    def evaluate(design):
+        batch_assumptions = {'revenue_growth': {}}
+        for name, path in DCF_TORNADO_ASSUMPTIONS.items():
+            target = batch_assumptions
+            for key in path[:-1]:
+                target = target[key]
+            target[path[-1]] = design[name]
+        batch_financials = {**financials, **{name: design[name] for name in DCF_TORNADO_FINANCIALS}}
+        return dcf_valuation_batch(batch_financials, batch_assumptions)['value_per_share']
+
+    return tornado_analysis(evaluate, base, bounds)
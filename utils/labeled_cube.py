@@ -0,0 +1,105 @@
+"""
+Labeled N-Dimensional Result Cubes
+
+Lightweight xarray-style container for scenario grids: named dimensions,
+coordinate labels and one or more data variables sharing the same shape.
+Any slice, 2-D pivot or long-format table can be taken without
+recomputing the model.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def orthogonal_grid(axes):
+    """
+    Dims, coords and broadcastable on-axis arrays for ordered {dim: values}
+
+    Each axis is reshaped to its own dimension (length n there, 1 elsewhere)
+    so a model evaluated on the grid arrays broadcasts to the full tensor.
+    """
+    dims = list(axes)
+    coords = {dim: np.atleast_1d(np.asarray(values, dtype=float)) for dim, values in axes.items()}
+    grid = {
+        dim: coords[dim].reshape([-1 if j == i else 1 for j in range(len(dims))])
+        for i, dim in enumerate(dims)
+    }
+    return dims, coords, grid
+
+
+class LabeledCube:
+    """Named-axis container for scenario grid results"""
+
+    def __init__(self, dims, coords, data):
+        self.dims = list(dims)
+        self.coords = {dim: np.asarray(coords[dim]) for dim in self.dims}
+        self.shape = tuple(len(self.coords[dim]) for dim in self.dims)
+        self.data = {
+            name: np.broadcast_to(np.asarray(values), self.shape)
+            for name, values in data.items()
+        }
+
+    def __getitem__(self, name):
+        return self.data[name]
+
+    def __repr__(self):
+        axes = ", ".join(f"{dim}: {n}" for dim, n in zip(self.dims, self.shape))
+        return f"LabeledCube({axes}; vars: {', '.join(self.data)})"
+
+    def _index(self, dim, label):
+        matches = np.flatnonzero(np.isclose(self.coords[dim], label)) \
+            if np.issubdtype(self.coords[dim].dtype, np.number) \
+            else np.flatnonzero(self.coords[dim] == label)
+        if matches.size == 0:
+            raise KeyError(f"{label!r} not found on dimension '{dim}'")
+        return int(matches[0])
+
+    def sel(self, **labels):
+        """Select single labels on one or more dimensions (dropping them)"""
+        index = []
+        dims = []
+        for dim in self.dims:
+            if dim in labels:
+                index.append(self._index(dim, labels[dim]))
+            else:
+                index.append(slice(None))
+                dims.append(dim)
+
+        index = tuple(index)
+        return LabeledCube(
+            dims,
+            {dim: self.coords[dim] for dim in dims},
+            {name: values[index] for name, values in self.data.items()},
+        )
+
+    def reduce(self, dim, func=np.mean):
+        """Collapse one dimension with func (e.g. np.mean, np.max)"""
+        axis = self.dims.index(dim)
+        dims = [d for d in self.dims if d != dim]
+        return LabeledCube(
+            dims,
+            {d: self.coords[d] for d in dims},
+            {name: func(values, axis=axis) for name, values in self.data.items()},
+        )
+
+    def pivot(self, var, index, columns, **labels):
+        """2-D DataFrame of var over (index, columns); other dims fixed via labels"""
+        cube = self.sel(**labels) if labels else self
+        remaining = [d for d in cube.dims if d not in (index, columns)]
+        if remaining:
+            raise ValueError(f"Fix a label for dimensions {remaining} to take a 2-D slice")
+
+        values = cube.data[var]
+        if cube.dims.index(index) > cube.dims.index(columns):
+            values = values.T
+
+        return pd.DataFrame(values, index=pd.Index(cube.coords[index], name=index),
+                            columns=pd.Index(cube.coords[columns], name=columns))
+
+    def to_frame(self):
+        """Long-format DataFrame with one row per cell and one column per variable"""
+        index = pd.MultiIndex.from_product([self.coords[d] for d in self.dims], names=self.dims)
+        return pd.DataFrame(
+            {name: values.ravel() for name, values in self.data.items()},
+            index=index,
+        )
@@ -0,0 +1,139 @@
+"""
+Streaming Statistics for Monte Carlo Valuation Runs
+
+Fixed-memory accumulators that let simulations process paths in chunks
+without keeping every simulated value in memory.
+"""
+
+import numpy as np
+
+
+class StreamingHistogram:
+    """Fixed-bin histogram sketch with streaming quantile estimates
+
+    Bin edges are set from the first chunk (its range widened by
+    ``range_padding`` on each side) unless a fixed ``value_range`` is
+    given. Later values outside that range are kept as underflow/overflow
+    counts, and exact min/max are tracked so tail quantiles can still be
+    interpolated. Sketches with identical edges can be merged, e.g. when
+    chunks are simulated in separate processes.
+    """
+
+    def __init__(self, n_bins=20_000, range_padding=0.5, value_range=None):
+        self.n_bins = n_bins
+        self.range_padding = range_padding
+        self.edges = None if value_range is None else np.linspace(*value_range, n_bins + 1)
+        self.counts = np.zeros(n_bins, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def _init_edges(self, values):
+        lo, hi = values.min(), values.max()
+        span = hi - lo if hi > lo else max(abs(lo), 1.0)
+        self.edges = np.linspace(lo - self.range_padding * span,
+                                 hi + self.range_padding * span,
+                                 self.n_bins + 1)
+
+    def update(self, values):
+        """Add a chunk of values (non-finite values are ignored)"""
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return
+
+        if self.edges is None:
+            self._init_edges(values)
+
+        lo = self.edges[0]
+        width = self.edges[1] - self.edges[0]
+        idx = np.floor((values - lo) / width).astype(np.int64)
+
+        under = idx < 0
+        over = idx >= self.n_bins
+        inside = ~(under | over)
+
+        self.counts += np.bincount(idx[inside], minlength=self.n_bins)
+        self.underflow += int(under.sum())
+        self.overflow += int(over.sum())
+
+        self.count += values.size
+        self.total += values.sum()
+        self.total_sq += np.square(values).sum()
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+
+    def merge(self, other):
+        """Fold another sketch with the same bin edges into this one"""
+        if other.count == 0:
+            return self
+        if self.edges is None:
+            self.edges = other.edges
+        elif not np.array_equal(self.edges, other.edges):
+            raise ValueError("Can only merge sketches with identical bin edges")
+
+        self.counts += other.counts
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        self.count += other.count
+        self.total += other.total
+        self.total_sq += other.total_sq
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else np.nan
+
+    @property
+    def std(self):
+        if self.count < 2:
+            return np.nan
+        variance = (self.total_sq - self.count * self.mean ** 2) / (self.count - 1)
+        return np.sqrt(max(variance, 0.0))
+
+    def _cdf(self):
+        # Treat underflow/overflow as one extra bin each, spanning to min/max
+        edges = np.concatenate([[min(self.min, self.edges[0])], self.edges,
+                                [max(self.max, self.edges[-1])]])
+        counts = np.concatenate([[self.underflow], self.counts, [self.overflow]])
+        cdf = np.concatenate([[0], np.cumsum(counts)]) / self.count
+        return edges, cdf
+
+    def quantile(self, q):
+        """Estimate quantile(s) q in [0, 1] by interpolating the binned CDF"""
+        q = np.atleast_1d(np.asarray(q, dtype=float))
+        if self.count == 0:
+            return np.full(q.shape, np.nan)
+
+        edges, cdf = self._cdf()
+
+        # First bin whose cumulative share reaches q, then interpolate inside it
+        i = np.clip(np.searchsorted(cdf, q, side='left'), 1, len(cdf) - 1)
+        step = cdf[i] - cdf[i - 1]
+        frac = np.where(step > 0, (q - cdf[i - 1]) / np.where(step > 0, step, 1.0), 0.0)
+        result = edges[i - 1] + frac * (edges[i] - edges[i - 1])
+
+        return np.clip(result, self.min, self.max)
+
+    def prob_above(self, threshold):
+        """Estimated share of values strictly above threshold"""
+        if self.count == 0:
+            return np.nan
+        edges, cdf = self._cdf()
+        return 1.0 - float(np.interp(threshold, edges, cdf))
+
+    def histogram(self, n_bins=50):
+        """Re-bin the sketch into n_bins bars between the observed min and max"""
+        lo, hi = self.quantile([0.0, 1.0])
+        edges = np.linspace(lo, hi, n_bins + 1)
+        centers = 0.5 * (self.edges[:-1] + self.edges[1:])
+        counts, _ = np.histogram(centers, bins=edges, weights=self.counts)
+        counts[0] += self.underflow
+        counts[-1] += self.overflow
+        return counts.astype(np.int64), edges